@@ -0,0 +1,207 @@
+"""Test de charge du serveur de scores (``src/server.py``).
+
+Génère une archive synthétique dans un dossier temporaire, démarre le
+serveur dans un processus séparé puis lance en parallèle :
+
+- un client d'arbitrage par tournoi non terminé, qui apparie chaque round
+  et saisit tous ses résultats jusqu'à la fin du tournoi ;
+- des clients de lecture qui demandent des classements en continu.
+
+Affiche le débit (requêtes/s) et les latences médiane et p95 par
+opération.
+
+    python benchmarks/bench_server.py --tournaments 8 --readers 16
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+sys.path.insert(0, str(BENCH_DIR))
+
+from run_benchmarks import write_dataset  # noqa: E402
+
+RESULTS = ((1, 0), (0, 1), (0.5, 0.5))
+
+
+class Client:
+    """Connexion JSON Lines au serveur, avec mesure des latences."""
+
+    def __init__(self, latencies: dict[str, list[float]]) -> None:
+        self.latencies = latencies
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def connect(self, host: str, port: int) -> None:
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def request(self, op: str, **fields: object) -> object:
+        start = time.perf_counter()
+        self.writer.write(json.dumps({"op": op, **fields}).encode() + b"\n")
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        self.latencies.setdefault(op, []).append(
+            time.perf_counter() - start
+        )
+        if not response["ok"]:
+            raise RuntimeError(f"{op} : {response['error']}")
+        return response["result"]
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def referee(
+    client: Client, tournament_id: str, rng: random.Random
+) -> None:
+    """Joue tous les rounds restants d'un tournoi."""
+    while True:
+        try:
+            pairings = await client.request(
+                "pair_round", tournament_id=tournament_id
+            )
+        except RuntimeError:
+            return  # tournoi terminé
+        for match in pairings["matches"]:
+            score1, score2 = rng.choice(RESULTS)
+            await client.request(
+                "submit_result",
+                tournament_id=tournament_id,
+                board=match["board"],
+                score1=score1,
+                score2=score2,
+            )
+
+
+async def reader(
+    client: Client, tournament_ids: list[str], stop: asyncio.Event
+) -> None:
+    """Demande des classements jusqu'à l'arrêt des arbitres."""
+    index = 0
+    while not stop.is_set():
+        await client.request(
+            "standings",
+            tournament_id=tournament_ids[index % len(tournament_ids)],
+        )
+        index += 1
+
+
+async def run_load(
+    host: str,
+    port: int,
+    tournament_ids: list[str],
+    readers: int,
+    seed: int,
+) -> tuple[float, dict[str, list[float]]]:
+    """Exécute la charge et retourne (durée, latences par opération)."""
+    latencies: dict[str, list[float]] = {}
+    rng = random.Random(seed)
+    referees = [Client(latencies) for _ in tournament_ids]
+    viewers = [Client(latencies) for _ in range(readers)]
+    for client in referees + viewers:
+        await client.connect(host, port)
+
+    # Chargement initial des tournois, hors mesure
+    for client, tournament_id in zip(referees, tournament_ids):
+        await client.request("standings", tournament_id=tournament_id)
+    latencies.clear()
+
+    stop = asyncio.Event()
+    start = time.perf_counter()
+    reading = [
+        asyncio.create_task(reader(client, tournament_ids, stop))
+        for client in viewers
+    ]
+    await asyncio.gather(
+        *(
+            referee(client, tournament_id, random.Random(rng.random()))
+            for client, tournament_id in zip(referees, tournament_ids)
+        )
+    )
+    stop.set()
+    await asyncio.gather(*reading)
+    elapsed = time.perf_counter() - start
+
+    for client in referees + viewers:
+        await client.close()
+    return elapsed, latencies
+
+
+def start_server(workdir: Path) -> tuple[subprocess.Popen, str, int]:
+    """Démarre le serveur sur un port libre et attend qu'il écoute."""
+    process = subprocess.Popen(
+        [sys.executable, str(SRC_DIR / "server.py"), "--port", "0"],
+        cwd=workdir,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = process.stdout.readline().strip()
+    # Vide la sortie restante pour ne jamais bloquer le serveur
+    threading.Thread(target=process.stdout.read, daemon=True).start()
+    address = line.rsplit(" ", 1)[-1]
+    host, port = address.rsplit(":", 1)
+    return process, host, int(port)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=2_000)
+    parser.add_argument("--tournaments", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="oc_chess_server_") as tmp:
+        workdir = Path(tmp)
+        write_dataset(workdir, args.players, args.tournaments * 2, args.seed)
+        archive = json.loads(
+            (workdir / "data" / "tournaments.json").read_text("utf-8")
+        )
+        tournament_ids = [
+            entry["id"]
+            for entry in archive
+            if entry["current_round"] <= entry["rounds_count"]
+        ][:args.tournaments]
+        if not tournament_ids:
+            print("Aucun tournoi à jouer dans l'archive générée.")
+            return 1
+
+        process, host, port = start_server(workdir)
+        try:
+            elapsed, latencies = asyncio.run(
+                run_load(host, port, tournament_ids, args.readers, args.seed)
+            )
+        finally:
+            process.terminate()
+            process.wait()
+
+    total = sum(len(samples) for samples in latencies.values())
+    print(
+        f"{len(tournament_ids)} tournoi(s), {args.readers} lecteur(s) : "
+        f"{total} requêtes en {elapsed:.2f} s "
+        f"({total / elapsed:.0f} req/s)"
+    )
+    for op, samples in sorted(latencies.items()):
+        samples.sort()
+        p95 = samples[int(0.95 * (len(samples) - 1))]
+        print(
+            f"  {op:<14} {len(samples):>7}  "
+            f"médiane {statistics.median(samples) * 1000:7.2f} ms  "
+            f"p95 {p95 * 1000:7.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Mesure du temps d'import au démarrage (``python -X importtime``).
+
+Chaque cible est importée dans un interpréteur neuf ; le temps retenu est
+la somme des temps cumulés des imports de premier niveau, hors modules déjà
+chargés par un interpréteur vide. Les chemins sans interface ne doivent pas
+importer Rich, et chaque cible dispose d'un budget en millisecondes.
+
+    python benchmarks/bench_startup.py
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+FORBIDDEN_HEADLESS = ("rich",)
+
+# (libellé, code exécuté, chemin sans interface, budget en ms)
+STARTUP_TARGETS = [
+    ("import report", "import report", True, 60.0),
+    ("import managers", "import managers", True, 50.0),
+    ("import controllers.round", "import controllers.round", True, 50.0),
+    ("import app", "import app", True, 60.0),
+    (
+        "MainController()",
+        "from controllers import MainController; MainController()",
+        False,
+        200.0,
+    ),
+]
+
+
+def _import_profile(code: str) -> tuple[dict[str, int], set[str]]:
+    """Retourne {module de premier niveau: µs cumulées} et tous les modules."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    top_level: dict[str, int] = {}
+    modules: set[str] = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        modules.add(name.strip())
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = int(cumulative)
+    return top_level, modules
+
+
+def measure_startup(code: str, repeat: int = 5) -> tuple[float, set[str]]:
+    """Médiane (ms) du temps d'import propre à ``code``."""
+    baseline, _ = _import_profile("pass")
+    samples = []
+    modules: set[str] = set()
+    for _ in range(repeat):
+        top_level, modules = _import_profile(code)
+        total_us = sum(
+            cumulative
+            for name, cumulative in top_level.items()
+            if name not in baseline
+        )
+        samples.append(total_us / 1000)
+    return statistics.median(samples), modules
+
+
+def main() -> int:
+    failures = 0
+    for label, code, headless, budget in STARTUP_TARGETS:
+        elapsed, modules = measure_startup(code)
+        problems = []
+        if elapsed > budget:
+            problems.append(f"budget {budget:.0f} ms dépassé")
+        if headless:
+            leaked = sorted(
+                name
+                for name in modules
+                if name.split(".")[0] in FORBIDDEN_HEADLESS
+            )
+            if leaked:
+                problems.append(f"importe {leaked[0]}")
+        status = "OK" if not problems else "ÉCHEC : " + ", ".join(problems)
+        print(f"{label:<28} {elapsed:>8.1f} ms  {status}")
+        failures += bool(problems)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Générateurs de données synthétiques au format JSON de l'application.
+
+Les données produites respectent exactement le schéma de ``players.json``
+et ``tournaments.json`` ; une même graine produit toujours les mêmes
+fichiers, ce qui rend les mesures comparables d'une exécution à l'autre.
+"""
+
+import random
+import string
+from itertools import product
+from typing import Any, Iterator
+
+ROUNDS_EPOCH = 1_735_740_000
+
+LASTNAMES = [
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit",
+    "Durand", "Leroy", "Moreau", "Simon", "Laurent", "Lefebvre", "Michel",
+    "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier", "Morel",
+    "Girard", "Andre", "Mercier", "Dupont", "Lambert", "Bonnet", "Francois",
+]
+FIRSTNAMES = [
+    "Jean", "Marie", "Pierre", "Sophie", "Luc", "Julie", "Paul", "Claire",
+    "Louis", "Emma", "Hugo", "Alice", "Noam", "Chloe", "Lucas", "Lea",
+    "Nathan", "Manon", "Jules", "Camille", "Arthur", "Ines", "Adam", "Zoe",
+]
+LOCATIONS = [
+    "Paris", "Lyon", "Marseille", "Lille", "Nantes", "Bordeaux", "Rennes",
+    "Toulouse", "Nice", "Strasbourg", "Montpellier", "Grenoble",
+]
+
+
+def _ids(prefix_offset: int = 0) -> Iterator[str]:
+    """Identifiants uniques au format AB12345."""
+    letters = product(string.ascii_uppercase, repeat=2)
+    for index, (first, second) in enumerate(letters):
+        if index < prefix_offset:
+            continue
+        for number in range(10000, 100000):
+            yield f"{first}{second}{number}"
+
+
+def generate_players(count: int, seed: int = 0) -> list[dict[str, str]]:
+    """Génère une fédération de ``count`` joueurs."""
+    rng = random.Random(seed)
+    ids = _ids()
+    players = []
+    for _ in range(count):
+        players.append(
+            {
+                "id": next(ids),
+                "lastname": rng.choice(LASTNAMES),
+                "firstname": rng.choice(FIRSTNAMES),
+                "birthday": "{:04d}-{:02d}-{:02d}".format(
+                    rng.randint(1950, 2015),
+                    rng.randint(1, 12),
+                    rng.randint(1, 28),
+                ),
+            }
+        )
+    return players
+
+
+def _play_swiss_rounds(
+    rng: random.Random,
+    player_ids: list[str],
+    rounds_played: int,
+) -> tuple[dict[str, float], list[dict[str, Any]]]:
+    """Simule des rounds par score (sans recherche de rematch)."""
+    scores = {player_id: 0.0 for player_id in player_ids}
+    rounds = []
+    for round_num in range(1, rounds_played + 1):
+        ordered = sorted(player_ids, key=lambda pid: scores[pid], reverse=True)
+        matches = []
+        for index in range(0, len(ordered) - 1, 2):
+            player1, player2 = ordered[index], ordered[index + 1]
+            score1, score2 = rng.choice(
+                [(1.0, 0.0), (0.0, 1.0), (0.5, 0.5)]
+            )
+            scores[player1] += score1
+            scores[player2] += score2
+            matches.append(
+                {
+                    "player1_id": player1,
+                    "player2_id": player2,
+                    "score1": score1,
+                    "score2": score2,
+                }
+            )
+        if len(ordered) % 2:
+            scores[ordered[-1]] += 1.0
+        # Quatre rounds par jour à partir du 2025-01-01 14:00 UTC (epoch)
+        started_at = ROUNDS_EPOCH + (round_num - 1) // 4 * 86_400
+        rounds.append(
+            {
+                "name": f"Round {round_num}",
+                "matches": matches,
+                "started_at": started_at,
+                "ended_at": started_at + 4 * 3_600,
+            }
+        )
+    return scores, rounds
+
+
+def generate_tournaments(
+    count: int,
+    player_ids: list[str],
+    seed: int = 0,
+    min_rounds: int = 4,
+    max_rounds: int = 13,
+    min_players: int = 8,
+    max_players: int = 64,
+) -> list[dict[str, Any]]:
+    """Génère une archive de ``count`` tournois, joués en tout ou partie."""
+    rng = random.Random(seed)
+    ids = _ids(prefix_offset=26)
+    tournaments = []
+    max_players = min(max_players, len(player_ids))
+    min_players = min(min_players, max_players)
+    for index in range(count):
+        rounds_count = rng.randint(min_rounds, max_rounds)
+        rounds_played = rng.randint(0, rounds_count)
+        participants = rng.sample(
+            player_ids, rng.randint(min_players, max_players)
+        )
+        scores, rounds = _play_swiss_rounds(rng, participants, rounds_played)
+        year = 2020 + index % 6
+        month = 1 + index % 12
+        tournaments.append(
+            {
+                "id": next(ids),
+                "name": f"Open {index + 1}",
+                "location": rng.choice(LOCATIONS),
+                "start_date": f"{year}-{month:02d}-01",
+                "end_date": f"{year}-{month:02d}-03",
+                "players": [
+                    {"player_id": player_id, "score": scores[player_id]}
+                    for player_id in participants
+                ],
+                "rounds": rounds,
+                "rounds_count": rounds_count,
+                "current_round": rounds_played + 1,
+                "description": "Tournoi synthétique",
+            }
+        )
+    return tournaments
@@ -0,0 +1,351 @@
+"""Suite de benchmarks reproductible.
+
+Génère une fédération et une archive synthétiques dans un dossier
+temporaire, mesure les opérations principales (managers, hydratation,
+appariement, scores, rapports) et le temps d'import au démarrage (voir
+``bench_startup.py``), puis enregistre les résultats en JSON.
+Avec ``--baseline``, les médianes sont comparées à une exécution
+précédente et toute régression au-delà du seuil est signalée (code de
+sortie 1).
+
+Exemples ::
+
+    python benchmarks/run_benchmarks.py --preset small
+    python benchmarks/run_benchmarks.py --preset medium \\
+        --baseline benchmarks/results/medium_20250101_120000.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+RESULTS_DIR = BENCH_DIR / "results"
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(BENCH_DIR))
+
+from bench_startup import STARTUP_TARGETS, measure_startup  # noqa: E402
+from generators import generate_players, generate_tournaments  # noqa: E402
+
+PRESETS = {
+    "small": {"players": 1_000, "tournaments": 10},
+    "medium": {"players": 10_000, "tournaments": 200},
+    "large": {"players": 100_000, "tournaments": 5_000},
+}
+DEFAULT_THRESHOLD = 0.20
+
+
+def write_dataset(
+    workdir: Path, players: int, tournaments: int, seed: int
+) -> None:
+    """Écrit ``data/players.json`` et ``data/tournaments.json``."""
+    data_dir = workdir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    player_data = generate_players(players, seed=seed)
+    player_ids = [player["id"] for player in player_data]
+    tournament_data = generate_tournaments(
+        tournaments, player_ids, seed=seed
+    )
+    with open(data_dir / "players.json", "w", encoding="utf-8") as handle:
+        json.dump(player_data, handle, ensure_ascii=False, indent=4)
+    with open(data_dir / "tournaments.json", "w", encoding="utf-8") as handle:
+        json.dump(tournament_data, handle, ensure_ascii=False, indent=4)
+
+
+def measure(func: Callable[[], Any], repeat: int) -> dict[str, Any]:
+    """Exécute ``func`` ``repeat`` fois et retourne min/médiane (s)."""
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "runs": runs,
+    }
+
+
+def build_league(players: list, rng: random.Random) -> Any:
+    """Ligue par équipes : 100 équipes de 4 échiquiers, 9 rondes jouées."""
+    from models import Round, Team, Tournament
+    from utils.pairing_utils import run_pairing
+    from utils.team_utils import decode_team_pairing, encode_team_pairing
+
+    members = players[:400]
+    league = Tournament(
+        id="LG00001",
+        name="Ligue",
+        location="Bench",
+        start_date="2025-01-01",
+        end_date="2025-06-30",
+        players=[[player, 0.0] for player in members],
+        rounds=[],
+        rounds_count=9,
+        teams=[
+            Team(
+                f"LG00001-E{number + 1}",
+                f"Équipe {number + 1}",
+                members[number * 4:(number + 1) * 4],
+            )
+            for number in range(100)
+        ],
+    )
+    for round_num in range(1, 10):
+        league.current_round = round_num
+        job = encode_team_pairing(league, round_num)
+        boards, _bye = decode_team_pairing(league, run_pairing(job))
+        for board in boards:
+            board.score1, board.score2 = rng.choice(
+                [(1.0, 0.0), (0.0, 1.0), (0.5, 0.5)]
+            )
+        league.rounds.append(Round(f"Round {round_num}", boards))
+    league.current_round = 10
+    return league
+
+
+def build_cases(workdir: Path, seed: int) -> dict[str, Callable[[], Any]]:
+    """Prépare les cas mesurés ; l'import des modules se fait ici."""
+    from controllers.publication import PublicationController
+    from controllers.round import RoundController
+    from managers import PlayerManager, PublicationManager, TournamentManager
+    from models import Tournament
+    from report import ReportGenerator
+    from utils import load_json, pair_players_by_score
+    from utils.crosstable_utils import Crosstable
+    from utils.team_utils import encode_team_pairing, team_standings
+
+    rng = random.Random(seed)
+    player_manager = PlayerManager()
+    tournament_manager = TournamentManager()
+
+    raw_players = load_json(player_manager.storage_path, default=[])
+    raw_tournaments = load_json(tournament_manager.storage_path, default=[])
+    sample_ids = [
+        player["id"] for player in rng.sample(raw_players, 20)
+    ]
+    largest_raw = max(
+        raw_tournaments,
+        key=lambda entry: len(entry["players"]) * (len(entry["rounds"]) + 1),
+    )
+    largest = Tournament.from_dict(largest_raw)
+    last_round = largest.rounds[-1] if largest.rounds else None
+    some_player = player_manager.find_by_id(sample_ids[0])
+    round_controller = RoundController()
+    sections = [
+        Tournament.from_dict(entry)
+        for entry in sorted(
+            raw_tournaments,
+            key=lambda entry: len(entry["players"]),
+            reverse=True,
+        )[:8]
+    ]
+    league = build_league(player_manager.find_all(), rng)
+    reports = ReportGenerator(
+        output_dir=workdir / "reports", run_timestamp="bench"
+    )
+    publication = PublicationController(
+        tournament_manager,
+        player_manager,
+        PublicationManager(str(workdir / "site")),
+    )
+    publication.publish()
+
+    def save_tournament() -> None:
+        largest.mark_dirty()
+        tournament_manager.save(largest)
+
+    def update_scores() -> None:
+        if last_round is not None:
+            round_controller.update_tournament_scores(largest, last_round)
+
+    return {
+        "PlayerManager.find_all": player_manager.find_all,
+        "PlayerManager.find_by_id x20": lambda: [
+            player_manager.find_by_id(player_id) for player_id in sample_ids
+        ],
+        "PlayerManager.save": lambda: player_manager.save(some_player),
+        "TournamentManager.find_all": tournament_manager.find_all,
+        "TournamentManager.find_by_id": lambda: (
+            tournament_manager.find_by_id(largest.id)
+        ),
+        "PlayerManager.find_duplicates": player_manager.find_duplicates,
+        "TournamentManager.find_year": lambda: (
+            tournament_manager.find_year(2025)
+        ),
+        "TournamentManager.query (lieu, période)": lambda: (
+            tournament_manager.query(
+                largest.location, date(2025, 1, 1), date(2025, 12, 31)
+            )
+        ),
+        "TournamentManager.games_between": lambda: (
+            tournament_manager.games_between(*sample_ids[:2])
+        ),
+        "TournamentManager.head_to_head (archive)": lambda: (
+            tournament_manager.head_to_head()
+        ),
+        "PublicationController.publish (à jour)": publication.publish,
+        "Crosstable (plus grand tournoi)": lambda: (
+            Crosstable(largest).rows()
+        ),
+        "TournamentManager.active_players (saison)": lambda: (
+            tournament_manager.active_players(
+                10, date(2025, 1, 1), date(2025, 12, 31)
+            )
+        ),
+        "TournamentManager.save": save_tournament,
+        "Tournament.from_dict": lambda: Tournament.from_dict(largest_raw),
+        "pair_players_by_score": lambda: pair_players_by_score(largest),
+        "RoundController.update_tournament_scores": update_scores,
+        "RoundController.create_rounds x8 (séquentiel)": lambda: (
+            round_controller.create_rounds(sections, max_workers=1)
+        ),
+        "RoundController.create_rounds x8 (processus)": lambda: (
+            round_controller.create_rounds(
+                sections, max_workers=max(2, os.cpu_count() or 1)
+            )
+        ),
+        "team_standings (100 équipes, 9 rondes)": lambda: (
+            team_standings(league)
+        ),
+        "encode_team_pairing (100 équipes, 9 rondes)": lambda: (
+            encode_team_pairing(league, 10)
+        ),
+        "ReportGenerator.generate_players_report": (
+            reports.generate_players_report
+        ),
+        "ReportGenerator.generate_tournaments_report": (
+            reports.generate_tournaments_report
+        ),
+        "ReportGenerator.generate_tournament_info_report": lambda: (
+            reports.generate_tournament_info_report(largest.id)
+        ),
+        "ReportGenerator.generate_tournament_players_report": lambda: (
+            reports.generate_tournament_players_report(largest.id)
+        ),
+        "ReportGenerator.generate_tournament_rounds_report": lambda: (
+            reports.generate_tournament_rounds_report(largest.id)
+        ),
+    }
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Retourne les cas dont la médiane dépasse la référence + seuil."""
+    regressions = []
+    for name, current in results["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        ratio = current["median"] / max(reference["median"], 1e-9)
+        current["baseline_ratio"] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=PRESETS, default="small")
+    parser.add_argument("--players", type=int)
+    parser.add_argument("--tournaments", type=int)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="sous-chaîne filtrant les cas")
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument(
+        "--skip-startup",
+        action="store_true",
+        help="ne pas mesurer le temps d'import au démarrage",
+    )
+    args = parser.parse_args()
+
+    preset = PRESETS[args.preset]
+    players = args.players or preset["players"]
+    tournaments = args.tournaments or preset["tournaments"]
+
+    original_cwd = Path.cwd()
+    with tempfile.TemporaryDirectory(prefix="oc_chess_bench_") as tmp:
+        workdir = Path(tmp)
+        print(
+            f"Génération : {players} joueurs, {tournaments} tournois "
+            f"(graine {args.seed})"
+        )
+        write_dataset(workdir, players, tournaments, args.seed)
+        os.chdir(workdir)
+        try:
+            cases = build_cases(workdir, args.seed)
+            results: dict[str, Any] = {
+                "meta": {
+                    "preset": args.preset,
+                    "players": players,
+                    "tournaments": tournaments,
+                    "seed": args.seed,
+                    "repeat": args.repeat,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "timestamp": datetime.now().isoformat(timespec="seconds"),
+                },
+                "results": {},
+            }
+            for name, func in cases.items():
+                if args.only and args.only not in name:
+                    continue
+                results["results"][name] = measure(func, args.repeat)
+                print(
+                    f"{name:<55} "
+                    f"{results['results'][name]['median'] * 1000:>10.2f} ms"
+                )
+        finally:
+            os.chdir(original_cwd)
+
+    if not args.skip_startup:
+        for label, code, _headless, budget in STARTUP_TARGETS:
+            name = f"startup: {label}"
+            if args.only and args.only not in name:
+                continue
+            elapsed_ms, _modules = measure_startup(code, args.repeat)
+            results["results"][name] = {
+                "min": elapsed_ms / 1000,
+                "median": elapsed_ms / 1000,
+                "runs": [],
+                "budget": budget / 1000,
+            }
+            over = "  <-- hors budget" if elapsed_ms > budget else ""
+            print(f"{name:<55} {elapsed_ms:>10.2f} ms{over}")
+
+    regressions: list[str] = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.threshold)
+        for name, current in results["results"].items():
+            if "baseline_ratio" in current:
+                flag = "  <-- RÉGRESSION" if name in regressions else ""
+                print(f"{name:<55} x{current['baseline_ratio']:.2f}{flag}")
+
+    output = args.output or RESULTS_DIR / (
+        f"{args.preset}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2)
+    print(f"Résultats : {output}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
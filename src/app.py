@@ -1,5 +1,9 @@
+import sys
+
 from controllers.main_controller import MainController
+from utils import configure_profiling
 
 
 if __name__ == "__main__":
+    configure_profiling(sys.argv)
     MainController().run()
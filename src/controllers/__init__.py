@@ -2,18 +2,52 @@
 
 Controllers package for managing players, matches, rounds, and tournaments.
 
+Les controllers sont importés à la première utilisation (PEP 562) afin que
+les traitements sans interface (rapports, scores) ne chargent pas les vues.
+
 """
 
-from controllers.main_controller import MainController
-from controllers.player import PlayerController
-from controllers.match import MatchController
-from controllers.round import RoundController
-from controllers.tournament import TournamentController
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from controllers.main_controller import MainController
+    from controllers.match import MatchController
+    from controllers.player import PlayerController
+    from controllers.publication import PublicationController
+    from controllers.query import QueryController
+    from controllers.round import RoundController
+    from controllers.scoring import ScoringController
+    from controllers.tournament import TournamentController
+
+_EXPORTS = {
+    "MainController": "controllers.main_controller",
+    "PlayerController": "controllers.player",
+    "PublicationController": "controllers.publication",
+    "QueryController": "controllers.query",
+    "MatchController": "controllers.match",
+    "RoundController": "controllers.round",
+    "ScoringController": "controllers.scoring",
+    "TournamentController": "controllers.tournament",
+}
 
 __all__ = [
     "MainController",
     "PlayerController",
+    "PublicationController",
+    "QueryController",
     "MatchController",
     "RoundController",
+    "ScoringController",
     "TournamentController",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Importe le module du controller demandé au premier accès."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
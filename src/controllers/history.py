@@ -0,0 +1,185 @@
+"""HistoryController - Correction des résultats, annulable."""
+
+from managers import PlayerStatsManager, TournamentManager
+from models import Tournament
+from utils.consistency_utils import Drift, check_standings
+from utils.history_utils import TournamentHistory
+from utils.pairing_utils import pairing_system
+from utils.tiebreak_utils import TieBreaks
+
+from .match import VALID_RESULTS
+from .round import RoundController
+from .standings import StandingsController
+
+
+def _stamp(tournament: Tournament) -> tuple:
+    """État dont dépendent les départages : rounds, joueurs et scores."""
+    return (
+        len(tournament.rounds),
+        tuple((player.id, score) for player, score in tournament.players),
+    )
+
+
+def _compute_tiebreaks(tournament: Tournament) -> TieBreaks:
+    return TieBreaks.from_rounds(
+        {player.id: score for player, score in tournament.players},
+        tournament.rounds,
+    )
+
+
+class HistoryController:
+    """Corrige les résultats des rounds clôturés d'un tournoi.
+
+    Chaque tournoi corrigé a son ``TournamentHistory`` : une correction
+    ne rejoue que le round corrigé et les suivants, et peut être annulée
+    puis rétablie tant qu'aucun nouveau round n'a été joué. Sur le
+    tournoi, seuls les scores des deux joueurs du match changent (par
+    différence) et seuls les départages qui en dépendent (les leurs et
+    ceux de leurs adversaires) sont recalculés. Le tournoi est ensuite
+    sauvegardé, le classement en direct et les statistiques de carrière
+    réalignés.
+    """
+
+    def __init__(
+        self,
+        manager: TournamentManager,
+        round_controller: RoundController,
+        standings: StandingsController,
+        stats_manager: PlayerStatsManager,
+    ) -> None:
+        self.manager = manager
+        self.round_controller = round_controller
+        self.standings = standings
+        self.stats_manager = stats_manager
+        self._histories: dict[str, TournamentHistory] = {}
+        # Départages calculés par une écriture, avec l'état qu'ils décrivent
+        self._tiebreaks: dict[str, tuple[tuple, TieBreaks]] = {}
+        # Retrait ou fusion d'un joueur : matchs réécrits hors du modèle
+        manager.add_listener(self.discard)
+
+    def discard(self, tournament_ids: list[str]) -> None:
+        """Oublie l'historique et les départages de ces tournois."""
+        for tournament_id in tournament_ids:
+            self._histories.pop(tournament_id, None)
+            self._tiebreaks.pop(tournament_id, None)
+
+    def history(self, tournament: Tournament) -> TournamentHistory:
+        """Historique du tournoi, complété des rounds joués entre-temps.
+
+        Reconstruit si ses rounds ne sont plus ceux du tournoi.
+        """
+        history = self._histories.get(tournament.id)
+        if history is None or not history.matches(tournament):
+            history = TournamentHistory.from_tournament(tournament)
+            self._histories[tournament.id] = history
+        elif len(history.version) != len(tournament.rounds):
+            history.refresh(
+                tournament,
+                min(len(history.version), len(tournament.rounds)) + 1,
+            )
+        return history
+
+    def tiebreaks(self, tournament: Tournament) -> TieBreaks:
+        """Départages courants du tournoi.
+
+        Ceux mis en cache par une écriture (round clôturé, correction)
+        sont repris s'ils décrivent encore le tournoi ; sinon ils sont
+        recalculés, sans être mis en cache : une lecture ne fige jamais
+        un état observé en cours d'écriture.
+        """
+        cached = self._tiebreaks.get(tournament.id)
+        if cached is not None and cached[0] == _stamp(tournament):
+            return cached[1]
+        return _compute_tiebreaks(tournament)
+
+    def close_round(self, tournament: Tournament) -> None:
+        """Met en cache les départages après la clôture d'un round."""
+        self._tiebreaks[tournament.id] = (
+            _stamp(tournament),
+            _compute_tiebreaks(tournament),
+        )
+
+    def correct_result(
+        self,
+        tournament: Tournament,
+        round_num: int,
+        board: int,
+        score1: float,
+        score2: float,
+    ) -> int:
+        """Corrige un résultat ; retourne le premier round recalculé."""
+        score1, score2 = float(score1), float(score2)
+        if (score1, score2) not in VALID_RESULTS:
+            raise ValueError(f"Résultat invalide : {score1} - {score2}")
+        system = pairing_system(tournament.pairing_system)
+        if system.max_losses is not None:
+            if score1 == score2:
+                raise ValueError(
+                    "Match nul impossible dans un tournoi à élimination."
+                )
+            if round_num != len(tournament.rounds):
+                # Les rounds suivants ont été appariés sur ce résultat
+                raise ValueError(
+                    "Seul le dernier round d'un tournoi à élimination "
+                    "peut être corrigé."
+                )
+        history = self.history(tournament)
+        tiebreaks = self.tiebreaks(tournament)
+        first = history.correct(round_num, board, score1, score2)
+
+        match = tournament.rounds[round_num - 1].matches[board - 1]
+        delta1, delta2 = score1 - match.score1, score2 - match.score2
+        match.score1, match.score2 = score1, score2
+        tournament.add_score(match.player1.id, delta1)
+        tournament.add_score(match.player2.id, delta2)
+        tiebreaks.amend(round_num, board, score1, score2)
+        self._tiebreaks[tournament.id] = (_stamp(tournament), tiebreaks)
+        self._publish(tournament)
+        return first
+
+    def undo(self, tournament: Tournament) -> int | None:
+        """Annule la dernière correction (``None`` si aucune)."""
+        first = self.history(tournament).undo()
+        if first is not None:
+            self._apply(tournament, first)
+        return first
+
+    def redo(self, tournament: Tournament) -> int | None:
+        """Rétablit la dernière correction annulée (``None`` si aucune)."""
+        first = self.history(tournament).redo()
+        if first is not None:
+            self._apply(tournament, first)
+        return first
+
+    def check(self, tournament: Tournament) -> list[Drift]:
+        """Écarts entre le classement stocké et celui des rounds."""
+        cached = self._tiebreaks.get(tournament.id)
+        tiebreaks = (
+            cached[1]
+            if cached and cached[0] == _stamp(tournament)
+            else None
+        )
+        return check_standings(tournament, tiebreaks)
+
+    def repair(self, tournament: Tournament) -> list[Drift]:
+        """Recalcule le classement à partir des rounds.
+
+        Retourne les écarts constatés avant la réparation.
+        """
+        drifts = self.check(tournament)
+        if drifts:
+            self.history(tournament).refresh(tournament)
+            self._apply(tournament, 1)
+        return drifts
+
+    def _apply(self, tournament: Tournament, first: int) -> None:
+        self._histories[tournament.id].restore(tournament, first)
+        self._tiebreaks.pop(tournament.id, None)
+        self._publish(tournament)
+
+    def _publish(self, tournament: Tournament) -> None:
+        self.round_controller.update_elimination(tournament)
+        self.round_controller.pairing_cache.discard(tournament.id)
+        self.manager.save(tournament)
+        self.standings.resync(tournament)
+        self.stats_manager.refresh_tournament(tournament.to_dict())
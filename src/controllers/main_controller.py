@@ -1,6 +1,7 @@
 from controllers.player import PlayerController
+from controllers.query import QueryController
 from controllers.tournament import TournamentController
-from views import MainView
+from managers import PlayerStatsManager
 from views.logger_view import LoggerView
 
 
@@ -8,21 +9,40 @@ class MainController:
     """Point d'entrée principal l'application."""
 
     def __init__(self) -> None:
-        self.player_controller = PlayerController()
-        self.tournament_controller = TournamentController()
+        stats_manager = PlayerStatsManager()
+        self.tournament_controller = TournamentController(
+            stats_manager=stats_manager
+        )
+        # Même gestionnaire : le retrait ou la fusion d'un joueur prévient
+        # l'historique des corrections des tournois réécrits
+        self.player_controller = PlayerController(
+            tournament_manager=self.tournament_controller.manager,
+            stats_manager=stats_manager,
+        )
+        self.query_controller = QueryController(
+            self.tournament_controller.manager,
+            self.player_controller.manager,
+        )
 
     def run(self) -> None:
         """Boucle principale du programme."""
+        from views import MainView
 
-        while True:
-            choice = MainView.main_menu()
+        try:
+            while True:
+                choice = MainView.main_menu()
 
-            if choice == "1":
-                self.player_controller.manage_players()
-            elif choice == "2":
-                self.tournament_controller.manage_tournaments()
-            elif choice == "0":
-                MainView.display_goodbye()
-                break
-            else:
-                LoggerView.warning("Choix invalide. Veuillez réessayer.")
+                if choice == "1":
+                    self.player_controller.manage_players()
+                elif choice == "2":
+                    self.tournament_controller.manage_tournaments()
+                elif choice == "3":
+                    self.query_controller.run()
+                elif choice == "0":
+                    MainView.display_goodbye()
+                    break
+                else:
+                    LoggerView.warning("Choix invalide. Veuillez réessayer.")
+        finally:
+            # Processus d'appariement éventuellement démarrés
+            self.tournament_controller.round_controller.shutdown()
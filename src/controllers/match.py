@@ -1,9 +1,32 @@
+from typing import Callable
 
 from models import Match
 
+# Résultats admis : (score joueur 1, score joueur 2)
+VALID_RESULTS = {(1.0, 0.0), (0.0, 1.0), (0.5, 0.5)}
+
+# Appelé après chaque saisie : (match, (ancien score1, ancien score2))
+ScoreListener = Callable[[Match, tuple[float, float]], None]
+
 
 class MatchController:
-    """Controller pour gérer les matchs."""
+    """Controller pour gérer les matchs.
+
+    Les écouteurs enregistrés via ``add_listener`` sont prévenus de chaque
+    saisie ou correction de résultat (classement en direct).
+    """
+
+    def __init__(self) -> None:
+        self._listeners: list[ScoreListener] = []
+
+    def add_listener(self, listener: ScoreListener) -> None:
+        """Abonne ``listener`` aux saisies de résultats."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ScoreListener) -> None:
+        """Désabonne ``listener``."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
 
     def create_match(self, player1, player2) -> Match:
         """Créer un match entre deux joueurs."""
@@ -21,5 +44,8 @@ class MatchController:
         score2: float,
     ) -> None:
         """Mettre à jour les scores d'un match."""
+        previous = (match.score1, match.score2)
         match.score1 = score1
         match.score2 = score2
+        for listener in list(self._listeners):
+            listener(match, previous)
@@ -0,0 +1,79 @@
+"""Navigation paginée partagée par les controllers."""
+
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+PAGE_SIZE = 20
+
+
+class Paginator(Generic[T]):
+    """État d'une liste paginée dont seule la page visible est chargée.
+
+    ``fetch_page(offset, limit, query)`` doit retourner les éléments de la
+    page et le nombre total d'éléments correspondant au filtre.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int, int, str], tuple[list[T], int]],
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.page = 1
+        self.query = ""
+        self.items: list[T] = []
+        self.total = 0
+
+    @property
+    def pages(self) -> int:
+        """Nombre de pages (au moins une)."""
+        return max(1, -(-self.total // self.page_size))
+
+    @property
+    def offset(self) -> int:
+        """Position du premier élément de la page courante."""
+        return (self.page - 1) * self.page_size
+
+    def load(self) -> list[T]:
+        """Charge la page courante."""
+        self.items, self.total = self.fetch_page(
+            self.offset, self.page_size, self.query
+        )
+        if self.page > self.pages:
+            self.page = self.pages
+            self.items, self.total = self.fetch_page(
+                self.offset, self.page_size, self.query
+            )
+        return self.items
+
+    def item_at(self, number: str) -> T | None:
+        """Élément correspondant au numéro affiché (``offset + 1``...)."""
+        if not number.strip().isdigit():
+            return None
+        index = int(number) - 1 - self.offset
+        if 0 <= index < len(self.items):
+            return self.items[index]
+        return None
+
+    def handle(self, command: str) -> bool:
+        """Applique une commande de navigation.
+
+        ``s`` page suivante, ``p`` page précédente, ``:N`` page N,
+        ``/texte`` filtre (``/`` seul l'efface). Retourne False si la
+        commande n'est pas une commande de navigation.
+        """
+        command = command.strip()
+        if command.lower() == "s":
+            self.page = min(self.page + 1, self.pages)
+        elif command.lower() == "p":
+            self.page = max(self.page - 1, 1)
+        elif command.startswith(":") and command[1:].isdigit():
+            self.page = min(max(int(command[1:]), 1), self.pages)
+        elif command.startswith("/"):
+            self.query = command[1:].strip()
+            self.page = 1
+        else:
+            return False
+        return True
@@ -1,18 +1,28 @@
 """PlayerController - Logique métier pour les joueurs."""
 
-import re
+from datetime import date
 
-from managers import PlayerManager
+from controllers.pagination import Paginator
+from managers import PlayerManager, PlayerStatsManager, TournamentManager
 from models import Player
-from views import PlayerView
+from utils import validation_utils
 from views.logger_view import LoggerView
 
 
 class PlayerController:
     """Controller orchestrant interactions vue/manager pour les joueurs."""
 
-    def __init__(self, manager: PlayerManager | None = None) -> None:
+    def __init__(
+        self,
+        manager: PlayerManager | None = None,
+        tournament_manager: TournamentManager | None = None,
+        stats_manager: PlayerStatsManager | None = None,
+    ) -> None:
+        from views import PlayerView
+
         self.manager = manager or PlayerManager()
+        self.tournament_manager = tournament_manager or TournamentManager()
+        self.stats_manager = stats_manager or PlayerStatsManager()
         self.view = PlayerView
 
     def manage_players(self) -> None:
@@ -26,6 +36,10 @@ class PlayerController:
                 self.list_players()
             elif choice == "3":
                 self.delete_player()
+            elif choice == "4":
+                self.show_player_career()
+            elif choice == "5":
+                self.merge_duplicates()
             elif choice == "0":
                 break
             else:
@@ -54,20 +68,127 @@ class PlayerController:
                 LoggerView.warning(f"- {error}")
 
     def list_players(self) -> None:
-        """Affiche la liste des joueurs."""
-        players = self.manager.find_all()
-        self.view.display_players(players)
+        """Affiche la liste des joueurs, page par page."""
+        from views import PaginationView
+
+        paginator = Paginator(self.manager.find_page)
+        while True:
+            paginator.load()
+            self.view.display_players(
+                paginator.items,
+                paginator.page,
+                paginator.pages,
+                paginator.total,
+                paginator.query,
+            )
+            if paginator.total == 0 and not paginator.query:
+                return
+            if not paginator.handle(PaginationView.prompt_command()):
+                return
 
     def delete_player(self) -> None:
         """Supprime un joueur identifié par son ID."""
         player_id = self.view.prompt_delete_player()
         player = self.manager.find_by_id(player_id)
 
-        if player:
-            self.manager.delete(player_id)
-            LoggerView.success("Joueur supprimé avec succès !")
-        else:
+        if not player:
+            LoggerView.error("Aucun joueur trouvé avec cet ID.")
+            return
+
+        references = self.tournament_manager.player_tournaments(player_id)
+        if references:
+            self.view.display_player_references(player, references)
+            if not self.view.confirm_action(
+                "Retirer aussi le joueur (et ses matchs) de ces tournois ?"
+            ):
+                LoggerView.warning("Suppression annulée.")
+                return
+
+        try:
+            self.manager.delete(
+                player_id,
+                cascade=bool(references),
+                tournament_manager=self.tournament_manager,
+            )
+        except ValueError as exc:
+            LoggerView.error(f"Suppression impossible : {exc}")
+            return
+        if references:
+            # Des matchs ont disparu : les agrégats de tous leurs
+            # participants doivent être recalculés.
+            self.stats_manager.rebuild()
+        LoggerView.success("Joueur supprimé avec succès !")
+
+    def show_player_career(self) -> None:
+        """Affiche le bilan de carrière d'un joueur."""
+        player_id = self.view.prompt_player_id()
+        player = self.manager.find_by_id(player_id)
+
+        if not player:
             LoggerView.error("Aucun joueur trouvé avec cet ID.")
+            return
+
+        self.view.display_player_career(
+            player, self.stats_manager.find_by_player(player_id)
+        )
+
+    def merge_duplicates(self) -> None:
+        """Détecte les joueurs en double et fusionne la paire choisie."""
+        candidates = self.manager.find_duplicates()
+        involved = {
+            player_id
+            for candidate in candidates
+            for player_id in candidate[:2]
+        }
+        players = {
+            player_id: self.manager.find_by_id(player_id)
+            for player_id in involved
+        }
+        references = {
+            player_id: len(
+                self.tournament_manager.player_tournaments(player_id)
+            )
+            for player_id in involved
+        }
+        self.view.display_duplicates(candidates, players, references)
+        if not candidates:
+            return
+        choice = self.view.prompt_duplicate_choice(len(candidates))
+        if not choice:
+            return
+
+        candidate = candidates[choice - 1]
+        # Par défaut, on garde le joueur qui a disputé le plus de tournois
+        default = max(
+            candidate[:2], key=lambda player_id: references[player_id]
+        )
+        keep_id = self.view.prompt_keep_id(candidate, default)
+        duplicate_id = (
+            candidate.other_id
+            if keep_id == candidate.player_id
+            else candidate.player_id
+        )
+        if not self.view.confirm_action(
+            f"Fusionner {duplicate_id} dans {keep_id} "
+            f"(le joueur {duplicate_id} sera supprimé) ?"
+        ):
+            LoggerView.warning("Fusion annulée.")
+            return
+
+        try:
+            merged = self.manager.merge(
+                duplicate_id, keep_id, self.tournament_manager
+            )
+        except ValueError as exc:
+            LoggerView.error(f"Fusion impossible : {exc}")
+            return
+        if merged:
+            # Les parties du doublon changent de joueur
+            self.stats_manager.rebuild()
+        LoggerView.success(
+            f"{duplicate_id} fusionné dans {keep_id} "
+            f"({len(merged)} tournoi(s) mis à jour)."
+        )
 
     @staticmethod
     def validate_player(player: Player) -> tuple[bool, list[str]]:
@@ -113,9 +234,8 @@ class PlayerController:
         :return: tuple[bool, str | None] - (True, None) si valide, sinon
             (False, message d'erreur)
         """
-        if not re.match(r"^[A-Z]{2}\d{5}$", player_id):
-            return False, "Format d'identifiant invalide. Exemple : AB12345."
-        return True, None
+        error = validation_utils.validate_id(player_id)
+        return error is None, error
 
     @staticmethod
     def validate_name(name: str, field_label: str) -> tuple[bool, str | None]:
@@ -126,28 +246,16 @@ class PlayerController:
         :return: tuple[bool, str | None] - (True, None) si valide, sinon
             (False, message d'erreur)
         """
-        if not name or len(name.strip()) == 0:
-            return False, f"Le {field_label} ne peut pas être vide."
-
-        name_pattern = r"^[A-ZÀ-ÖØ-Þ][A-Za-zÀ-ÖØ-öø-ÿ\- ]*$"
-        if not re.match(name_pattern, name):
-            message = (
-                f"Format de {field_label} invalide : doit commencer par "
-                "une majuscule et ne contenir que des lettres, espaces ou "
-                "tirets."
-            )
-            return False, message
-        return True, None
+        error = validation_utils.validate_name(name, field_label)
+        return error is None, error
 
     @staticmethod
-    def validate_birthday(birthday: str) -> tuple[bool, str | None]:
+    def validate_birthday(birthday: date | str) -> tuple[bool, str | None]:
         """
         Valide le format d'une date de naissance (YYYY-MM-DD)
-        :param birthday: str - La date à valider
+        :param birthday: date | str - La date à valider
         :return: tuple[bool, str | None] - (True, None) si valide, sinon
             (False, message d'erreur)
         """
-        date_pattern = r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$"
-        if not re.match(date_pattern, birthday):
-            return False, "Format de date de naissance invalide (YYYY-MM-DD)."
-        return True, None
+        error = validation_utils.validate_birthday(birthday)
+        return error is None, error
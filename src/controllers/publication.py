@@ -0,0 +1,93 @@
+"""PublicationController - Publication HTML incrémentale des résultats."""
+
+from managers import PlayerManager, PublicationManager, TournamentManager
+from models import Tournament
+from utils import instrumented
+from utils.publish_utils import (
+    SITE_INDEX,
+    PublishReport,
+    content_hash,
+    site_index_page,
+    tournament_pages,
+)
+
+
+class PublicationController:
+    """Publie appariements, classements et grilles en pages HTML.
+
+    Un tournoi dont les données (et les noms de ses joueurs) n'ont pas
+    changé depuis la dernière publication n'est pas même hydraté. Pour
+    les autres, seules les pages dont l'empreinte a changé sont rendues
+    et réécrites.
+    """
+
+    def __init__(
+        self,
+        manager: TournamentManager | None = None,
+        player_manager: PlayerManager | None = None,
+        publication_manager: PublicationManager | None = None,
+    ) -> None:
+        self.manager = manager or TournamentManager()
+        self.player_manager = player_manager or PlayerManager()
+        self.publication = publication_manager or PublicationManager()
+
+    @instrumented("PublicationController.publish")
+    def publish(self) -> PublishReport:
+        """Met le site à jour ; retourne les pages réécrites."""
+        manifest = self.publication.manifest
+        known = manifest["tournaments"]
+        written: list[str] = []
+        skipped = 0
+
+        entries = self.manager.entries()
+        for entry in entries:
+            tournament_id = entry["id"]
+            digest = content_hash([entry, self._names(entry)])
+            previous = known.get(tournament_id)
+            if (
+                previous is not None
+                and previous["hash"] == digest
+                and all(map(self.publication.exists, previous["pages"]))
+            ):
+                skipped += 1
+                continue
+
+            old_pages = previous["pages"] if previous else {}
+            pages = {}
+            for page in tournament_pages(Tournament.from_dict(entry)):
+                pages[page.path] = page.digest
+                if old_pages.get(
+                    page.path
+                ) != page.digest or not self.publication.exists(page.path):
+                    self.publication.write_page(page.path, page.render())
+                    written.append(page.path)
+            self.publication.remove_pages(set(old_pages) - set(pages))
+            known[tournament_id] = {"hash": digest, "pages": pages}
+
+        current = {entry["id"] for entry in entries}
+        removed = sorted(set(known) - current)
+        for tournament_id in removed:
+            self.publication.remove_pages(known.pop(tournament_id)["pages"])
+
+        index = site_index_page(self.manager.query())
+        if manifest["pages"].get(
+            SITE_INDEX
+        ) != index.digest or not self.publication.exists(SITE_INDEX):
+            self.publication.write_page(SITE_INDEX, index.render())
+            manifest["pages"][SITE_INDEX] = index.digest
+            written.append(SITE_INDEX)
+
+        self.publication.save_manifest()
+        return PublishReport(written, skipped, removed)
+
+    def _names(self, entry: dict) -> dict[str, list[str]]:
+        """Noms des joueurs d'un tournoi, inclus dans son empreinte."""
+        index = self.player_manager.index
+        names = {}
+        for player in entry.get("players", []):
+            record = index.get(player["player_id"]) or {}
+            names[player["player_id"]] = [
+                record.get("lastname", ""),
+                record.get("firstname", ""),
+            ]
+        return names
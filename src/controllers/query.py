@@ -0,0 +1,113 @@
+"""QueryController - Recherche dans l'archive des tournois."""
+
+from datetime import date
+from typing import Iterable
+
+from managers import PlayerManager, TournamentManager
+from utils.date_utils import parse_date
+from views.logger_view import LoggerView
+
+
+class QueryController:
+    """Requêtes filtrées sur l'archive et face-à-face des joueurs.
+
+    Les critères sont résolus par les index secondaires de
+    ``TournamentManager`` ; seuls les joueurs affichés sont chargés.
+    """
+
+    def __init__(
+        self,
+        manager: TournamentManager | None = None,
+        player_manager: PlayerManager | None = None,
+    ) -> None:
+        from views.query_view import QueryView
+
+        self.manager = manager or TournamentManager()
+        self.player_manager = player_manager or PlayerManager()
+        self.view = QueryView
+
+    def run(self) -> None:
+        """Boucle du menu de recherche."""
+        while True:
+            choice = self.view.query_menu()
+
+            if choice == "1":
+                self.search_tournaments()
+            elif choice == "2":
+                self.search_games()
+            elif choice == "3":
+                self.search_active_players()
+            elif choice == "4":
+                self.search_head_to_head()
+            elif choice == "0":
+                break
+            else:
+                LoggerView.warning("Choix invalide. Veuillez réessayer.")
+
+    def search_tournaments(self) -> None:
+        """Tournois par lieu, période et joueur."""
+        filters = self.view.prompt_tournament_filters()
+        period = self._period(filters["start"], filters["end"])
+        if period is None:
+            return
+        self.view.display_tournaments(
+            self.manager.query(
+                filters["location"] or None,
+                *period,
+                filters["player_id"] or None,
+            )
+        )
+
+    def search_games(self) -> None:
+        """Parties entre deux joueurs."""
+        player1_id, player2_id = self.view.prompt_player_pair()
+        period = self._period(*self.view.prompt_period())
+        if period is None:
+            return
+        games = self.manager.games_between(player1_id, player2_id, *period)
+        self.view.display_games(games, self._names((player1_id, player2_id)))
+
+    def search_active_players(self) -> None:
+        """Joueurs ayant au moins N parties sur une période."""
+        try:
+            min_games = int(self.view.prompt_min_games())
+        except ValueError:
+            LoggerView.error("Nombre de parties invalide.")
+            return
+        period = self._period(*self.view.prompt_period())
+        if period is None:
+            return
+        players = self.manager.active_players(min_games, *period)
+        self.view.display_active_players(
+            players, self._names(player_id for player_id, _ in players)
+        )
+
+    def search_head_to_head(self) -> None:
+        """Bilan d'un joueur contre chacun de ses adversaires."""
+        player_id = self.view.prompt_player_id()
+        opponents = self.manager.head_to_head([player_id]).get(player_id, {})
+        self.view.display_head_to_head(
+            player_id, opponents, self._names([player_id, *opponents])
+        )
+
+    @staticmethod
+    def _period(
+        start: str, end: str
+    ) -> tuple[date | None, date | None] | None:
+        """Bornes saisies (vides : ouvertes) ; ``None`` si invalides."""
+        bounds = []
+        for value in (start, end):
+            day = parse_date(value) if value else None
+            if value and day is None:
+                LoggerView.error(f"Date invalide : {value} (YYYY-MM-DD).")
+                return None
+            bounds.append(day)
+        return bounds[0], bounds[1]
+
+    def _names(self, player_ids: Iterable[str]) -> dict[str, str]:
+        names = {}
+        for player_id in player_ids:
+            player = self.player_manager.find_by_id(player_id)
+            if player is not None:
+                names[player_id] = f"{player.lastname} {player.firstname}"
+        return names
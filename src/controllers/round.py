@@ -1,10 +1,27 @@
-from datetime import datetime
+import os
+from typing import TYPE_CHECKING
 
+from managers import PairingCacheManager
 from models import Player, Round, Tournament
-from utils.match_utils import pair_players_by_score, pair_players_first_round
+from utils.clock_utils import now
+from utils.match_utils import count_losses, decode_pairing, encode_pairing
+from utils.pairing_utils import (
+    PairingJob,
+    PairingResult,
+    pairing_system,
+    run_pairing,
+    state_hash,
+)
+from utils.team_utils import decode_team_pairing, encode_team_pairing
 
 from .match import MatchController
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# En deçà (joueurs cumulés), lancer des processus coûte plus que le calcul
+PARALLEL_MIN_PLAYERS = 1_000
+
 
 class RoundController:
     """Controller pour gérer les rounds."""
@@ -12,35 +29,125 @@ class RoundController:
     def __init__(
         self,
         match_controller: MatchController | None = None,
+        pairing_cache: PairingCacheManager | None = None,
     ) -> None:
         self.match_controller = match_controller or MatchController()
+        self.pairing_cache = pairing_cache or PairingCacheManager()
+        self._executor: "Executor | None" = None
 
     def create_round(
         self, tournament: Tournament, round_num: int
     ) -> tuple[Round, Player | None]:
         """Créer un round et générer les matchs associés."""
-        bye_player: Player | None = None
+        if round_num != tournament.current_round:
+            raise ValueError(
+                "Seul le round courant peut être apparié "
+                f"({tournament.current_round})."
+            )
+        return self.create_rounds([tournament], max_workers=1)[0]
 
-        if round_num == 1:
-            players_list = [
-                player_data[0] for player_data in tournament.players
-            ]
-            matches, bye_player = pair_players_first_round(players_list)
-        else:
-            matches, bye_player = pair_players_by_score(tournament)
+    def create_rounds(
+        self, tournaments: list[Tournament], max_workers: int | None = None
+    ) -> list[tuple[Round, Player | None]]:
+        """Apparier le round courant de plusieurs tournois en parallèle.
 
-        new_round = Round(
-            name=f"Round {round_num}",
-            matches=matches,
-            started_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            ended_at=None,
-        )
+        Un appariement déjà calculé pour le même état (scores, rencontres,
+        round, graine) est repris du cache sans être recalculé : aperçu puis
+        confirmation, ou reprise après un arrêt, donnent les mêmes matchs.
+
+        Dans un tournoi par équipes, ce sont les équipes qui sont
+        appariées (sur leurs points de match), puis leurs échiquiers ;
+        l'équipe exempte est enregistrée dans le round (``bye_team_id``).
+
+        Seuls des tableaux compacts (scores, rencontres par indice) sont
+        envoyés aux processus de calcul ; les matchs sont reconstruits
+        ici. Sans ``max_workers``, les processus ne sont utilisés que sur
+        une machine multi-cœur et pour au moins ``PARALLEL_MIN_PLAYERS``
+        joueurs cumulés ; ``max_workers=1`` force le calcul sur place.
+        """
+        jobs = [self._encode(tournament) for tournament in tournaments]
+        hashes = [
+            state_hash(job, self._entrant_ids(tournament))
+            for job, tournament in zip(jobs, tournaments)
+        ]
+        results: list[PairingResult | None] = [
+            self.pairing_cache.get(key) for key in hashes
+        ]
+        missing = [
+            index for index, result in enumerate(results) if result is None
+        ]
+        if missing:
+            computed = self._run(
+                [jobs[index] for index in missing], max_workers
+            )
+            for index, result in zip(missing, computed):
+                results[index] = result
+            self.pairing_cache.put_many(
+                (hashes[index], jobs[index].round_num, results[index])
+                for index in missing
+            )
+
+        started_at = now()
+        rounds = []
+        for tournament, result in zip(tournaments, results):
+            bye_team = None
+            if tournament.teams:
+                matches, bye_team = decode_team_pairing(tournament, result)
+                bye_player = None
+            else:
+                matches, bye_player = decode_pairing(tournament, result)
+            rounds.append(
+                (
+                    Round(
+                        name=f"Round {tournament.current_round}",
+                        matches=matches,
+                        started_at=started_at,
+                        ended_at=None,
+                        bye_player_id=bye_player.id if bye_player else None,
+                        bye_team_id=bye_team.id if bye_team else None,
+                    ),
+                    bye_player,
+                )
+            )
+        return rounds
+
+    @staticmethod
+    def _encode(tournament: Tournament) -> PairingJob:
+        if tournament.teams:
+            return encode_team_pairing(tournament, tournament.current_round)
+        return encode_pairing(tournament, tournament.current_round)
+
+    @staticmethod
+    def _entrant_ids(tournament: Tournament) -> list[str]:
+        if tournament.teams:
+            return [team.id for team in tournament.teams]
+        return [player.id for player, _score in tournament.players]
 
-        return new_round, bye_player
+    def _run(
+        self, jobs: list[PairingJob], max_workers: int | None
+    ) -> list[PairingResult]:
+        if max_workers is None:
+            players = sum(len(job.scores) for job in jobs)
+            if players < PARALLEL_MIN_PLAYERS or (os.cpu_count() or 1) < 2:
+                max_workers = 1
+        if len(jobs) < 2 or max_workers == 1:
+            return [run_pairing(job) for job in jobs]
+        if self._executor is None:
+            # multiprocessing n'est chargé qu'au premier calcul parallèle
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._executor = ProcessPoolExecutor(max_workers)
+        return list(self._executor.map(run_pairing, jobs))
+
+    def shutdown(self) -> None:
+        """Arrêter les processus de calcul éventuellement démarrés."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def end_round(self, round_obj: Round) -> Round:
         """Enregistrer l'heure de fin d'un round."""
-        round_obj.ended_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        round_obj.ended_at = now()
         return round_obj
 
     def update_tournament_scores(
@@ -48,8 +155,45 @@ class RoundController:
     ) -> None:
         """Mettre à jour les scores des joueurs après un round."""
         for match in round_obj.matches:
-            for index, (player, _score) in enumerate(tournament.players):
-                if player.id == match.player1.id:
-                    tournament.players[index][1] += match.score1
-                elif player.id == match.player2.id:
-                    tournament.players[index][1] += match.score2
+            tournament.add_score(match.player1.id, match.score1)
+            tournament.add_score(match.player2.id, match.score2)
+
+    @staticmethod
+    def update_elimination(tournament: Tournament) -> None:
+        """Ajuste la fin d'un tournoi à élimination à ses résultats.
+
+        Le tournoi se termine dès qu'il ne reste qu'un joueur qualifié ;
+        sinon (par exemple après une correction), il dure au plus le
+        nombre de rounds prévu par son système.
+        """
+        system = pairing_system(tournament.pairing_system)
+        if system.max_losses is None:
+            return
+        qualified = sum(
+            1
+            for losses in count_losses(tournament)
+            if losses < system.max_losses
+        )
+        if qualified <= 1:
+            tournament.rounds_count = len(tournament.rounds)
+        else:
+            tournament.rounds_count = max(
+                system.rounds(len(tournament.players), 0),
+                len(tournament.rounds) + 1,
+            )
+
+    def close_round(self, tournament: Tournament, round_obj: Round) -> None:
+        """Clôturer un round saisi : scores, exempt et round suivant.
+
+        Un tournoi à élimination se termine dès qu'il ne reste qu'un
+        joueur qualifié.
+        """
+        system = pairing_system(tournament.pairing_system)
+        self.end_round(round_obj)
+        tournament.rounds.append(round_obj)
+        self.update_tournament_scores(tournament, round_obj)
+        if round_obj.bye_player_id:
+            tournament.record_bye(round_obj.bye_player_id, system.bye_points)
+        tournament.current_round += 1
+        self.update_elimination(tournament)
+        self.pairing_cache.discard(tournament.id)
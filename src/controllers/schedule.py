@@ -0,0 +1,158 @@
+"""ScheduleController - Planning des rounds et pendules en cours."""
+
+import threading
+from typing import Iterable
+
+from managers import ScheduleManager, TournamentManager
+from models import Round, Tournament
+from utils.clock_utils import RoundClock, now
+from utils.schedule_utils import NowIndex, ScheduledRound, Slot, plan_rounds
+
+
+class ScheduleController:
+    """Planifie les rounds des sections et suit les rounds en cours.
+
+    Le planning est persistant (``ScheduleManager``) ; les pendules des
+    rounds en cours sont en mémoire. À la clôture d'un round, son entrée
+    du planning est remplacée par ses heures réelles. L'index « en ce
+    moment » est reconstruit à la demande après chaque changement.
+    """
+
+    def __init__(
+        self,
+        manager: TournamentManager,
+        schedule_manager: ScheduleManager | None = None,
+    ) -> None:
+        self.manager = manager
+        self.schedule_manager = schedule_manager or ScheduleManager()
+        self._clocks: dict[str, tuple[int, RoundClock]] = {}
+        self._index: NowIndex | None = None
+        self._lock = threading.RLock()
+
+    def plan(
+        self,
+        tournament_ids: Iterable[str],
+        slots: Iterable[Slot],
+        capacity: int | None = None,
+    ) -> list[ScheduledRound]:
+        """Planifie les rounds non joués des tournois sur les créneaux.
+
+        Le planning existant de ces tournois est remplacé.
+        """
+        sections: dict[str, tuple[int, int]] = {}
+        for tournament_id in tournament_ids:
+            tournament = self.manager.find_by_id(tournament_id)
+            if tournament is None:
+                raise ValueError(f"Tournoi introuvable : {tournament_id}")
+            first = len(tournament.rounds) + 1
+            if tournament_id in self._clocks:
+                # Le round en cours garde son heure de début réelle
+                first += 1
+            if first <= tournament.rounds_count:
+                sections[tournament_id] = (first, tournament.rounds_count)
+        planned = plan_rounds(sections, slots, capacity)
+        with self._lock:
+            self.schedule_manager.replace(planned)
+            self._index = None
+        return planned
+
+    def start_round(
+        self, tournament: Tournament, round_num: int, round_obj: Round
+    ) -> RoundClock:
+        """Démarre la pendule d'un round qui vient d'être apparié."""
+        scheduled = self.schedule_manager.find(tournament.id, round_num)
+        clock = RoundClock(
+            round_obj.started_at, scheduled.end if scheduled else None
+        )
+        with self._lock:
+            self._clocks[tournament.id] = (round_num, clock)
+            self._index = None
+        return clock
+
+    def stop_round(self, tournament: Tournament, round_obj: Round) -> None:
+        """Arrête la pendule d'un round clôturé et note ses heures réelles."""
+        with self._lock:
+            running = self._clocks.pop(tournament.id, None)
+            self._index = None
+        if running is None or round_obj.started_at is None:
+            return
+        self.schedule_manager.record(
+            ScheduledRound(
+                round_obj.started_at,
+                round_obj.ended_at or now(),
+                tournament.id,
+                running[0],
+            )
+        )
+
+    def discard(self, tournament_id: str) -> None:
+        """Oublie le planning et la pendule d'un tournoi supprimé."""
+        with self._lock:
+            self._clocks.pop(tournament_id, None)
+            self.schedule_manager.discard(tournament_id)
+            self._index = None
+
+    def clock(self, tournament_id: str) -> tuple[int, RoundClock] | None:
+        """Round en cours d'un tournoi et sa pendule."""
+        return self._clocks.get(tournament_id)
+
+    def index(self) -> NowIndex:
+        """Index des rounds planifiés et en cours."""
+        with self._lock:
+            if self._index is None:
+                live = {
+                    (tournament_id, round_num): ScheduledRound(
+                        clock.started_at, None, tournament_id, round_num
+                    )
+                    for tournament_id, (round_num, clock) in (
+                        self._clocks.items()
+                    )
+                }
+                self._index = NowIndex(
+                    [
+                        scheduled
+                        for scheduled in self.schedule_manager.rounds
+                        if (scheduled.tournament_id, scheduled.round_num)
+                        not in live
+                    ]
+                    + list(live.values())
+                )
+            return self._index
+
+    def happening_now(self, instant: int | None = None) -> list[dict]:
+        """Rounds en cours à ``instant`` (par défaut maintenant)."""
+        instant = now() if instant is None else instant
+        return [
+            self._describe(scheduled)
+            for scheduled in self.index().at(instant)
+        ]
+
+    def upcoming(
+        self, instant: int | None = None, limit: int = 10
+    ) -> list[dict]:
+        """Prochains rounds planifiés."""
+        instant = now() if instant is None else instant
+        return [
+            self._describe(scheduled)
+            for scheduled in self.index().upcoming(instant, limit)
+        ]
+
+    def _describe(self, scheduled: ScheduledRound) -> dict:
+        entry = {
+            "tournament_id": scheduled.tournament_id,
+            "round": scheduled.round_num,
+            "start": scheduled.start,
+            "end": scheduled.end,
+            "live": False,
+            "elapsed": None,
+            "remaining": None,
+        }
+        running = self._clocks.get(scheduled.tournament_id)
+        if running is not None and running[0] == scheduled.round_num:
+            clock = running[1]
+            entry["live"] = True
+            entry["end"] = clock.deadline
+            entry["elapsed"] = int(clock.elapsed())
+            remaining = clock.remaining()
+            entry["remaining"] = None if remaining is None else int(remaining)
+        return entry
@@ -0,0 +1,385 @@
+"""ScoringController - Appariement et saisie des résultats sans interface."""
+
+import threading
+from typing import Callable
+
+from managers import PlayerStatsManager, ResultLogManager, TournamentManager
+from models import Player, Round, Tournament
+from utils.pairing_utils import pairing_system
+from utils.schedule_utils import build_slots
+from utils.team_utils import team_standings
+
+from .history import HistoryController
+from .match import VALID_RESULTS, MatchController
+from .round import RoundController
+from .schedule import ScheduleController
+from .standings import StandingsController
+
+
+class OpenRound:
+    """Round apparié dont les résultats sont en cours de saisie."""
+
+    def __init__(
+        self, number: int, round_obj: Round, bye_player: Player | None
+    ) -> None:
+        self.number = number
+        self.round = round_obj
+        self.bye_player = bye_player
+        self.submitted: set[int] = set()
+
+    @property
+    def is_complete(self) -> bool:
+        """Indique si tous les résultats ont été saisis."""
+        return len(self.submitted) == len(self.round.matches)
+
+
+class ScoringController:
+    """Opérations de tournoi pilotées par des requêtes (serveur de scores).
+
+    Contrairement à ``TournamentController``, un round reste ouvert entre
+    l'appariement et la saisie de ses résultats, qui peuvent arriver un à
+    un. Chaque résultat est journalisé avant d'être appliqué, et le round
+    est clôturé puis sauvegardé dès que tous ses résultats sont connus.
+
+    Les méthodes sont synchrones ; l'appelant sérialise les opérations
+    d'écriture d'un même tournoi.
+    """
+
+    def __init__(
+        self,
+        manager: TournamentManager | None = None,
+        round_controller: RoundController | None = None,
+        result_log: ResultLogManager | None = None,
+        stats_manager: PlayerStatsManager | None = None,
+        schedule: ScheduleController | None = None,
+    ) -> None:
+        self.manager = manager or TournamentManager()
+        self.match_controller = MatchController()
+        self.round_controller = round_controller or RoundController(
+            self.match_controller
+        )
+        self.result_log = result_log or ResultLogManager()
+        self.stats_manager = stats_manager or PlayerStatsManager()
+        self.standings_controller = StandingsController(self.match_controller)
+        self.history = HistoryController(
+            self.manager,
+            self.round_controller,
+            self.standings_controller,
+            self.stats_manager,
+        )
+        self.schedule = schedule or ScheduleController(self.manager)
+        self._tournaments: dict[str, Tournament] = {}
+        self._open_rounds: dict[str, OpenRound] = {}
+        self._load_lock = threading.Lock()
+
+    def tournament(self, tournament_id: str) -> Tournament:
+        """Tournoi chargé une fois puis conservé en mémoire."""
+        tournament = self._tournaments.get(tournament_id)
+        if tournament is not None:
+            return tournament
+        with self._load_lock:
+            tournament = self._tournaments.get(tournament_id)
+            if tournament is None:
+                tournament = self.manager.find_by_id(tournament_id)
+                if tournament is None:
+                    raise ValueError(
+                        f"Tournoi introuvable : {tournament_id}"
+                    )
+                self._tournaments[tournament_id] = tournament
+        return tournament
+
+    def pair_round(self, tournament_id: str) -> dict:
+        """Apparie le round courant (ou retourne le round déjà ouvert).
+
+        Les résultats journalisés avant un arrêt pour ce round sont
+        réappliqués aux matchs correspondants.
+        """
+        return self.pair_rounds([tournament_id])[tournament_id]
+
+    def pair_rounds(
+        self, tournament_ids: list[str], max_workers: int | None = None
+    ) -> dict[str, dict]:
+        """Apparie en parallèle le round courant de plusieurs tournois.
+
+        Voir ``RoundController.create_rounds`` ; les rounds déjà ouverts
+        sont retournés tels quels et un tournoi cité plusieurs fois n'est
+        apparié qu'une fois.
+        """
+        tournament_ids = list(dict.fromkeys(tournament_ids))
+        to_pair = []
+        for tournament_id in tournament_ids:
+            if tournament_id in self._open_rounds:
+                continue
+            tournament = self.tournament(tournament_id)
+            if tournament.current_round > tournament.rounds_count:
+                raise ValueError(f"Le tournoi {tournament_id} est terminé.")
+            to_pair.append(tournament)
+
+        created = self.round_controller.create_rounds(to_pair, max_workers)
+        pairings = {}
+        for tournament, (new_round, bye_player) in zip(to_pair, created):
+            pairings[tournament.id] = self._open(
+                tournament, new_round, bye_player
+            )
+        for tournament_id in tournament_ids:
+            if tournament_id not in pairings:
+                pairings[tournament_id] = self.pairings(tournament_id)
+        return pairings
+
+    def _open(
+        self,
+        tournament: Tournament,
+        new_round: Round,
+        bye_player: Player | None,
+    ) -> dict:
+        round_num = tournament.current_round
+        open_round = OpenRound(round_num, new_round, bye_player)
+        self._open_rounds[tournament.id] = open_round
+        self.standings_controller.open_round(tournament, round_num, new_round)
+        self.schedule.start_round(tournament, round_num, new_round)
+
+        recovered = self.result_log.replay(tournament.id, round_num)
+        for board, match in enumerate(new_round.matches, 1):
+            pair = (match.player1.id, match.player2.id)
+            if pair in recovered:
+                self.match_controller.update_match_scores(
+                    match, *recovered[pair]
+                )
+                open_round.submitted.add(board)
+        pairings = self.pairings(tournament.id)
+        if recovered and open_round.is_complete:
+            self._close(tournament, open_round)
+        return pairings
+
+    def pairings(self, tournament_id: str) -> dict:
+        """Matchs du round ouvert et résultats déjà saisis."""
+        open_round = self._open_rounds.get(tournament_id)
+        if open_round is None:
+            raise ValueError(
+                f"Aucun round ouvert pour le tournoi {tournament_id}."
+            )
+        return {
+            "tournament_id": tournament_id,
+            "round": open_round.number,
+            "bye": (
+                open_round.bye_player.id if open_round.bye_player else None
+            ),
+            "bye_team": open_round.round.bye_team_id,
+            "matches": [
+                {
+                    "board": board,
+                    "player1_id": match.player1.id,
+                    "player2_id": match.player2.id,
+                    "score1": match.score1,
+                    "score2": match.score2,
+                    "submitted": board in open_round.submitted,
+                }
+                for board, match in enumerate(open_round.round.matches, 1)
+            ],
+        }
+
+    def submit_result(
+        self, tournament_id: str, board: int, score1: float, score2: float
+    ) -> dict:
+        """Saisit le résultat d'un échiquier du round ouvert.
+
+        Un résultat peut être corrigé tant que le round est ouvert. Retourne
+        ``closed=True`` si ce résultat a clôturé le round.
+        """
+        open_round = self._open_rounds.get(tournament_id)
+        if open_round is None:
+            raise ValueError(
+                f"Aucun round ouvert pour le tournoi {tournament_id}."
+            )
+        if not 1 <= board <= len(open_round.round.matches):
+            raise ValueError(f"Échiquier invalide : {board}")
+        score1, score2 = float(score1), float(score2)
+        if (score1, score2) not in VALID_RESULTS:
+            raise ValueError(f"Résultat invalide : {score1} - {score2}")
+        tournament = self.tournament(tournament_id)
+        if score1 == score2 and not pairing_system(
+            tournament.pairing_system
+        ).allows_draws:
+            raise ValueError(
+                "Match nul impossible dans un tournoi à élimination."
+            )
+
+        match = open_round.round.matches[board - 1]
+        self.result_log.append(
+            tournament_id,
+            open_round.number,
+            match.player1.id,
+            match.player2.id,
+            score1,
+            score2,
+        )
+        self.match_controller.update_match_scores(match, score1, score2)
+        open_round.submitted.add(board)
+
+        closed = open_round.is_complete
+        if closed:
+            self._close(tournament, open_round)
+        return {
+            "tournament_id": tournament_id,
+            "round": open_round.number,
+            "board": board,
+            "closed": closed,
+        }
+
+    def subscribe(
+        self, tournament_id: str, listener: Callable[[dict], None]
+    ) -> dict:
+        """Abonne ``listener`` au classement en direct d'un tournoi.
+
+        Retourne l'état courant (``snapshot``) ; les événements suivants
+        ne contiennent que les lignes modifiées.
+        """
+        self.standings_controller.track(self.tournament(tournament_id))
+        return self.standings_controller.subscribe(tournament_id, listener)
+
+    def unsubscribe(
+        self, tournament_id: str, listener: Callable[[dict], None]
+    ) -> None:
+        """Désabonne ``listener`` du classement en direct."""
+        self.standings_controller.unsubscribe(tournament_id, listener)
+
+    def team_standings(self, tournament_id: str) -> list[dict]:
+        """Classement par équipes : points de match, puis d'échiquiers."""
+        tournament = self.tournament(tournament_id)
+        if not tournament.teams:
+            raise ValueError(
+                f"Le tournoi {tournament_id} n'est pas un tournoi par équipes."
+            )
+        return [
+            {
+                "rank": rank,
+                "team_id": standing.team.id,
+                "name": standing.team.name,
+                "match_points": standing.match_points,
+                "board_points": standing.board_points,
+            }
+            for rank, standing in enumerate(team_standings(tournament), 1)
+        ]
+
+    def amend_result(
+        self,
+        tournament_id: str,
+        round_num: int,
+        board: int,
+        score1: float,
+        score2: float,
+    ) -> dict:
+        """Corrige le résultat d'un échiquier d'un round clôturé.
+
+        Seuls les scores des deux joueurs et les départages qui en
+        dépendent sont mis à jour (voir ``HistoryController``).
+        """
+        tournament = self.tournament(tournament_id)
+        first = self.history.correct_result(
+            tournament, round_num, board, score1, score2
+        )
+        self.manager.flush()
+        return {
+            "tournament_id": tournament_id,
+            "round": round_num,
+            "board": board,
+            "recomputed_from": first,
+        }
+
+    def check_consistency(self, tournament_id: str) -> list[dict]:
+        """Écarts entre le classement stocké et celui des rounds."""
+        return [
+            drift._asdict()
+            for drift in self.history.check(self.tournament(tournament_id))
+        ]
+
+    def plan_schedule(
+        self,
+        tournament_ids: list[str],
+        first_start: int,
+        duration: int,
+        per_day: int,
+        days: int,
+        interval: int | None = None,
+        capacity: int | None = None,
+    ) -> list[dict]:
+        """Planifie les rounds restants des tournois (instants en epoch).
+
+        Voir ``build_slots`` pour les créneaux et ``plan_rounds`` pour
+        leur répartition entre sections.
+        """
+        slots = build_slots(first_start, duration, per_day, days, interval)
+        return [
+            {
+                "tournament_id": scheduled.tournament_id,
+                "round": scheduled.round_num,
+                "start": scheduled.start,
+                "end": scheduled.end,
+            }
+            for scheduled in self.schedule.plan(
+                tournament_ids, slots, capacity
+            )
+        ]
+
+    def happening_now(self, instant: int | None = None) -> dict:
+        """Rounds en cours, tous tournois confondus, et les suivants."""
+        return {
+            "now": self.schedule.happening_now(instant),
+            "upcoming": self.schedule.upcoming(instant),
+        }
+
+    def clock(self, tournament_id: str) -> dict | None:
+        """Pendule du round en cours d'un tournoi (``None`` sans round)."""
+        running = self.schedule.clock(tournament_id)
+        if running is None:
+            return None
+        round_num, clock = running
+        remaining = clock.remaining()
+        return {
+            "tournament_id": tournament_id,
+            "round": round_num,
+            "started_at": clock.started_at,
+            "deadline": clock.deadline,
+            "elapsed": int(clock.elapsed()),
+            "remaining": None if remaining is None else int(remaining),
+        }
+
+    def standings(self, tournament_id: str) -> list[dict]:
+        """Classement des rounds clôturés, du meilleur au moins bon.
+
+        À égalité de points : Buchholz, puis Sonneborn-Berger.
+        """
+        tournament = self.tournament(tournament_id)
+        tiebreaks = self.history.tiebreaks(tournament)
+        ranked = sorted(
+            tournament.players,
+            key=lambda entry: (
+                tiebreaks.sort_key(entry[0].id),
+                entry[0].lastname,
+                entry[0].id,
+            ),
+        )
+        return [
+            {
+                "rank": rank,
+                "player_id": player.id,
+                "name": f"{player.lastname} {player.firstname}",
+                "score": score,
+                "buchholz": tiebreaks.buchholz[player.id],
+                "sonneborn_berger": tiebreaks.sonneborn_berger[player.id],
+            }
+            for rank, (player, score) in enumerate(ranked, 1)
+        ]
+
+    def _close(self, tournament: Tournament, open_round: OpenRound) -> None:
+        self.round_controller.close_round(tournament, open_round.round)
+        self.schedule.stop_round(tournament, open_round.round)
+        self.standings_controller.close_round(tournament, open_round.round)
+        self.history.close_round(tournament)
+        self.stats_manager.record_round(
+            tournament.id, open_round.number, open_round.round.to_dict()
+        )
+        self.manager.save(tournament)
+        self.manager.flush()
+        self.result_log.clear(tournament.id)
+        del self._open_rounds[tournament.id]
@@ -0,0 +1,144 @@
+"""StandingsController - Classement en direct, diffusé par différences."""
+
+import threading
+from typing import Callable
+
+from models import Match, Round, Tournament
+from utils.standings_utils import LiveStandings
+
+from .match import MatchController
+
+StandingsListener = Callable[[dict], None]
+
+
+class StandingsController:
+    """Tient le classement en direct des tournois suivis.
+
+    Abonné aux saisies de ``MatchController``, il applique chaque résultat
+    (ou correction) du round ouvert au classement et publie uniquement les
+    lignes modifiées. Événements publiés ::
+
+        {"type": "snapshot", "tournament_id", "round", "standings": [...]}
+        {"type": "diff", "tournament_id", "round", "changes": [...]}
+
+    où chaque ligne vaut ``{"rank", "player_id", "score"}``.
+    """
+
+    def __init__(self, match_controller: MatchController) -> None:
+        self._standings: dict[str, LiveStandings] = {}
+        self._rounds: dict[str, int] = {}
+        self._matches: dict[int, str] = {}
+        self._listeners: dict[str, list[StandingsListener]] = {}
+        self._lock = threading.RLock()
+        match_controller.add_listener(self.on_match_scored)
+
+    def subscribe(
+        self, tournament_id: str, listener: StandingsListener
+    ) -> dict | None:
+        """Abonne ``listener`` et retourne l'état courant s'il existe."""
+        with self._lock:
+            self._listeners.setdefault(tournament_id, []).append(listener)
+            if tournament_id in self._standings:
+                return self._snapshot(tournament_id)
+        return None
+
+    def unsubscribe(
+        self, tournament_id: str, listener: StandingsListener
+    ) -> None:
+        """Désabonne ``listener``."""
+        with self._lock:
+            listeners = self._listeners.get(tournament_id, [])
+            if listener in listeners:
+                listeners.remove(listener)
+
+    def track(self, tournament: Tournament) -> None:
+        """Commence à suivre un tournoi (sans round ouvert)."""
+        with self._lock:
+            if tournament.id not in self._standings:
+                self._standings[tournament.id] = LiveStandings(
+                    self._scores(tournament)
+                )
+                self._rounds[tournament.id] = tournament.current_round
+
+    def open_round(
+        self, tournament: Tournament, round_num: int, round_obj: Round
+    ) -> None:
+        """Suit les matchs d'un round qui vient d'être apparié."""
+        with self._lock:
+            self._standings[tournament.id] = LiveStandings(
+                self._scores(tournament)
+            )
+            self._rounds[tournament.id] = round_num
+            for match in round_obj.matches:
+                self._matches[id(match)] = tournament.id
+            self._publish(tournament.id, self._snapshot(tournament.id))
+
+    def close_round(self, tournament: Tournament, round_obj: Round) -> None:
+        """Cesse de suivre un round clôturé.
+
+        Le classement est aligné sur les scores du tournoi (point de
+        l'exempt compris).
+        """
+        with self._lock:
+            for match in round_obj.matches:
+                self._matches.pop(id(match), None)
+            self.resync(tournament)
+
+    def resync(self, tournament: Tournament) -> None:
+        """Aligne un classement suivi sur les scores du tournoi.
+
+        Utilisé après une correction de résultat : seules les lignes
+        modifiées sont publiées.
+        """
+        with self._lock:
+            standings = self._standings.get(tournament.id)
+            if standings is None:
+                return
+            changes = standings.sync(self._scores(tournament))
+            if changes:
+                self._publish(
+                    tournament.id, self._diff(tournament.id, changes)
+                )
+
+    def on_match_scored(
+        self, match: Match, previous: tuple[float, float]
+    ) -> None:
+        """Applique une saisie de résultat au classement concerné."""
+        with self._lock:
+            tournament_id = self._matches.get(id(match))
+            if tournament_id is None:
+                return
+            changes = self._standings[tournament_id].apply(
+                {
+                    match.player1.id: match.score1 - previous[0],
+                    match.player2.id: match.score2 - previous[1],
+                }
+            )
+            if changes:
+                self._publish(
+                    tournament_id, self._diff(tournament_id, changes)
+                )
+
+    @staticmethod
+    def _scores(tournament: Tournament) -> dict[str, float]:
+        return {player.id: score for player, score in tournament.players}
+
+    def _snapshot(self, tournament_id: str) -> dict:
+        return {
+            "type": "snapshot",
+            "tournament_id": tournament_id,
+            "round": self._rounds[tournament_id],
+            "standings": self._standings[tournament_id].rows(),
+        }
+
+    def _diff(self, tournament_id: str, changes: list[dict]) -> dict:
+        return {
+            "type": "diff",
+            "tournament_id": tournament_id,
+            "round": self._rounds[tournament_id],
+            "changes": changes,
+        }
+
+    def _publish(self, tournament_id: str, event: dict) -> None:
+        for listener in list(self._listeners.get(tournament_id, [])):
+            listener(event)
@@ -1,16 +1,27 @@
 """TournamentController - Logique métier des tournois."""
 
-import re
-from datetime import datetime
-from random import shuffle
-
-from controllers.match import MatchController
-from controllers.round import RoundController
-from managers import PlayerManager, TournamentManager
-from models import Round, Tournament
-from views import TournamentView
+from datetime import date, datetime
+from functools import partial
+from typing import TYPE_CHECKING
+
+from controllers.pagination import Paginator
+from managers import (
+    LiveFeedManager,
+    PlayerManager,
+    PlayerStatsManager,
+    ResultLogManager,
+    TournamentManager,
+)
+from models import Player, Round, Team, Tournament
+from utils import validation_utils
+from utils.clock_utils import to_epoch
+from utils.pairing_utils import pairing_system
 from views.logger_view import LoggerView
 
+if TYPE_CHECKING:
+    from controllers.match import MatchController
+    from controllers.round import RoundController
+
 
 class TournamentController:
     """Controller orchestrant vues et managers pour les tournois."""
@@ -19,17 +30,40 @@ class TournamentController:
         self,
         manager: TournamentManager | None = None,
         player_manager: PlayerManager | None = None,
-        match_controller: MatchController | None = None,
-        round_controller: RoundController | None = None,
+        match_controller: "MatchController | None" = None,
+        round_controller: "RoundController | None" = None,
+        result_log: ResultLogManager | None = None,
+        stats_manager: PlayerStatsManager | None = None,
+        live_feed: LiveFeedManager | None = None,
     ) -> None:
+        # Appariement, historique, planning et classement en direct ne
+        # sont chargés qu'à l'instanciation, pas à l'import de l'application
+        from controllers.history import HistoryController
+        from controllers.match import MatchController
+        from controllers.round import RoundController
+        from controllers.schedule import ScheduleController
+        from controllers.standings import StandingsController
+        from views import TournamentView
+
         self.manager = manager or TournamentManager()
         self.player_manager = player_manager or PlayerManager()
+        self.result_log = result_log or ResultLogManager()
+        self.stats_manager = stats_manager or PlayerStatsManager()
         self.match_controller = match_controller or MatchController()
         self.round_controller = (
             round_controller
             if round_controller is not None
             else RoundController(self.match_controller)
         )
+        self.live_feed = live_feed or LiveFeedManager()
+        self.standings = StandingsController(self.match_controller)
+        self.history = HistoryController(
+            self.manager,
+            self.round_controller,
+            self.standings,
+            self.stats_manager,
+        )
+        self.schedule = ScheduleController(self.manager)
         self.view = TournamentView
 
     def manage_tournaments(self) -> None:
@@ -47,6 +81,12 @@ class TournamentController:
                 self.play_tournament()
             elif choice == "5":
                 self.delete_tournament()
+            elif choice == "6":
+                self.correct_results()
+            elif choice == "7":
+                self.manage_schedule()
+            elif choice == "8":
+                self.publish_results()
             elif choice == "0":
                 break
             else:
@@ -56,29 +96,33 @@ class TournamentController:
         """Crée un tournoi après validation."""
         tournament_data = self.view.prompt_new_tournament()
 
-        all_players = self.player_manager.find_all()
-        if len(all_players) < 2:
+        _, players_count = self.player_manager.find_page(0, 0)
+        if players_count < 2:
             LoggerView.error(
                 "Il faut au moins 2 joueurs enregistrés pour créer un tournoi."
             )
             return
 
-        selected_ids = self.view.prompt_select_players(all_players)
-        if len(selected_ids) < 2:
+        players = self._select_players()
+        if len(players) < 2:
             LoggerView.error(
                 "Vous devez sélectionner au moins 2 joueurs pour le tournoi."
             )
             return
 
-        players = [
-            player for player in all_players if player.id in selected_ids
-        ]
-        shuffle(players)
-
         try:
             rounds_count = int(tournament_data["rounds_count"])
         except ValueError:
             rounds_count = 4
+        teams = self._form_teams(
+            tournament_data["id"], players, tournament_data["team_size"]
+        )
+        if teams is None:
+            return
+        system = pairing_system(tournament_data["pairing_system"])
+        rounds_count = system.rounds(
+            len(teams) if teams else len(players), rounds_count
+        )
 
         if tournament_data["start_date"] == "":
             tournament_data["start_date"] = datetime.now().strftime("%Y-%m-%d")
@@ -97,6 +141,8 @@ class TournamentController:
             rounds_count=rounds_count,
             current_round=1,
             description=tournament_data["description"],
+            pairing_system=tournament_data["pairing_system"],
+            teams=teams,
         )
 
         is_valid, errors = TournamentController.validate_tournament(tournament)
@@ -121,15 +167,105 @@ class TournamentController:
                 "Sauvegarde non confirmée. Veuillez réessayer."
             )
 
+    def _form_teams(
+        self, tournament_id: str, players: list[Player], team_size: str
+    ) -> list[Team] | None:
+        """Répartit les joueurs sélectionnés en équipes, dans l'ordre.
+
+        Retourne une liste vide pour un tournoi individuel et ``None`` si
+        la répartition est impossible.
+        """
+        try:
+            size = int(team_size)
+        except ValueError:
+            size = 0
+        if size <= 0:
+            return []
+        if len(players) % size or len(players) < 2 * size:
+            LoggerView.error(
+                f"Il faut au moins deux équipes complètes de {size} joueurs."
+            )
+            return None
+        teams = []
+        for number, start in enumerate(range(0, len(players), size), 1):
+            members = players[start:start + size]
+            teams.append(
+                Team(
+                    id=f"{tournament_id}-E{number}",
+                    name=self.view.prompt_team_name(number, members),
+                    players=members,
+                )
+            )
+        return teams
+
+    def _select_players(self) -> list[Player]:
+        """Sélection paginée des joueurs ; seule la page visible est lue."""
+        paginator = Paginator(self.player_manager.find_page)
+        selected: dict[str, Player] = {}
+        while True:
+            paginator.load()
+            command = self.view.prompt_select_players(
+                paginator.items,
+                paginator.offset + 1,
+                paginator.page,
+                paginator.pages,
+                paginator.total,
+                paginator.query,
+                set(selected),
+            )
+            if paginator.handle(command):
+                continue
+            if not command:
+                return list(selected.values())
+            for number in command.split(","):
+                player = paginator.item_at(number)
+                if player is None:
+                    continue
+                if player.id in selected:
+                    del selected[player.id]
+                else:
+                    selected[player.id] = player
+
+    def _select_tournament(self) -> str | None:
+        """Sélection paginée d'un tournoi ; retourne son identifiant."""
+        paginator = Paginator(self.manager.find_page)
+        while True:
+            paginator.load()
+            selection = self.view.prompt_select_tournament(
+                paginator.items,
+                paginator.offset + 1,
+                paginator.page,
+                paginator.pages,
+                paginator.total,
+                paginator.query,
+            )
+            if paginator.handle(selection):
+                continue
+            tournament = paginator.item_at(selection)
+            return tournament.id if tournament else None
+
     def list_tournaments(self) -> None:
-        """Affiche la liste des tournois."""
-        tournaments = self.manager.find_all()
-        self.view.display_tournaments(tournaments)
+        """Affiche la liste des tournois, page par page."""
+        from views import PaginationView
+
+        paginator = Paginator(self.manager.find_page)
+        while True:
+            paginator.load()
+            self.view.display_tournaments(
+                paginator.items,
+                paginator.page,
+                paginator.pages,
+                paginator.total,
+                paginator.query,
+            )
+            if paginator.total == 0 and not paginator.query:
+                return
+            if not paginator.handle(PaginationView.prompt_command()):
+                return
 
     def delete_tournament(self) -> None:
         """Supprime un tournoi via son identifiant."""
-        tournaments = self.manager.find_all()
-        tournament_id = self.view.prompt_select_tournament(tournaments)
+        tournament_id = self._select_tournament()
 
         if not tournament_id:
             LoggerView.error("Aucun tournoi sélectionné.")
@@ -139,16 +275,73 @@ class TournamentController:
 
         if tournament:
             self.manager.delete(tournament_id)
+            self.stats_manager.remove_tournament(tournament_id)
+            self.schedule.discard(tournament_id)
             LoggerView.success("Tournoi supprimé avec succès !")
         else:
             LoggerView.error(
                 f"Aucun tournoi trouvé avec l'ID '{tournament_id}'."
             )
 
+    def manage_schedule(self) -> None:
+        """Affiche le planning et planifie les tournois non terminés."""
+        from utils.schedule_utils import build_slots
+
+        self.view.display_schedule(
+            self.schedule.happening_now(), self.schedule.upcoming()
+        )
+        if not self.view.confirm_action(
+            "Planifier les rounds des tournois non terminés ?"
+        ):
+            return
+        tournament_ids = [
+            tournament.id
+            for tournament in self.manager.find_all()
+            if tournament.current_round <= tournament.rounds_count
+        ]
+        if not tournament_ids:
+            LoggerView.warning("Aucun tournoi à planifier.")
+            return
+
+        settings = self.view.prompt_schedule_settings()
+        first_start = to_epoch(f"{settings['first_start']}:00")
+        if first_start is None:
+            LoggerView.error("Date invalide (YYYY-MM-DD HH:MM).")
+            return
+        try:
+            slots = build_slots(
+                first_start,
+                int(settings["duration"]) * 60,
+                int(settings["per_day"]),
+                int(settings["days"]),
+                int(settings["interval"]) * 60,
+            )
+            planned = self.schedule.plan(
+                tournament_ids,
+                slots,
+                int(settings["capacity"]) if settings["capacity"] else None,
+            )
+        except ValueError as exc:
+            LoggerView.error(str(exc))
+            return
+        LoggerView.success(f"{len(planned)} round(s) planifié(s).")
+        self.view.display_schedule(
+            self.schedule.happening_now(),
+            self.schedule.upcoming(first_start - 1, len(planned)),
+        )
+
+    def publish_results(self) -> None:
+        """Met à jour le site HTML des résultats (pages modifiées seules)."""
+        from controllers.publication import PublicationController
+
+        publication = PublicationController(self.manager, self.player_manager)
+        self.view.display_publication(
+            publication.publish(), publication.publication.site_dir
+        )
+
     def show_tournament_details(self) -> None:
         """Affiche les détails d'un tournoi."""
-        tournaments = self.manager.find_all()
-        tournament_id = self.view.prompt_select_tournament(tournaments)
+        tournament_id = self._select_tournament()
 
         if not tournament_id:
             LoggerView.error("Aucun tournoi sélectionné.")
@@ -156,17 +349,125 @@ class TournamentController:
 
         tournament = self.manager.find_by_id(tournament_id)
 
-        if tournament:
-            self.view.display_tournament_details(tournament)
-        else:
+        if not tournament:
+            LoggerView.error(
+                f"Aucun tournoi trouvé avec l'ID '{tournament_id}'."
+            )
+            return
+
+        self.view.display_tournament_details(tournament)
+        if tournament.rounds:
+            from utils.crosstable_utils import Crosstable
+
+            self.view.display_crosstable(Crosstable(tournament))
+            if self.view.confirm_action(
+                "Exporter la grille américaine (CSV et HTML) ?"
+            ):
+                self._export_crosstable(tournament)
+
+    def _export_crosstable(self, tournament: Tournament) -> None:
+        """Écrit la grille américaine dans ``data/reports``."""
+        from report import ReportGenerator
+
+        generator = ReportGenerator(tournament_manager=self.manager)
+        self.view.display_exported_files(
+            [
+                generator.generate_crosstable_report(tournament.id),
+                generator.generate_crosstable_html(tournament.id),
+            ]
+        )
+
+    def correct_results(self) -> None:
+        """Corrige les résultats des rounds joués, avec annulation."""
+        tournament_id = self._select_tournament()
+        if not tournament_id:
+            LoggerView.error("Aucun tournoi sélectionné.")
+            return
+        tournament = self.manager.find_by_id(tournament_id)
+        if not tournament:
             LoggerView.error(
                 f"Aucun tournoi trouvé avec l'ID '{tournament_id}'."
             )
+            return
+        if not tournament.rounds:
+            LoggerView.warning("Aucun round joué dans ce tournoi.")
+            return
+
+        while True:
+            history = self.history.history(tournament)
+            choice = self.view.corrections_menu(
+                history.can_undo, history.can_redo
+            )
+            if choice == "1":
+                self._correct_result(tournament)
+            elif choice == "2":
+                first = self.history.undo(tournament)
+                self.view.display_history_step("annulée", first)
+            elif choice == "3":
+                first = self.history.redo(tournament)
+                self.view.display_history_step("rétablie", first)
+            elif choice == "4":
+                self.view.display_rankings(
+                    tournament.players, self.history.tiebreaks(tournament)
+                )
+            elif choice == "5":
+                self._check_consistency(tournament)
+            elif choice == "0":
+                break
+            else:
+                LoggerView.warning("Choix invalide. Veuillez réessayer.")
+        self.manager.flush()
+
+    def _check_consistency(self, tournament: Tournament) -> None:
+        drifts = self.history.check(tournament)
+        self.view.display_drifts(drifts)
+        if drifts and self.view.confirm_action(
+            "Recalculer le classement à partir des rounds ?"
+        ):
+            self.history.repair(tournament)
+            LoggerView.success("Classement recalculé.")
+
+    def _correct_result(self, tournament: Tournament) -> None:
+        round_num = self.view.prompt_round_number(len(tournament.rounds))
+        round_obj = tournament.rounds[round_num - 1]
+        bye_team = tournament.team(round_obj.bye_team_id)
+        self.view.display_round_matches(
+            {
+                "matches": [
+                    {
+                        "player1": match.player1.to_dict(),
+                        "player2": match.player2.to_dict(),
+                        "score1": match.score1,
+                        "score2": match.score2,
+                    }
+                    for match in round_obj.matches
+                ],
+                "bye_team": bye_team.name if bye_team else None,
+            },
+            round_num,
+        )
+        board = self.view.prompt_board_number(len(round_obj.matches))
+        match = round_obj.matches[board - 1]
+        score1, score2 = self.view.prompt_match_result(
+            board,
+            f"{match.player1.lastname} {match.player1.firstname}",
+            f"{match.player2.lastname} {match.player2.firstname}",
+            pairing_system(tournament.pairing_system).allows_draws,
+        )
+        try:
+            first = self.history.correct_result(
+                tournament, round_num, board, score1, score2
+            )
+        except ValueError as exc:
+            LoggerView.error(str(exc))
+            return
+        self.view.display_result_corrected(round_num, board, first)
 
     def play_tournament(self) -> None:
         """Gère le déroulement d'un tournoi."""
-        tournaments = self.manager.find_all()
-        tournament_id = self.view.prompt_select_tournament(tournaments)
+        from utils.team_utils import team_standings
+
+        tournament_id = self._select_tournament()
 
         if not tournament_id:
             LoggerView.error("Aucun tournoi sélectionné.")
@@ -183,8 +484,14 @@ class TournamentController:
         if tournament.current_round > tournament.rounds_count:
             self.view.display_tournament_already_finished()
             self.view.display_rankings(tournament.players)
+            if tournament.teams:
+                self.view.display_team_standings(team_standings(tournament))
             return
 
+        # Classement en direct, suivi par les écrans via le flux du tournoi
+        feed = partial(self.live_feed.publish, tournament.id)
+        self.standings.subscribe(tournament.id, feed)
+
         while tournament.current_round <= tournament.rounds_count:
             self.view.display_tournament_round_banner(
                 tournament.name,
@@ -192,24 +499,55 @@ class TournamentController:
                 tournament.rounds_count,
             )
 
-            choice = self.view.play_tournament_menu()
+            choice = self.view.play_tournament_menu(bool(tournament.teams))
 
             if choice == "1":
                 self._play_round(tournament)
                 self.manager.save(tournament)
+                if not self.manager.has_pending(tournament.id):
+                    self.result_log.clear(tournament.id)
             elif choice == "2":
-                self.view.display_rankings(tournament.players)
+                self.view.display_rankings(
+                    tournament.players, self.history.tiebreaks(tournament)
+                )
             elif choice == "3":
                 self.view.display_tournament_details(tournament)
+            elif choice == "4":
+                self.preview_round(tournament)
+            elif choice == "5" and tournament.teams:
+                self.view.display_team_standings(team_standings(tournament))
             elif choice == "0":
                 self.manager.save(tournament)
                 break
             else:
                 LoggerView.warning("Choix invalide. Veuillez réessayer.")
 
+        # Écriture durable des sauvegardes éventuellement différées
+        self.manager.flush()
+        self.result_log.clear(tournament.id)
+        self.standings.unsubscribe(tournament.id, feed)
+
         if tournament.current_round > tournament.rounds_count:
             self.view.display_tournament_finished()
             self.view.display_rankings(tournament.players)
+            if tournament.teams:
+                self.view.display_team_standings(team_standings(tournament))
+
+    def preview_round(self, tournament: Tournament) -> None:
+        """Affiche les appariements du prochain round sans le jouer.
+
+        L'appariement est mis en cache : jouer ensuite le round reprend
+        exactement ces matchs.
+        """
+        new_round, bye_player = self.round_controller.create_round(
+            tournament, tournament.current_round
+        )
+        self.view.display_pairings_preview(
+            tournament.current_round,
+            new_round.matches,
+            bye_player,
+            tournament.team(new_round.bye_team_id),
+        )
 
     def _play_round(self, tournament: Tournament) -> None:
         """Joue un round et met à jour le tournoi."""
@@ -224,25 +562,45 @@ class TournamentController:
             round_num,
         )
 
+        self.standings.open_round(tournament, round_num, new_round)
+        clock = self.schedule.start_round(tournament, round_num, new_round)
         self.view.display_round_banner(round_num)
+        self.view.display_round_clock(clock)
 
         if bye_player:
             self.view.display_bye_message(bye_player)
+        bye_team = tournament.team(new_round.bye_team_id)
+        if bye_team:
+            self.view.display_bye_team_message(bye_team)
+
+        # Résultats saisis avant un arrêt brutal pendant ce round
+        recovered = self.result_log.replay(tournament.id, round_num)
+        if recovered:
+            self.view.display_results_recovered(len(recovered))
 
+        allow_draw = pairing_system(tournament.pairing_system).allows_draws
         updated_matches = []
         for index, match in enumerate(new_round.matches, 1):
-            player1_name = (
-                f"{match.player1.lastname} {match.player1.firstname}"
-            )
-            player2_name = (
-                f"{match.player2.lastname} {match.player2.firstname}"
-            )
-
-            score1, score2 = self.view.prompt_match_result(
-                index,
-                player1_name,
-                player2_name,
-            )
+            pair = (match.player1.id, match.player2.id)
+            if pair in recovered:
+                score1, score2 = recovered[pair]
+            else:
+                player1_name = (
+                    f"{match.player1.lastname} {match.player1.firstname}"
+                )
+                player2_name = (
+                    f"{match.player2.lastname} {match.player2.firstname}"
+                )
+
+                score1, score2 = self.view.prompt_match_result(
+                    index,
+                    player1_name,
+                    player2_name,
+                    allow_draw,
+                )
+                self.result_log.append(
+                    tournament.id, round_num, *pair, score1, score2
+                )
 
             self.match_controller.update_match_scores(match, score1, score2)
             updated_matches.append(match)
@@ -252,24 +610,22 @@ class TournamentController:
             matches=updated_matches,
             started_at=new_round.started_at,
             ended_at=None,
+            bye_player_id=new_round.bye_player_id,
+            bye_team_id=new_round.bye_team_id,
         )
 
-        self.round_controller.end_round(round_with_matches)
-        tournament.rounds.append(round_with_matches)
-        self.round_controller.update_tournament_scores(
-            tournament,
-            round_with_matches,
+        self.round_controller.close_round(tournament, round_with_matches)
+        self.schedule.stop_round(tournament, round_with_matches)
+        self.standings.close_round(tournament, round_with_matches)
+        self.history.close_round(tournament)
+        self.stats_manager.record_round(
+            tournament.id, round_num, round_with_matches.to_dict()
         )
 
         if bye_player:
-            for index, (player, score) in enumerate(tournament.players):
-                if player.id == bye_player.id:
-                    tournament.players[index][1] += 1.0
-                    self.view.display_bye_points_awarded(bye_player)
-                    break
+            self.view.display_bye_points_awarded(bye_player)
 
-        tournament.current_round += 1
-        self.view.display_round_completed(round_num)
+        self.view.display_round_completed(round_num, clock)
 
     @staticmethod
     def validate_tournament(tournament: Tournament) -> tuple[bool, list[str]]:
@@ -307,6 +663,9 @@ class TournamentController:
         if not players_valid:
             errors.extend(player_errors)
 
+        # Valider la composition des équipes
+        errors.extend(validation_utils.team_errors(tournament.to_dict()))
+
         return len(errors) == 0, errors
 
     @staticmethod
@@ -317,56 +676,22 @@ class TournamentController:
         :return: tuple[bool, str | None] - (True, None) si valide, sinon
             (False, message d'erreur)
         """
-        if not re.match(r"^[A-Z]{2}\d{5}$", tournament_id):
-            return (
-                False,
-                "Format d'identifiant invalide. Exemple : AB12345.",
-            )
-        return True, None
+        error = validation_utils.validate_id(tournament_id)
+        return error is None, error
 
     @staticmethod
     def validate_dates(
-        start_date: str,
-        end_date: str,
+        start_date: date | str,
+        end_date: date | str,
     ) -> tuple[bool, list[str]]:
         """
         Valide les dates d'un tournoi
-        :param start_date: str - Date de début (YYYY-MM-DD)
-        :param end_date: str - Date de fin (YYYY-MM-DD)
+        :param start_date: date | str - Date de début (YYYY-MM-DD)
+        :param end_date: date | str - Date de fin (YYYY-MM-DD)
         :return: tuple[bool, list[str]] - (True, []) si valide, sinon
             (False, [messages d'erreur])
         """
-        errors: list[str] = []
-        date_regex = r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$"
-
-        effective_start = start_date or datetime.now().strftime("%Y-%m-%d")
-        effective_end = end_date or datetime.now().strftime("%Y-%m-%d")
-
-        # Vérifier le format de la date de début
-        if start_date and not re.match(date_regex, start_date):
-            errors.append(
-                "Format de date de début invalide. Attendu : YYYY-MM-DD."
-            )
-
-        # Vérifier le format de la date de fin
-        if end_date and not re.match(date_regex, end_date):
-            errors.append(
-                "Format de date de fin invalide. Attendu : YYYY-MM-DD."
-            )
-
-        # En l'absence d'erreur de format, vérifier que end_date >= start_date
-        if not errors:
-            try:
-                start = datetime.strptime(effective_start, "%Y-%m-%d")
-                end = datetime.strptime(effective_end, "%Y-%m-%d")
-                if end < start:
-                    errors.append(
-                        "La date de fin doit être postérieure ou égale à la"
-                        " date de début."
-                    )
-            except ValueError:
-                errors.append("Valeurs de date invalides.")
-
+        errors = validation_utils.validate_dates(start_date, end_date)
         return len(errors) == 0, errors
 
     @staticmethod
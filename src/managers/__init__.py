@@ -1,9 +1,53 @@
-"""Managers package regroupant orchestration et accès aux données."""
+"""Managers package regroupant orchestration et accès aux données.
 
-from .player_manager import PlayerManager
-from .tournament_manager import TournamentManager
+Les sous-modules sont importés à la première utilisation d'un nom exporté
+(PEP 562) : ``from managers import TournamentManager`` ne charge pas les
+managers du planning, du flux en direct ou de la publication.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .live_feed_manager import LiveFeedManager
+    from .pairing_cache_manager import PairingCacheManager
+    from .player_manager import PlayerManager, PlayerReferencedError
+    from .player_stats_manager import PlayerStatsManager
+    from .publication_manager import PublicationManager
+    from .result_log_manager import ResultLogManager
+    from .schedule_manager import ScheduleManager
+    from .tournament_manager import TournamentManager
+
+_EXPORTS = {
+    "LiveFeedManager": ".live_feed_manager",
+    "PairingCacheManager": ".pairing_cache_manager",
+    "PlayerManager": ".player_manager",
+    "PlayerReferencedError": ".player_manager",
+    "PlayerStatsManager": ".player_stats_manager",
+    "PublicationManager": ".publication_manager",
+    "ResultLogManager": ".result_log_manager",
+    "ScheduleManager": ".schedule_manager",
+    "TournamentManager": ".tournament_manager",
+}
 
 __all__ = [
+    "LiveFeedManager",
+    "PairingCacheManager",
     "PlayerManager",
+    "PlayerReferencedError",
+    "PlayerStatsManager",
+    "PublicationManager",
+    "ResultLogManager",
+    "ScheduleManager",
     "TournamentManager",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Importe le sous-module fournissant ``name`` au premier accès."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
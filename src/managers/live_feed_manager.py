@@ -0,0 +1,28 @@
+"""LiveFeedManager - Flux du classement en direct pour les écrans."""
+
+import os
+
+from utils import append_json_line
+
+
+LIVE_FEED_DIR = "data/live"
+
+
+class LiveFeedManager:
+    """Écrit les événements de classement dans un fichier par tournoi.
+
+    Format JSON Lines (un événement par ligne, voir
+    ``StandingsController``), à suivre par exemple avec
+    ``tail -f data/live/<id>.jsonl``.
+    """
+
+    def __init__(self, feed_dir: str = LIVE_FEED_DIR) -> None:
+        self.feed_dir = feed_dir
+
+    def path(self, tournament_id: str) -> str:
+        """Chemin du flux d'un tournoi."""
+        return os.path.join(self.feed_dir, f"{tournament_id}.jsonl")
+
+    def publish(self, tournament_id: str, event: dict) -> None:
+        """Ajoute un événement au flux du tournoi."""
+        append_json_line(self.path(tournament_id), event, sync=False)
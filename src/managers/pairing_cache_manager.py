@@ -0,0 +1,72 @@
+"""PairingCacheManager - Cache persistant des appariements calculés."""
+
+import threading
+from array import array
+from typing import Iterable
+
+from utils import load_json, save_json
+from utils.pairing_utils import PairingResult
+
+
+PAIRING_CACHE_PATH = "data/pairings.json"
+
+
+class PairingCacheManager:
+    """Appariements indexés par l'empreinte de l'état du tournoi.
+
+    Un aperçu puis sa confirmation, ou une reprise après un arrêt, retrouvent
+    ainsi exactement le même appariement sans le recalculer. Les entrées
+    d'un tournoi sont retirées à la clôture de son round.
+    """
+
+    def __init__(self, storage_path: str = PAIRING_CACHE_PATH) -> None:
+        self.storage_path = storage_path
+        self._entries: dict[str, dict] | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def entries(self) -> dict[str, dict]:
+        """Entrées chargées : empreinte -> appariement."""
+        with self._lock:
+            if self._entries is None:
+                self._entries = load_json(self.storage_path, default={})
+            return self._entries
+
+    def get(self, state_hash: str) -> PairingResult | None:
+        """Appariement mis en cache pour un état, s'il existe."""
+        entry = self.entries.get(state_hash)
+        if entry is None:
+            return None
+        return PairingResult(
+            entry["tournament_id"], array("i", entry["pairs"]), entry["bye"]
+        )
+
+    def put_many(
+        self, items: Iterable[tuple[str, int, PairingResult]]
+    ) -> None:
+        """Enregistre des appariements ``(empreinte, round, résultat)``."""
+        with self._lock:
+            for state_hash, round_num, result in items:
+                self.entries[state_hash] = {
+                    "tournament_id": result.key,
+                    "round": round_num,
+                    "pairs": result.pairs.tolist(),
+                    "bye": result.bye,
+                }
+            self._write()
+
+    def discard(self, tournament_id: str) -> None:
+        """Retire les appariements d'un tournoi."""
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self.entries.items()
+                if entry["tournament_id"] == tournament_id
+            ]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self._write()
+
+    def _write(self) -> None:
+        save_json(self.storage_path, self.entries)
@@ -2,41 +2,191 @@
 PlayerManager - Gestion des opérations de persistance des joueurs.
 """
 
+import os
+from itertools import islice
+from typing import TYPE_CHECKING
+
 from models import Player
-from utils import load_json, save_json
+from utils import (
+    PlayerSearchIndex,
+    file_signature,
+    instrumented,
+    load_json,
+    save_json,
+)
+
+from .tournament_manager import TournamentManager
+
+if TYPE_CHECKING:
+    from utils.dedup_utils import DuplicateCandidate
 
 
 PLAYERS_PATH = "data/players.json"
 
+# Index partagés par fichier : (signature du fichier, index)
+_INDEXES: dict[str, tuple[tuple[int, int], PlayerSearchIndex]] = {}
+
+
+class PlayerReferencedError(ValueError):
+    """Suppression refusée : le joueur figure encore dans des tournois."""
+
+    def __init__(self, player_id: str, tournaments: dict[str, int]) -> None:
+        listing = ", ".join(sorted(tournaments))
+        super().__init__(
+            f"Le joueur {player_id} est référencé par "
+            f"{len(tournaments)} tournoi(s) : {listing}"
+        )
+        self.player_id = player_id
+        self.tournaments = tournaments
+
 
 class PlayerManager:
-    """Gestionnaire de données pour les joueurs."""
+    """Gestionnaire de données pour les joueurs.
+
+    Les joueurs sont servis depuis un index en mémoire construit une fois
+    par fichier, mis à jour par ``save``/``delete`` et reconstruit si le
+    fichier est modifié par ailleurs. Les doublons (même personne sous
+    deux identifiants) sont détectés par ``find_duplicates`` et réunis
+    par ``merge``.
+    """
 
     def __init__(self, storage_path: str = PLAYERS_PATH) -> None:
         self.storage_path = storage_path
 
+    @property
+    def index(self) -> PlayerSearchIndex:
+        """Index de recherche des joueurs du fichier courant."""
+        key = os.path.abspath(self.storage_path)
+        signature = file_signature(self.storage_path)
+        cached = _INDEXES.get(key)
+        if cached is None or cached[0] != signature:
+            data = load_json(self.storage_path, default=[])
+            cached = (signature, PlayerSearchIndex(data))
+            _INDEXES[key] = cached
+        return cached[1]
+
+    def _write(self, index: PlayerSearchIndex) -> None:
+        save_json(self.storage_path, list(index.records.values()))
+        _INDEXES[os.path.abspath(self.storage_path)] = (
+            file_signature(self.storage_path),
+            index,
+        )
+
     def save(self, player: Player) -> None:
         """Sauvegarde un joueur dans le stockage."""
-        data = load_json(self.storage_path, default=[])
-        data = [p for p in data if p["id"] != player.id]
-        data.append(player.to_dict())
-        save_json(self.storage_path, data)
+        index = self.index
+        index.add(player.to_dict())
+        self._write(index)
 
+    @instrumented("PlayerManager.find_all")
     def find_all(self) -> list[Player]:
         """Retourne tous les joueurs persistés."""
-        data = load_json(self.storage_path, default=[])
-        return [Player(**p) for p in data]
+        return [Player(**p) for p in self.index.records.values()]
+
+    @instrumented("PlayerManager.find_page")
+    def find_page(
+        self, offset: int, limit: int, query: str = ""
+    ) -> tuple[list[Player], int]:
+        """Retourne une page de joueurs et le nombre total de résultats.
+
+        Seuls les joueurs de la page sont instanciés ; ``query`` est
+        recherché par préfixe puis approximativement (voir ``search``).
+        """
+        index = self.index
+        if query:
+            ids = index.search(query, limit=None)
+            page = [index.records[player_id] for player_id in ids]
+            total = len(ids)
+            page = page[offset:offset + limit]
+        else:
+            total = len(index)
+            page = list(
+                islice(index.records.values(), offset, offset + limit)
+            )
+        return [Player(**p) for p in page], total
 
+    @instrumented("PlayerManager.search")
+    def search(
+        self, query: str, limit: int | None = 20, fuzzy: bool = True
+    ) -> list[Player]:
+        """Recherche des joueurs par identifiant, nom ou prénom.
+
+        Les correspondances par préfixe viennent en premier, complétées si
+        ``fuzzy`` par une recherche approximative (fautes de frappe).
+        """
+        index = self.index
+        return [
+            Player(**index.records[player_id])
+            for player_id in index.search(query, limit, fuzzy)
+        ]
+
+    @instrumented("PlayerManager.find_by_id")
     def find_by_id(self, player_id: str) -> Player | None:
         """Recherche un joueur par identifiant."""
-        data = load_json(self.storage_path, default=[])
-        for player_dict in data:
-            if player_dict["id"] == player_id:
-                return Player(**player_dict)
-        return None
-
-    def delete(self, player_id: str) -> None:
-        """Supprime un joueur grâce à son identifiant."""
-        data = load_json(self.storage_path, default=[])
-        data = [p for p in data if p["id"] != player_id]
-        save_json(self.storage_path, data)
+        record = self.index.get(player_id)
+        return Player(**record) if record else None
+
+    def delete(
+        self,
+        player_id: str,
+        cascade: bool = False,
+        tournament_manager: TournamentManager | None = None,
+    ) -> None:
+        """Supprime un joueur grâce à son identifiant.
+
+        Si des tournois le référencent, la suppression est refusée
+        (``PlayerReferencedError``) sauf avec ``cascade=True`` : le joueur
+        est alors d'abord retiré de ces tournois (``ValueError`` si une
+        équipe deviendrait incomplète).
+        """
+        tournaments = tournament_manager or TournamentManager()
+        references = tournaments.player_tournaments(player_id)
+        if references:
+            if not cascade:
+                raise PlayerReferencedError(player_id, references)
+            tournaments.remove_player(player_id)
+
+        index = self.index
+        index.remove(player_id)
+        self._write(index)
+
+    @instrumented("PlayerManager.find_duplicates")
+    def find_duplicates(
+        self, threshold: float | None = None
+    ) -> list["DuplicateCandidate"]:
+        """Paires de joueurs probablement en double (voir ``dedup_utils``).
+
+        ``threshold`` vaut par défaut ``DUPLICATE_THRESHOLD``.
+        """
+        from utils.dedup_utils import DUPLICATE_THRESHOLD, find_duplicates
+
+        return find_duplicates(
+            self.index.records.values(),
+            DUPLICATE_THRESHOLD if threshold is None else threshold,
+        )
+
+    def merge(
+        self,
+        duplicate_id: str,
+        keep_id: str,
+        tournament_manager: TournamentManager | None = None,
+    ) -> list[str]:
+        """Fusionne ``duplicate_id`` dans ``keep_id``.
+
+        Les tournois du doublon sont réécrits en une passe pour désigner
+        ``keep_id``, puis le doublon est supprimé. Retourne les
+        identifiants des tournois modifiés.
+        """
+        index = self.index
+        for player_id in (duplicate_id, keep_id):
+            if player_id not in index:
+                raise ValueError(f"Joueur introuvable : {player_id}")
+        if duplicate_id == keep_id:
+            raise ValueError("Un joueur ne peut être fusionné avec lui-même")
+
+        tournaments = tournament_manager or TournamentManager()
+        merged = tournaments.merge_player(duplicate_id, keep_id)
+        index = self.index
+        index.remove(duplicate_id)
+        self._write(index)
+        return merged
@@ -0,0 +1,88 @@
+"""PlayerStatsManager - Persistance des agrégats de carrière des joueurs."""
+
+import os
+import threading
+
+from utils import instrumented, load_json, save_json
+from utils.career_utils import CareerStats
+
+from .tournament_manager import TOURNAMENTS_PATH
+
+
+PLAYER_STATS_PATH = "data/player_stats.json"
+
+
+class PlayerStatsManager:
+    """Stocke les agrégats de carrière (parties, résultats, adversaires).
+
+    Le fichier est construit une fois à partir de l'archive des tournois
+    s'il n'existe pas, puis tenu à jour round par round ; un profil de
+    joueur se lit alors sans parcourir les tournois.
+    """
+
+    def __init__(
+        self,
+        storage_path: str = PLAYER_STATS_PATH,
+        tournaments_path: str = TOURNAMENTS_PATH,
+    ) -> None:
+        self.storage_path = storage_path
+        self.tournaments_path = tournaments_path
+        self._stats: CareerStats | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def stats(self) -> CareerStats:
+        """Agrégats chargés (ou construits depuis l'archive)."""
+        with self._lock:
+            if self._stats is None:
+                if os.path.exists(self.storage_path):
+                    self._stats = CareerStats.from_dict(
+                        load_json(self.storage_path, default={})
+                    )
+                else:
+                    self._stats = self.rebuild()
+            return self._stats
+
+    @instrumented("PlayerStatsManager.rebuild")
+    def rebuild(self) -> CareerStats:
+        """Recalcule tous les agrégats depuis l'archive des tournois."""
+        stats = CareerStats()
+        for entry in load_json(self.tournaments_path, default=[]):
+            stats.add_tournament(entry)
+        with self._lock:
+            self._stats = stats
+            self._write()
+        return stats
+
+    def record_round(
+        self, tournament_id: str, round_number: int, round_data: dict
+    ) -> None:
+        """Ajoute un round clôturé (``Round.to_dict``) aux agrégats.
+
+        Un round déjà comptabilisé n'est pas compté deux fois.
+        """
+        with self._lock:
+            if self.stats.apply_round(
+                tournament_id, round_number, round_data
+            ):
+                self._write()
+
+    def refresh_tournament(self, entry: dict) -> None:
+        """Recompte un tournoi (JSON ``Tournament.to_dict``) corrigé."""
+        with self._lock:
+            self.stats.remove_tournament(entry["id"])
+            self.stats.add_tournament(entry)
+            self._write()
+
+    def remove_tournament(self, tournament_id: str) -> None:
+        """Retire la contribution d'un tournoi supprimé."""
+        with self._lock:
+            self.stats.remove_tournament(tournament_id)
+            self._write()
+
+    def find_by_player(self, player_id: str) -> dict | None:
+        """Agrégats d'un joueur : ``total`` et détail ``tournaments``."""
+        return self.stats.career(player_id)
+
+    def _write(self) -> None:
+        save_json(self.storage_path, self.stats.to_dict())
@@ -0,0 +1,63 @@
+"""PublicationManager - Pages HTML du site de résultats."""
+
+import os
+from typing import Iterable
+
+from utils import load_json, save_json
+
+
+SITE_DIR = "data/site"
+MANIFEST_NAME = "manifest.json"
+
+
+class PublicationManager:
+    """Écrit les pages du site et leur manifeste d'empreintes.
+
+    Le manifeste associe à chaque tournoi l'empreinte de ses données et
+    celle de chacune de ses pages, afin de ne réécrire que les pages dont
+    le contenu a changé depuis la dernière publication.
+    """
+
+    def __init__(self, site_dir: str = SITE_DIR) -> None:
+        self.site_dir = site_dir
+        self.manifest_path = os.path.join(site_dir, MANIFEST_NAME)
+        self._manifest: dict | None = None
+
+    @property
+    def manifest(self) -> dict:
+        """Manifeste chargé : ``tournaments`` et ``pages`` (hors tournoi)."""
+        if self._manifest is None:
+            self._manifest = load_json(self.manifest_path, default={})
+            self._manifest.setdefault("tournaments", {})
+            self._manifest.setdefault("pages", {})
+        return self._manifest
+
+    def exists(self, path: str) -> bool:
+        """Indique si une page est présente sur le disque."""
+        return os.path.isfile(os.path.join(self.site_dir, path))
+
+    def write_page(self, path: str, html: str) -> None:
+        """Écrit une page (chemin relatif au dossier du site)."""
+        target = os.path.join(self.site_dir, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "w", encoding="utf-8") as handle:
+            handle.write(html)
+
+    def remove_pages(self, paths: Iterable[str]) -> None:
+        """Supprime des pages, puis leurs dossiers devenus vides."""
+        folders = set()
+        for path in paths:
+            target = os.path.join(self.site_dir, path)
+            try:
+                os.remove(target)
+            except FileNotFoundError:
+                pass
+            folders.add(os.path.dirname(target))
+        for folder in folders:
+            if folder != self.site_dir and os.path.isdir(folder):
+                if not os.listdir(folder):
+                    os.rmdir(folder)
+
+    def save_manifest(self) -> None:
+        """Enregistre le manifeste des empreintes."""
+        save_json(self.manifest_path, self.manifest)
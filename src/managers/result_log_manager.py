@@ -0,0 +1,68 @@
+"""ResultLogManager - Journal d'écriture anticipée des résultats de match."""
+
+import os
+
+from utils import append_json_line, load_json_lines
+
+
+RESULT_LOG_DIR = "data/wal"
+
+
+class ResultLogManager:
+    """Journalise chaque résultat saisi avant la clôture du round.
+
+    Un fichier JSON Lines par tournoi : chaque résultat y est ajouté et
+    synchronisé sur disque dès sa saisie. Au redémarrage, les résultats du
+    round en cours sont rejoués ; le journal est vidé une fois le tournoi
+    sauvegardé.
+    """
+
+    def __init__(self, log_dir: str = RESULT_LOG_DIR) -> None:
+        self.log_dir = log_dir
+
+    def _path(self, tournament_id: str) -> str:
+        return os.path.join(self.log_dir, f"{tournament_id}.jsonl")
+
+    def append(
+        self,
+        tournament_id: str,
+        round_num: int,
+        player1_id: str,
+        player2_id: str,
+        score1: float,
+        score2: float,
+    ) -> None:
+        """Enregistre durablement le résultat d'un match."""
+        append_json_line(
+            self._path(tournament_id),
+            {
+                "round": round_num,
+                "player1_id": player1_id,
+                "player2_id": player2_id,
+                "score1": score1,
+                "score2": score2,
+            },
+        )
+
+    def replay(
+        self, tournament_id: str, round_num: int
+    ) -> dict[tuple[str, str], tuple[float, float]]:
+        """Retourne les résultats journalisés pour un round donné.
+
+        Les entrées d'autres rounds (journal périmé) sont ignorées ; en cas
+        de doublon, la dernière saisie l'emporte.
+        """
+        results: dict[tuple[str, str], tuple[float, float]] = {}
+        for record in load_json_lines(self._path(tournament_id)):
+            if record.get("round") != round_num:
+                continue
+            key = (record["player1_id"], record["player2_id"])
+            results[key] = (record["score1"], record["score2"])
+        return results
+
+    def clear(self, tournament_id: str) -> None:
+        """Supprime le journal d'un tournoi."""
+        try:
+            os.remove(self._path(tournament_id))
+        except FileNotFoundError:
+            pass
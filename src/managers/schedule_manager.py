@@ -0,0 +1,114 @@
+"""ScheduleManager - Persistance du planning des rounds."""
+
+import threading
+from typing import Iterable
+
+from utils import load_json, save_json
+from utils.schedule_utils import ScheduledRound
+
+
+SCHEDULE_PATH = "data/schedule.json"
+
+
+class ScheduleManager:
+    """Rounds planifiés de l'événement, toutes sections confondues.
+
+    Chaque entrée associe un round d'un tournoi à son créneau (epochs) ;
+    replanifier un tournoi remplace ses entrées.
+    """
+
+    def __init__(self, storage_path: str = SCHEDULE_PATH) -> None:
+        self.storage_path = storage_path
+        self._rounds: list[ScheduledRound] | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def rounds(self) -> list[ScheduledRound]:
+        """Rounds planifiés, triés par début."""
+        with self._lock:
+            if self._rounds is None:
+                self._rounds = sorted(
+                    ScheduledRound(
+                        entry["start"],
+                        entry["end"],
+                        entry["tournament_id"],
+                        entry["round"],
+                    )
+                    for entry in load_json(self.storage_path, default=[])
+                )
+            return self._rounds
+
+    def for_tournament(self, tournament_id: str) -> list[ScheduledRound]:
+        """Rounds planifiés d'un tournoi."""
+        return [
+            scheduled
+            for scheduled in self.rounds
+            if scheduled.tournament_id == tournament_id
+        ]
+
+    def find(
+        self, tournament_id: str, round_num: int
+    ) -> ScheduledRound | None:
+        """Créneau d'un round, s'il est planifié."""
+        for scheduled in self.rounds:
+            if (
+                scheduled.tournament_id == tournament_id
+                and scheduled.round_num == round_num
+            ):
+                return scheduled
+        return None
+
+    def replace(self, planned: Iterable[ScheduledRound]) -> None:
+        """Remplace le planning des tournois présents dans ``planned``."""
+        planned = list(planned)
+        replaced = {scheduled.tournament_id for scheduled in planned}
+        with self._lock:
+            self._rounds = sorted(
+                [
+                    scheduled
+                    for scheduled in self.rounds
+                    if scheduled.tournament_id not in replaced
+                ]
+                + planned
+            )
+            self._write()
+
+    def record(self, played: ScheduledRound) -> None:
+        """Remplace le créneau prévu d'un round par ses heures réelles."""
+        with self._lock:
+            self._rounds = sorted(
+                [
+                    scheduled
+                    for scheduled in self.rounds
+                    if (scheduled.tournament_id, scheduled.round_num)
+                    != (played.tournament_id, played.round_num)
+                ]
+                + [played]
+            )
+            self._write()
+
+    def discard(self, tournament_id: str) -> None:
+        """Retire le planning d'un tournoi."""
+        with self._lock:
+            kept = [
+                scheduled
+                for scheduled in self.rounds
+                if scheduled.tournament_id != tournament_id
+            ]
+            if len(kept) != len(self.rounds):
+                self._rounds = kept
+                self._write()
+
+    def _write(self) -> None:
+        save_json(
+            self.storage_path,
+            [
+                {
+                    "tournament_id": scheduled.tournament_id,
+                    "round": scheduled.round_num,
+                    "start": scheduled.start,
+                    "end": scheduled.end,
+                }
+                for scheduled in self.rounds
+            ],
+        )
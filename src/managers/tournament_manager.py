@@ -1,43 +1,415 @@
 """TournamentManager - Gestion de la persistance des tournois."""
 
+import atexit
+import os
+import threading
+import time
+from datetime import date
+from typing import Callable, Iterable
+
 from models import Tournament
-from utils import load_json, save_json
+from utils import (
+    file_signature,
+    instrumented,
+    load_json,
+    save_json,
+    timed,
+)
+from utils.pairing_utils import pairing_system
+from utils.query_utils import (
+    ArchiveIndex,
+    GameRecord,
+    HeadToHead,
+    TournamentSummary,
+)
+from utils.validation_utils import team_errors
 
 
 TOURNAMENTS_PATH = "data/tournaments.json"
+WRITE_BEHIND_INTERVAL = 2.0
+
+# Index de l'archive partagés par fichier : (signature du fichier, index)
+_INDEXES: dict[str, tuple[tuple[int, int], ArchiveIndex]] = {}
+
+# Sérialise les lectures-modifications-écritures du fichier entre threads
+_WRITE_LOCK = threading.RLock()
+
+# Appelé avec les identifiants des tournois réécrits hors de leur modèle
+# (retrait ou fusion d'un joueur)
+RewriteListener = Callable[[list[str]], None]
 
 
 class TournamentManager:
-    """Gestionnaire de stockage des tournois."""
+    """Gestionnaire de stockage des tournois.
+
+    Seuls les tournois modifiés (``is_dirty``) sont sérialisés. En mode
+    ``write_behind``, les sauvegardes rapprochées sont regroupées et
+    écrites au plus une fois par ``flush_interval`` secondes ; ``flush``
+    force l'écriture (appelé aussi automatiquement à la sortie).
+
+    Les index secondaires de l'archive (joueur -> tournois, lieu, date de
+    début, parties par paire de joueurs ; voir ``ArchiveIndex``) sont
+    tenus à jour à chaque écriture et servent les requêtes (``query``,
+    ``games_between``, ``head_to_head``, ``active_players``) sans relire
+    le fichier. Les écritures du fichier sont sérialisées entre threads.
+    """
 
-    def __init__(self, storage_path: str = TOURNAMENTS_PATH) -> None:
+    def __init__(
+        self,
+        storage_path: str = TOURNAMENTS_PATH,
+        write_behind: bool = False,
+        flush_interval: float = WRITE_BEHIND_INTERVAL,
+    ) -> None:
         self.storage_path = storage_path
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self._pending: dict[str, Tournament] = {}
+        self._last_flush = time.monotonic()
+        self._listeners: list[RewriteListener] = []
+        if write_behind:
+            atexit.register(self.flush)
+
+    def add_listener(self, listener: RewriteListener) -> None:
+        """Abonne ``listener`` aux réécritures de tournois par joueur."""
+        self._listeners.append(listener)
 
     def save(self, tournament: Tournament) -> bool:
-        """Sauvegarde ou met à jour un tournoi."""
-        data = load_json(self.storage_path, default=[])
-        data = [entry for entry in data if entry["id"] != tournament.id]
-        data.append(tournament.to_dict())
-        save_json(self.storage_path, data)
+        """Sauvegarde ou met à jour un tournoi.
+
+        Ne fait rien si le tournoi n'a pas été modifié.
+        """
+        if not tournament.is_dirty:
+            return True
+
+        with _WRITE_LOCK:
+            self._pending[tournament.id] = tournament
+            elapsed = time.monotonic() - self._last_flush
+            if self.write_behind and elapsed < self.flush_interval:
+                return True
+            return self.flush()
+
+    def flush(self) -> bool:
+        """Écrit en une seule fois tous les tournois en attente."""
+        if not self._pending:
+            return True
+
+        with _WRITE_LOCK:
+            data = load_json(self.storage_path, default=[])
+            archive = self._archive_index(data)
+            positions = {
+                entry["id"]: index for index, entry in enumerate(data)
+            }
+            for tournament_id, tournament in self._pending.items():
+                entry = tournament.to_dict()
+                if tournament_id in positions:
+                    data[positions[tournament_id]] = entry
+                else:
+                    data.append(entry)
+                archive.set_tournament(entry)
+            self._write(data, archive)
+
+            for tournament in self._pending.values():
+                tournament.mark_clean()
+            self._pending.clear()
+            self._last_flush = time.monotonic()
         return True
 
+    def has_pending(self, tournament_id: str) -> bool:
+        """Indique si un tournoi attend encore d'être écrit."""
+        return tournament_id in self._pending
+
+    @instrumented("TournamentManager.find_all")
     def find_all(self) -> list[Tournament]:
         """Retourne l'ensemble des tournois persistés."""
+        self.flush()
         data = load_json(self.storage_path, default=[])
-        return [Tournament.from_dict(entry) for entry in data]
+        return [self._hydrate(entry) for entry in data]
+
+    def entries(self) -> list[dict]:
+        """Tournois persistés au format JSON, sans hydratation."""
+        self.flush()
+        return load_json(self.storage_path, default=[])
+
+    @instrumented("TournamentManager.find_page")
+    def find_page(
+        self, offset: int, limit: int, query: str = ""
+    ) -> tuple[list[Tournament], int]:
+        """Retourne une page de tournois et le nombre total de résultats.
 
+        Seuls les tournois de la page sont hydratés ; ``query`` filtre sur
+        l'identifiant, le nom ou le lieu (sans tenir compte de la casse).
+        """
+        self.flush()
+        data = load_json(self.storage_path, default=[])
+        if query:
+            needle = query.lower()
+            data = [
+                entry
+                for entry in data
+                if needle in entry["id"].lower()
+                or needle in entry["name"].lower()
+                or needle in entry["location"].lower()
+            ]
+        page = data[offset:offset + limit]
+        return [self._hydrate(entry) for entry in page], len(data)
+
+    @instrumented("TournamentManager.find_by_id")
     def find_by_id(self, tournament_id: str) -> Tournament | None:
         """Recherche un tournoi par son identifiant."""
+        self.flush()
         data = load_json(self.storage_path, default=[])
         for entry in data:
             if entry["id"] == tournament_id:
-                return Tournament.from_dict(entry)
+                return self._hydrate(entry)
         return None
 
+    @instrumented("TournamentManager.find_between")
+    def find_between(
+        self, start: date | None = None, end: date | None = None
+    ) -> list[Tournament]:
+        """Tournois commencés entre ``start`` et ``end`` inclus.
+
+        Les tournois sont triés par date de début ; seuls ceux de la
+        période sont hydratés.
+        """
+        summaries = self.query(start=start, end=end)
+        if not summaries:
+            return []
+        entries = {
+            entry["id"]: entry
+            for entry in load_json(self.storage_path, default=[])
+        }
+        return [self._hydrate(entries[summary.id]) for summary in summaries]
+
+    @instrumented("TournamentManager.query")
+    def query(
+        self,
+        location: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        player_id: str | None = None,
+    ) -> list[TournamentSummary]:
+        """Résumés des tournois satisfaisant tous les critères fournis.
+
+        ``location`` est comparé sans casse ni accents ; la période porte
+        sur la date de début (bornes incluses).
+        """
+        self.flush()
+        return self._archive_index().tournaments(
+            location, start, end, player_id
+        )
+
+    @instrumented("TournamentManager.games_between")
+    def games_between(
+        self,
+        player1_id: str,
+        player2_id: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[GameRecord]:
+        """Parties de l'archive entre deux joueurs."""
+        self.flush()
+        return self._archive_index().games_between(
+            player1_id, player2_id, start, end
+        )
+
+    @instrumented("TournamentManager.head_to_head")
+    def head_to_head(
+        self, player_ids: Iterable[str] | None = None
+    ) -> dict[str, dict[str, HeadToHead]]:
+        """Face-à-face (creux) sur l'archive, éventuellement restreints."""
+        self.flush()
+        return self._archive_index().head_to_head(player_ids)
+
+    @instrumented("TournamentManager.active_players")
+    def active_players(
+        self,
+        min_games: int,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[tuple[str, int]]:
+        """Joueurs et nombre de parties (au moins ``min_games``)."""
+        self.flush()
+        return self._archive_index().active_players(min_games, start, end)
+
+    def find_year(self, year: int) -> list[Tournament]:
+        """Tournois commencés pendant l'année ``year``."""
+        return self.find_between(date(year, 1, 1), date(year, 12, 31))
+
     def delete(self, tournament_id: str) -> None:
         """Supprime un tournoi identifié par son identifiant."""
+        self._pending.pop(tournament_id, None)
+        with _WRITE_LOCK:
+            data = load_json(self.storage_path, default=[])
+            archive = self._archive_index(data)
+            data = [entry for entry in data if entry["id"] != tournament_id]
+            archive.remove_tournament(tournament_id)
+            self._write(data, archive)
+
+    def player_tournaments(self, player_id: str) -> dict[str, int]:
+        """Tournois d'un joueur -> nombre de matchs, sans hydratation."""
+        self.flush()
+        return self._archive_index().references.tournaments_of(player_id)
+
+    def remove_player(self, player_id: str) -> list[str]:
+        """Retire un joueur de tous les tournois qui le référencent.
+
+        Son inscription, ses matchs, ses exemptions et sa place dans les
+        équipes sont supprimés en une seule réécriture ; les scores des
+        autres joueurs sont recalculés à partir des rounds restants.
+        Refusé (``ValueError``) si une équipe deviendrait incomplète
+        (voir ``team_errors``). Retourne les identifiants des tournois
+        modifiés.
+        """
+        self.flush()
+        with _WRITE_LOCK:
+            affected = self._remove_player(player_id)
+        self._notify(affected)
+        return affected
+
+    def _remove_player(self, player_id: str) -> list[str]:
+        data = load_json(self.storage_path, default=[])
+        archive = self._archive_index(data)
+        affected = set(archive.references.tournaments_of(player_id))
+        if not affected:
+            return []
+
+        rewritten = []
+        for entry in data:
+            if entry["id"] not in affected:
+                continue
+            # Exemptions déduites des anciens rounds, écrites avant que le
+            # retrait ne change la parité du nombre de joueurs
+            rounds = Tournament.from_dict(entry).rounds
+            for round_data, round_obj in zip(entry.get("rounds", []), rounds):
+                round_data["bye"] = round_obj.bye_player_id
+            entry["players"] = [
+                player
+                for player in entry.get("players", [])
+                if player["player_id"] != player_id
+            ]
+            scores = {
+                player["player_id"]: 0.0 for player in entry["players"]
+            }
+            bye_points = pairing_system(
+                entry.get("pairing_system", "swiss")
+            ).bye_points
+            for round_data in entry.get("rounds", []):
+                round_data["matches"] = [
+                    match
+                    for match in round_data.get("matches", [])
+                    if player_id
+                    not in (match["player1_id"], match["player2_id"])
+                ]
+                for match in round_data["matches"]:
+                    for key, points in (
+                        ("player1_id", "score1"),
+                        ("player2_id", "score2"),
+                    ):
+                        if match[key] in scores:
+                            scores[match[key]] += float(match.get(points, 0))
+                if round_data["bye"] == player_id:
+                    round_data["bye"] = None
+                elif round_data["bye"] in scores:
+                    scores[round_data["bye"]] += bye_points
+            # Les points marqués contre le joueur retiré disparaissent
+            for player in entry["players"]:
+                player["score"] = scores[player["player_id"]]
+            for team in entry.get("teams", []):
+                team["player_ids"] = [
+                    member
+                    for member in team["player_ids"]
+                    if member != player_id
+                ]
+            rewritten.append(entry)
+        # Rien n'est indexé ni écrit si une composition devient invalide
+        refused = [entry["id"] for entry in rewritten if team_errors(entry)]
+        if refused:
+            raise ValueError(
+                f"{player_id} est indispensable à une équipe dans : "
+                f"{', '.join(sorted(refused))}"
+            )
+        for entry in rewritten:
+            archive.set_tournament(entry)
+        self._write(data, archive)
+        return sorted(affected)
+
+    def merge_player(self, duplicate_id: str, keep_id: str) -> list[str]:
+        """Remplace ``duplicate_id`` par ``keep_id`` dans tous les tournois.
+
+        Inscriptions, matchs, exemptions et équipes sont réécrits en une
+        seule passe sur le fichier. Refusé (``ValueError``) si les deux
+        joueurs figurent dans un même tournoi. Retourne les identifiants
+        des tournois modifiés.
+        """
+        self.flush()
+        with _WRITE_LOCK:
+            merged = self._merge_player(duplicate_id, keep_id)
+        self._notify(merged)
+        return merged
+
+    def _merge_player(self, duplicate_id: str, keep_id: str) -> list[str]:
         data = load_json(self.storage_path, default=[])
-        data = [entry for entry in data if entry["id"] != tournament_id]
+        archive = self._archive_index(data)
+        affected = set(archive.references.tournaments_of(duplicate_id))
+        shared = affected & set(archive.references.tournaments_of(keep_id))
+        if shared:
+            raise ValueError(
+                f"{duplicate_id} et {keep_id} figurent tous deux dans : "
+                f"{', '.join(sorted(shared))}"
+            )
+        if not affected:
+            return []
+
+        def swap(player_id: str) -> str:
+            return keep_id if player_id == duplicate_id else player_id
+
+        for entry in data:
+            if entry["id"] not in affected:
+                continue
+            for player in entry.get("players", []):
+                player["player_id"] = swap(player["player_id"])
+            for round_data in entry.get("rounds", []):
+                for match in round_data.get("matches", []):
+                    match["player1_id"] = swap(match["player1_id"])
+                    match["player2_id"] = swap(match["player2_id"])
+                if round_data.get("bye"):
+                    round_data["bye"] = swap(round_data["bye"])
+            for team in entry.get("teams", []):
+                team["player_ids"] = [
+                    swap(player_id) for player_id in team["player_ids"]
+                ]
+            archive.set_tournament(entry)
+        self._write(data, archive)
+        return sorted(affected)
+
+    def _notify(self, tournament_ids: list[str]) -> None:
+        if tournament_ids:
+            for listener in list(self._listeners):
+                listener(tournament_ids)
+
+    def _archive_index(self, data: list | None = None) -> ArchiveIndex:
+        """Index de l'archive, reconstruit si le fichier a changé ailleurs."""
+        key = os.path.abspath(self.storage_path)
+        signature = file_signature(self.storage_path)
+        cached = _INDEXES.get(key)
+        if cached is None or cached[0] != signature:
+            if data is None:
+                data = load_json(self.storage_path, default=[])
+            cached = (signature, ArchiveIndex(data))
+            _INDEXES[key] = cached
+        return cached[1]
+
+    def _write(self, data: list, archive: ArchiveIndex) -> None:
         save_json(self.storage_path, data)
+        _INDEXES[os.path.abspath(self.storage_path)] = (
+            file_signature(self.storage_path),
+            archive,
+        )
+
+    @staticmethod
+    def _hydrate(entry: dict) -> Tournament:
+        with timed("Tournament.from_dict"):
+            return Tournament.from_dict(entry)
 
     # Les méthodes de conversion sont désormais gérées par les modèles.
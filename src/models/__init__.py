@@ -3,6 +3,8 @@
 from .player import Player
 from .match import Match
 from .round import Round
+from .team import Team
+from .team_match import TeamMatch
 from .tournament import Tournament
 
-__all__ = ["Player", "Match", "Round", "Tournament"]
+__all__ = ["Player", "Match", "Round", "Team", "TeamMatch", "Tournament"]
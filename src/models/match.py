@@ -3,9 +3,10 @@
 from typing import Any
 
 from .player import Player
+from .tracking import ChangeTracker
 
 
-class Match:
+class Match(ChangeTracker):
     """Opposition entre deux joueurs avec leurs scores."""
 
     def __init__(
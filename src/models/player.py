@@ -1,20 +1,27 @@
 """Modèle représentant un joueur."""
 
+from datetime import date
+
+from utils.date_utils import format_date, to_date
+
 
 class Player:
-    """Informations d'identité pour un joueur."""
+    """Informations d'identité pour un joueur.
+
+    ``birthday`` est une ``date`` (texte conservé s'il est illisible).
+    """
 
     def __init__(
         self,
         id: str,
         lastname: str,
         firstname: str,
-        birthday: str,
+        birthday: date | str,
     ) -> None:
         self.id = id
         self.lastname = lastname
         self.firstname = firstname
-        self.birthday = birthday
+        self.birthday = to_date(birthday)
 
     def to_dict(self) -> dict[str, str]:
         """Convertit le joueur vers un dictionnaire JSON."""
@@ -22,5 +29,5 @@ class Player:
             "id": self.id,
             "lastname": self.lastname,
             "firstname": self.firstname,
-            "birthday": self.birthday,
+            "birthday": format_date(self.birthday),
         }
@@ -2,36 +2,70 @@
 
 from typing import Any, Self
 
+from utils.clock_utils import to_epoch
+
 from .match import Match
+from .tracking import ChangeTracker
+
 
+class Round(ChangeTracker):
+    """Regroupe les matchs joués pendant un tour.
 
-class Round:
-    """Regroupe les matchs joués pendant un tour."""
+    ``started_at`` et ``ended_at`` sont des epochs entiers (secondes).
+    """
 
     def __init__(
         self,
         name: str,
         matches: list[Match],
-        started_at: str | None = None,
-        ended_at: str | None = None,
+        started_at: int | None = None,
+        ended_at: int | None = None,
+        bye_player_id: str | None = None,
+        bye_team_id: str | None = None,
     ) -> None:
         self.name = name
         self.matches = matches
         self.started_at = started_at
         self.ended_at = ended_at
+        # Joueur exempt (nombre impair de joueurs), sans adversaire
+        self.bye_player_id = bye_player_id
+        # Équipe exempte d'un tournoi par équipes (nombre impair d'équipes)
+        self.bye_team_id = bye_team_id
+
+    @property
+    def is_dirty(self) -> bool:
+        """Indique si le tour ou l'un de ses matchs a changé."""
+        return self._dirty or any(match.is_dirty for match in self.matches)
+
+    def mark_clean(self) -> None:
+        """Marque le tour et ses matchs comme sauvegardés."""
+        super().mark_clean()
+        for match in self.matches:
+            match.mark_clean()
 
     def to_dict(self) -> dict[str, Any]:
-        """Convertit le tour en dictionnaire JSON."""
-        return {
+        """Convertit le tour en dictionnaire JSON.
+
+        ``bye_team`` n'est écrit que pour les rounds d'un tournoi par
+        équipes ayant une équipe exempte.
+        """
+        data = {
             "name": self.name,
             "matches": [match.to_dict() for match in self.matches],
             "started_at": self.started_at,
             "ended_at": self.ended_at,
+            "bye": self.bye_player_id,
         }
+        if self.bye_team_id:
+            data["bye_team"] = self.bye_team_id
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
-        """Reconstruit un tour depuis un dictionnaire."""
+        """Reconstruit un tour depuis un dictionnaire.
+
+        Les horodatages texte des anciens fichiers sont convertis en epoch.
+        """
         matches = [
             match
             for match in (
@@ -43,6 +77,8 @@ class Round:
         return cls(
             name=data["name"],
             matches=matches,
-            started_at=data.get("started_at"),
-            ended_at=data.get("ended_at"),
+            started_at=to_epoch(data.get("started_at")),
+            ended_at=to_epoch(data.get("ended_at")),
+            bye_player_id=data.get("bye"),
+            bye_team_id=data.get("bye_team"),
         )
@@ -0,0 +1,37 @@
+"""Modèle représentant une équipe d'un tournoi par équipes."""
+
+from typing import Any, Self
+
+from .player import Player
+
+
+class Team:
+    """Équipe : joueurs rangés par échiquier (échiquier 1 en premier)."""
+
+    def __init__(self, id: str, name: str, players: list[Player]) -> None:
+        self.id = id
+        self.name = name
+        self.players = players
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convertit l'équipe en dictionnaire JSON."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "player_ids": [player.id for player in self.players],
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any], players: dict[str, Player]
+    ) -> Self:
+        """Reconstruit une équipe parmi les joueurs déjà chargés."""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            players=[
+                players[player_id]
+                for player_id in data.get("player_ids", [])
+                if player_id in players
+            ],
+        )
@@ -0,0 +1,33 @@
+"""Modèle représentant une rencontre entre deux équipes."""
+
+from .match import Match
+from .team import Team
+
+# Points de match d'une rencontre gagnée, nulle ou perdue
+MATCH_POINTS_WIN = 2.0
+MATCH_POINTS_DRAW = 1.0
+
+
+class TeamMatch:
+    """Rencontre par équipes : un ``Match`` par échiquier.
+
+    Les couleurs alternent : ``team1`` a les blancs aux échiquiers
+    impairs (le joueur de ``team1`` y est ``player1``).
+    """
+
+    def __init__(self, team1: Team, team2: Team, boards: list[Match]) -> None:
+        self.team1 = team1
+        self.team2 = team2
+        self.boards = boards
+
+    @classmethod
+    def pair(cls, team1: Team, team2: Team) -> "TeamMatch":
+        """Crée les échiquiers d'une rencontre à jouer."""
+        boards = []
+        for board, (player1, player2) in enumerate(
+            zip(team1.players, team2.players)
+        ):
+            if board % 2:
+                player1, player2 = player2, player1
+            boards.append(Match(player1=player1, player2=player2))
+        return cls(team1, team2, boards)
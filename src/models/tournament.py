@@ -1,36 +1,117 @@
 """Modèle représentant un tournoi d'échecs."""
 
+import os
+import zlib
+from datetime import date
 from typing import Any, Self
 
+from utils.date_utils import format_date, to_date
+
 from .round import Round
+from .team import Team
+from .tracking import ChangeTracker
+
 
+class Tournament(ChangeTracker):
+    """Structure complète d'un tournoi.
 
-class Tournament:
-    """Structure complète d'un tournoi."""
+    ``start_date`` et ``end_date`` sont des ``date`` (texte conservé s'il
+    est illisible) ; le texte YYYY-MM-DD n'est produit qu'en sortie.
+    """
 
     def __init__(
         self,
         id: str,
         name: str,
         location: str,
-        start_date: str,
-        end_date: str,
+        start_date: date | str,
+        end_date: date | str,
         players: list[list[Any]],
         rounds: list[Round],
         rounds_count: int = 4,
         current_round: int = 1,
         description: str = "",
+        seed: int | None = None,
+        pairing_system: str = "swiss",
+        teams: list[Team] | None = None,
     ) -> None:
         self.id = id
         self.name = name
         self.location = location
-        self.start_date = start_date
-        self.end_date = end_date
+        self.start_date = to_date(start_date)
+        self.end_date = to_date(end_date)
         self.players = players
         self.rounds = rounds
         self.rounds_count = rounds_count
         self.current_round = current_round
         self.description = description
+        # Graine des tirages au sort (appariements reproductibles)
+        self.seed = (
+            seed
+            if seed is not None
+            else int.from_bytes(os.urandom(4), "big")
+        )
+        # Nom du système d'appariement (voir ``PAIRING_SYSTEMS``)
+        self.pairing_system = pairing_system
+        # Tournoi par équipes : les rounds contiennent les échiquiers
+        self.teams = teams or []
+        # Nombre d'exemptions reçues par joueur, déduit des rounds
+        self.byes: dict[str, int] = {}
+        for round_obj in rounds:
+            if round_obj.bye_player_id:
+                self.byes[round_obj.bye_player_id] = (
+                    self.byes.get(round_obj.bye_player_id, 0) + 1
+                )
+        self._positions: dict[str, int] = {}
+
+    @property
+    def is_dirty(self) -> bool:
+        """Indique si le tournoi, un tour ou un match a changé."""
+        return self._dirty or any(
+            round_obj.is_dirty for round_obj in self.rounds
+        )
+
+    def mark_clean(self) -> None:
+        """Marque le tournoi complet comme sauvegardé."""
+        super().mark_clean()
+        for round_obj in self.rounds:
+            round_obj.mark_clean()
+
+    def _entry(self, player_id: str) -> list[Any] | None:
+        """Entrée ``[Player, score]`` d'un joueur (index par identifiant)."""
+        position = self._positions.get(player_id)
+        if (
+            position is None
+            or position >= len(self.players)
+            or self.players[position][0].id != player_id
+        ):
+            # Liste modifiée depuis la construction de l'index
+            self._positions = {
+                entry[0].id: index for index, entry in enumerate(self.players)
+            }
+            position = self._positions.get(player_id)
+            if position is None:
+                return None
+        return self.players[position]
+
+    def add_score(self, player_id: str, points: float) -> None:
+        """Ajoute des points à un joueur et marque le tournoi modifié."""
+        entry = self._entry(player_id)
+        if entry is not None:
+            entry[1] += points
+            self.mark_dirty()
+
+    def team(self, team_id: str | None) -> Team | None:
+        """Équipe d'identifiant ``team_id`` (``None`` si absente)."""
+        for team in self.teams:
+            if team.id == team_id:
+                return team
+        return None
+
+    def record_bye(self, player_id: str, points: float = 1.0) -> None:
+        """Compte une exemption et attribue ses points."""
+        self.byes[player_id] = self.byes.get(player_id, 0) + 1
+        self.add_score(player_id, points)
 
     def to_dict(self) -> dict[str, Any]:
         """Convertit le tournoi en dictionnaire JSON."""
@@ -38,8 +119,8 @@ class Tournament:
             "id": self.id,
             "name": self.name,
             "location": self.location,
-            "start_date": self.start_date,
-            "end_date": self.end_date,
+            "start_date": format_date(self.start_date),
+            "end_date": format_date(self.end_date),
             "players": [
                 {
                     "player_id": player.id,
@@ -51,6 +132,9 @@ class Tournament:
             "rounds_count": self.rounds_count,
             "current_round": self.current_round,
             "description": self.description,
+            "seed": self.seed,
+            "pairing_system": self.pairing_system,
+            "teams": [team.to_dict() for team in self.teams],
         }
 
     @classmethod
@@ -75,9 +159,24 @@ class Tournament:
             score = float(entry.get("score", 0.0))
             players.append([player, score])
 
+        players_by_id = {player.id: player for player, _score in players}
         rounds = [Round.from_dict(raw) for raw in data.get("rounds", [])]
+        if len(players) % 2:
+            # Rounds antérieurs à l'enregistrement de l'exempt : le joueur
+            # sans match du round
+            player_ids = set(players_by_id)
+            for raw, round_obj in zip(data.get("rounds", []), rounds):
+                if "bye" in raw:
+                    continue
+                absent = player_ids - {
+                    player_id
+                    for match in round_obj.matches
+                    for player_id in (match.player1.id, match.player2.id)
+                }
+                if len(absent) == 1:
+                    round_obj.bye_player_id = absent.pop()
 
-        return cls(
+        tournament = cls(
             id=data["id"],
             name=data["name"],
             location=data["location"],
@@ -88,4 +187,13 @@ class Tournament:
             rounds_count=int(data.get("rounds_count", 4)),
             current_round=int(data.get("current_round", 1)),
             description=data.get("description", ""),
+            # Tournois antérieurs aux graines : dérivée de l'identifiant
+            seed=int(data.get("seed", zlib.crc32(data["id"].encode()))),
+            pairing_system=data.get("pairing_system", "swiss"),
+            teams=[
+                Team.from_dict(raw, players_by_id)
+                for raw in data.get("teams", [])
+            ],
         )
+        tournament.mark_clean()
+        return tournament
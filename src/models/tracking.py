@@ -0,0 +1,29 @@
+"""Suivi des modifications des modèles (dirty tracking)."""
+
+
+class ChangeTracker:
+    """Marque l'objet comme modifié à chaque affectation d'attribut public.
+
+    Les attributs préfixés par ``_`` sont considérés comme internes et ne
+    déclenchent pas le marquage.
+    """
+
+    _dirty: bool = True
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_dirty", True)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Indique si l'objet a changé depuis la dernière sauvegarde."""
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        """Force le marquage de l'objet comme modifié."""
+        object.__setattr__(self, "_dirty", True)
+
+    def mark_clean(self) -> None:
+        """Marque l'objet comme synchronisé avec le stockage."""
+        object.__setattr__(self, "_dirty", False)
@@ -1,4 +1,4 @@
-"""Generation de rapports CSV pour les joueurs et tournois.
+"""Generation de rapports CSV (et HTML) pour les joueurs et tournois.
 
 Executer ce module genere automatiquement les cinq rapports demandes, tous
 stockes dans ``data/reports``.
@@ -7,12 +7,17 @@ stockes dans ``data/reports``.
 from __future__ import annotations
 
 import csv
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable, Sequence
 
-from managers import PlayerManager, TournamentManager
+from managers import PlayerManager, PlayerStatsManager, TournamentManager
 from models import Tournament
+from utils import configure_profiling, instrumented
+from utils.clock_utils import format_timestamp
+from utils.crosstable_utils import Crosstable
+from utils.date_utils import date_sort_key, format_date
 
 REPORTS_DIR = Path("data") / "reports"
 
@@ -26,6 +31,7 @@ class ReportGenerator:
         run_timestamp: str | None = None,
         player_manager: PlayerManager | None = None,
         tournament_manager: TournamentManager | None = None,
+        stats_manager: PlayerStatsManager | None = None,
     ) -> None:
         self.timestamp = run_timestamp or datetime.now().strftime(
             "%Y%m%d_%H%M%S"
@@ -35,7 +41,9 @@ class ReportGenerator:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.player_manager = player_manager or PlayerManager()
         self.tournament_manager = tournament_manager or TournamentManager()
+        self.stats_manager = stats_manager or PlayerStatsManager()
 
+    @instrumented("ReportGenerator.generate_players_report")
     def generate_players_report(self) -> Path:
         """Genere la liste des joueurs par ordre alphabetique."""
         players = sorted(
@@ -47,20 +55,26 @@ class ReportGenerator:
         )
         headers = ["player_id", "lastname", "firstname", "birthday"]
         rows = [
-            [player.id, player.lastname, player.firstname, player.birthday]
+            [
+                player.id,
+                player.lastname,
+                player.firstname,
+                format_date(player.birthday),
+            ]
             for player in players
         ]
         output_path = self._timestamped_filename("joueurs_alphabetique")
         self._write_csv(output_path, headers, rows)
         return output_path
 
+    @instrumented("ReportGenerator.generate_tournaments_report")
     def generate_tournaments_report(self) -> Path:
         """Genere la liste de tous les tournois."""
         tournaments = sorted(
             self.tournament_manager.find_all(),
             key=lambda tournament: (
                 tournament.name.lower(),
-                tournament.start_date,
+                date_sort_key(tournament.start_date),
             ),
         )
         headers = [
@@ -69,6 +83,7 @@ class ReportGenerator:
             "location",
             "start_date",
             "end_date",
+            "pairing_system",
             "rounds_count",
             "current_round",
             "players_count",
@@ -79,8 +94,9 @@ class ReportGenerator:
                 tournament.id,
                 tournament.name,
                 tournament.location,
-                tournament.start_date,
-                tournament.end_date,
+                format_date(tournament.start_date),
+                format_date(tournament.end_date),
+                tournament.pairing_system,
                 tournament.rounds_count,
                 tournament.current_round,
                 len(tournament.players),
@@ -92,6 +108,7 @@ class ReportGenerator:
         self._write_csv(output_path, headers, rows)
         return output_path
 
+    @instrumented("ReportGenerator.generate_tournament_info_report")
     def generate_tournament_info_report(self, tournament_id: str) -> Path:
         """Genere un rapport nom et dates pour un tournoi donne."""
         tournament = self._get_tournament_or_raise(tournament_id)
@@ -100,8 +117,8 @@ class ReportGenerator:
             [
                 tournament.id,
                 tournament.name,
-                tournament.start_date,
-                tournament.end_date,
+                format_date(tournament.start_date),
+                format_date(tournament.end_date),
             ]
         ]
         output_path = self._timestamped_filename(
@@ -110,6 +127,7 @@ class ReportGenerator:
         self._write_csv(output_path, headers, rows)
         return output_path
 
+    @instrumented("ReportGenerator.generate_tournament_players_report")
     def generate_tournament_players_report(self, tournament_id: str) -> Path:
         """Genere la liste des joueurs d'un tournoi donne."""
         tournament = self._get_tournament_or_raise(tournament_id)
@@ -143,6 +161,7 @@ class ReportGenerator:
         self._write_csv(output_path, headers, rows)
         return output_path
 
+    @instrumented("ReportGenerator.generate_tournament_rounds_report")
     def generate_tournament_rounds_report(self, tournament_id: str) -> Path:
         """Genere la liste des tours et des matchs pour un tournoi donne."""
         tournament = self._get_tournament_or_raise(tournament_id)
@@ -166,8 +185,8 @@ class ReportGenerator:
                     [
                         tournament.id,
                         round_obj.name,
-                        round_obj.started_at or "",
-                        round_obj.ended_at or "",
+                        format_timestamp(round_obj.started_at),
+                        format_timestamp(round_obj.ended_at),
                         index,
                         match.player1.id,
                         (
@@ -189,8 +208,105 @@ class ReportGenerator:
         self._write_csv(output_path, headers, rows)
         return output_path
 
-    def _timestamped_filename(self, slug: str) -> Path:
-        return self.output_dir / f"{slug}_{self.timestamp}.csv"
+    @instrumented("ReportGenerator.generate_player_career_report")
+    def generate_player_career_report(self, player_id: str) -> Path:
+        """Genere le bilan d'un joueur par tournoi, puis au total."""
+        player = self.player_manager.find_by_id(player_id)
+        if player is None:
+            raise ValueError(f"Joueur introuvable : {player_id}")
+        career = self.stats_manager.find_by_player(player_id) or {
+            "total": None,
+            "tournaments": {},
+        }
+        headers = [
+            "player_id",
+            "tournament_id",
+            "games",
+            "wins",
+            "draws",
+            "losses",
+            "points",
+            "opponents",
+        ]
+        lines = sorted(career["tournaments"].items())
+        if career["total"] is not None:
+            lines.append(("TOTAL", career["total"]))
+        rows = [
+            [
+                player.id,
+                tournament_id,
+                stats["games"],
+                stats["wins"],
+                stats["draws"],
+                stats["losses"],
+                stats["points"],
+                len(stats["opponents"]),
+            ]
+            for tournament_id, stats in lines
+        ]
+        output_path = self._timestamped_filename(
+            f"{player.id.lower()}_carriere"
+        )
+        self._write_csv(output_path, headers, rows)
+        return output_path
+
+    @instrumented("ReportGenerator.generate_crosstable_report")
+    def generate_crosstable_report(self, tournament_id: str) -> Path:
+        """Genere la grille americaine d'un tournoi donne (CSV)."""
+        crosstable = Crosstable(self._get_tournament_or_raise(tournament_id))
+        output_path = self._timestamped_filename(
+            f"{crosstable.tournament.id.lower()}_grille"
+        )
+        self._write_csv(output_path, crosstable.headers(), crosstable.rows())
+        return output_path
+
+    @instrumented("ReportGenerator.generate_crosstable_html")
+    def generate_crosstable_html(self, tournament_id: str) -> Path:
+        """Genere la grille americaine d'un tournoi donne (HTML)."""
+        crosstable = Crosstable(self._get_tournament_or_raise(tournament_id))
+        output_path = self._timestamped_filename(
+            f"{crosstable.tournament.id.lower()}_grille", ".html"
+        )
+        output_path.write_text(crosstable.to_html(), encoding="utf-8")
+        return output_path
+
+    @instrumented("ReportGenerator.generate_head_to_head_report")
+    def generate_head_to_head_report(
+        self, player_ids: Iterable[str] | None = None
+    ) -> Path:
+        """Genere les face-a-face de l'archive, une ligne par paire jouee.
+
+        Sans ``player_ids``, toute l'archive ; sinon ces joueurs seulement.
+        """
+        matrix = self.tournament_manager.head_to_head(player_ids)
+        headers = [
+            "player_id",
+            "opponent_id",
+            "games",
+            "wins",
+            "draws",
+            "losses",
+            "points",
+        ]
+        rows = [
+            [
+                player_id,
+                opponent_id,
+                record.games,
+                record.wins,
+                record.draws,
+                record.losses,
+                record.points,
+            ]
+            for player_id, opponents in sorted(matrix.items())
+            for opponent_id, record in sorted(opponents.items())
+        ]
+        output_path = self._timestamped_filename("face_a_face")
+        self._write_csv(output_path, headers, rows)
+        return output_path
+
+    def _timestamped_filename(self, slug: str, suffix: str = ".csv") -> Path:
+        return self.output_dir / f"{slug}_{self.timestamp}{suffix}"
 
     def _get_tournament_or_raise(self, tournament_id: str) -> Tournament:
         tournament = self.tournament_manager.find_by_id(tournament_id)
@@ -270,4 +386,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    configure_profiling(sys.argv)
     main()
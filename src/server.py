@@ -0,0 +1,276 @@
+"""Serveur local de scores pour plusieurs tournois simultanés.
+
+Chaque connexion TCP échange des objets JSON, un par ligne ::
+
+    {"op": "pair_round", "tournament_id": "AB12345"}
+    {"op": "pair_rounds", "tournament_ids": ["AB12345", "CD67890"]}
+    {"op": "submit_result", "tournament_id": "AB12345",
+     "board": 1, "score1": 1, "score2": 0}
+    {"op": "amend_result", "tournament_id": "AB12345",
+     "round": 2, "board": 1, "score1": 0.5, "score2": 0.5}
+    {"op": "pairings", "tournament_id": "AB12345"}
+    {"op": "standings", "tournament_id": "AB12345"}
+    {"op": "team_standings", "tournament_id": "AB12345"}
+    {"op": "check_consistency", "tournament_id": "AB12345"}
+    {"op": "plan_schedule", "tournament_ids": ["AB12345", "CD67890"],
+     "first_start": 1767258000, "duration": 7200, "per_day": 2,
+     "days": 3, "interval": 9000}
+    {"op": "clock", "tournament_id": "AB12345"}
+    {"op": "now"}
+    {"op": "subscribe", "tournament_id": "AB12345"}
+    {"op": "ping"}
+
+Réponse : ``{"ok": true, "result": ...}`` ou ``{"ok": false, "error": ...}``.
+Après ``subscribe``, la connexion reçoit le classement en direct : l'état
+courant en réponse, puis un événement ``diff`` par résultat saisi, limité
+aux lignes dont le rang ou le score change (voir ``StandingsController``).
+Chaque tournoi a son verrou : écritures et lectures d'un même tournoi
+sont sérialisées, une lecture ne voit donc jamais un round à moitié
+clôturé. Les requêtes portant sur des tournois différents sont traitées
+en parallèle (les accès disque ont lieu hors de la boucle).
+
+    python src/server.py --host 127.0.0.1 --port 8765
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Callable
+
+from controllers.scoring import ScoringController
+from utils import configure_profiling
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+WRITE_OPERATIONS = {
+    "pair_round",
+    "pair_rounds",
+    "submit_result",
+    "amend_result",
+    "plan_schedule",
+}
+READ_OPERATIONS = {
+    "pairings",
+    "standings",
+    "team_standings",
+    "check_consistency",
+    "clock",
+    "now",
+}
+# Opérations portant sur plusieurs tournois ou sur tout l'événement
+MULTI_TOURNAMENT_OPERATIONS = {"pair_rounds", "plan_schedule"}
+GLOBAL_OPERATIONS = {"now"}
+
+
+def _optional_int(value: Any) -> int | None:
+    return None if value is None else int(value)
+
+
+class ScoringServer:
+    """Expose ``ScoringController`` en JSON sur une socket TCP."""
+
+    def __init__(self, controller: ScoringController | None = None) -> None:
+        self.controller = controller or ScoringController()
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _call(self, operation: str, request: dict[str, Any]) -> Any:
+        if operation == "pair_rounds":
+            return self.controller.pair_rounds(request["tournament_ids"])
+        if operation == "plan_schedule":
+            return self.controller.plan_schedule(
+                request["tournament_ids"],
+                int(request["first_start"]),
+                int(request["duration"]),
+                int(request["per_day"]),
+                int(request["days"]),
+                _optional_int(request.get("interval")),
+                _optional_int(request.get("capacity")),
+            )
+        if operation == "now":
+            return self.controller.happening_now(
+                _optional_int(request.get("at"))
+            )
+        tournament_id = request["tournament_id"]
+        if operation == "pair_round":
+            return self.controller.pair_round(tournament_id)
+        if operation == "submit_result":
+            return self.controller.submit_result(
+                tournament_id,
+                int(request["board"]),
+                request["score1"],
+                request["score2"],
+            )
+        if operation == "amend_result":
+            return self.controller.amend_result(
+                tournament_id,
+                int(request["round"]),
+                int(request["board"]),
+                request["score1"],
+                request["score2"],
+            )
+        if operation == "check_consistency":
+            return self.controller.check_consistency(tournament_id)
+        if operation == "clock":
+            return self.controller.clock(tournament_id)
+        if operation == "pairings":
+            return self.controller.pairings(tournament_id)
+        if operation == "team_standings":
+            return self.controller.team_standings(tournament_id)
+        return self.controller.standings(tournament_id)
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Traite une requête décodée et retourne la réponse."""
+        operation = request.get("op")
+        if operation == "ping":
+            return {"ok": True, "result": "pong"}
+        if operation not in WRITE_OPERATIONS | READ_OPERATIONS:
+            return {"ok": False, "error": f"Opération inconnue : {operation}"}
+        if operation in GLOBAL_OPERATIONS:
+            tournament_ids = []
+        elif operation in MULTI_TOURNAMENT_OPERATIONS:
+            tournament_ids = request.get("tournament_ids")
+            if not isinstance(tournament_ids, list) or not tournament_ids:
+                return {"ok": False, "error": "tournament_ids manquant."}
+        elif not request.get("tournament_id"):
+            return {"ok": False, "error": "tournament_id manquant."}
+        else:
+            tournament_ids = [request["tournament_id"]]
+
+        try:
+            result = await self._locked(
+                tournament_ids, self._call, operation, request
+            )
+        except (KeyError, TypeError, ValueError, OSError) as exc:
+            # OSError : fichier de données illisible ou disque plein
+            return {"ok": False, "error": str(exc)}
+        return {"ok": True, "result": result}
+
+    async def _locked(
+        self, tournament_ids: list[str], function: Callable, *args: Any
+    ) -> Any:
+        """Exécute ``function`` dans un thread, tournois verrouillés."""
+        # Verrous pris dans un ordre fixe : pas d'interblocage
+        locks = [
+            self._locks.setdefault(tournament_id, asyncio.Lock())
+            for tournament_id in sorted(set(tournament_ids))
+        ]
+        for lock in locks:
+            await lock.acquire()
+        try:
+            return await asyncio.to_thread(function, *args)
+        finally:
+            for lock in locks:
+                lock.release()
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Répond aux requêtes d'une connexion jusqu'à sa fermeture."""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError:
+                    response = {"ok": False, "error": "JSON invalide."}
+                else:
+                    if not isinstance(request, dict):
+                        response = {"ok": False, "error": "Objet attendu."}
+                    elif request.get("op") == "subscribe":
+                        await self.stream_standings(request, reader, writer)
+                        return
+                    else:
+                        response = await self.handle_request(request)
+                await self._send(writer, response)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def stream_standings(
+        self,
+        request: dict[str, Any],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Diffuse le classement en direct jusqu'à la déconnexion."""
+        tournament_id = request.get("tournament_id")
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[dict] = asyncio.Queue()
+
+        def listener(event: dict) -> None:
+            # Appelé depuis les threads de traitement des écritures
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        try:
+            snapshot = await self._locked(
+                [tournament_id] if tournament_id else [],
+                self.controller.subscribe,
+                tournament_id,
+                listener,
+            )
+        except ValueError as exc:
+            await self._send(writer, {"ok": False, "error": str(exc)})
+            return
+        closed = asyncio.ensure_future(reader.read())
+        try:
+            await self._send(writer, {"ok": True, "result": snapshot})
+            while not closed.done():
+                event = asyncio.ensure_future(queue.get())
+                await asyncio.wait(
+                    {event, closed}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if event.done():
+                    await self._send(writer, event.result())
+                else:
+                    event.cancel()
+        finally:
+            closed.cancel()
+            self.controller.unsubscribe(tournament_id, listener)
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, message: dict) -> None:
+        writer.write(json.dumps(message, ensure_ascii=False).encode() + b"\n")
+        await writer.drain()
+
+    async def serve(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        on_ready: Callable[[str, int], None] | None = None,
+    ) -> None:
+        """Écoute jusqu'à l'annulation de la tâche."""
+        server = await asyncio.start_server(self.handle_client, host, port)
+        bound_host, bound_port = server.sockets[0].getsockname()[:2]
+        if on_ready:
+            on_ready(bound_host, bound_port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # Processus d'appariement éventuellement démarrés
+            self.controller.round_controller.shutdown()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Lance le serveur de scores."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args, _unknown = parser.parse_known_args(argv)
+
+    def announce(host: str, port: int) -> None:
+        print(f"Serveur de scores à l'écoute sur {host}:{port}", flush=True)
+
+    try:
+        asyncio.run(ScoringServer().serve(args.host, args.port, announce))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    configure_profiling(sys.argv)
+    main()
@@ -1,18 +1,78 @@
-"""Package utilitaire pour les fonctions d'appariement."""
+"""Package utilitaire : appariement, persistance, recherche, validation.
 
-from .match_utils import (
-    get_played_pairs,
-    pair_players_by_score,
-    pair_players_first_round,
-)
-from .screen_utils import clear_screen
-from .storage_utils import load_json, save_json
+Les sous-modules sont importés à la première utilisation d'un nom exporté
+(PEP 562) : ``from utils import load_json`` ne charge pas les modèles.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .instrumentation import configure_profiling, instrumented, timed
+    from .match_utils import (
+        get_played_pairs,
+        pair_players_by_score,
+        pair_players_first_round,
+    )
+    from .screen_utils import clear_screen
+    from .search_utils import PlayerSearchIndex
+    from .storage_utils import (
+        append_json_line,
+        file_signature,
+        load_json,
+        load_json_lines,
+        save_json,
+    )
+    from .validation_utils import (
+        RecordError,
+        validate_players_batch,
+        validate_tournaments_batch,
+    )
+
+_EXPORTS = {
+    "pair_players_first_round": ".match_utils",
+    "pair_players_by_score": ".match_utils",
+    "get_played_pairs": ".match_utils",
+    "clear_screen": ".screen_utils",
+    "PlayerSearchIndex": ".search_utils",
+    "load_json": ".storage_utils",
+    "save_json": ".storage_utils",
+    "append_json_line": ".storage_utils",
+    "load_json_lines": ".storage_utils",
+    "file_signature": ".storage_utils",
+    "configure_profiling": ".instrumentation",
+    "instrumented": ".instrumentation",
+    "timed": ".instrumentation",
+    "RecordError": ".validation_utils",
+    "validate_players_batch": ".validation_utils",
+    "validate_tournaments_batch": ".validation_utils",
+}
 
 __all__ = [
     "pair_players_first_round",
     "pair_players_by_score",
     "get_played_pairs",
     "clear_screen",
+    "PlayerSearchIndex",
     "load_json",
     "save_json",
+    "append_json_line",
+    "load_json_lines",
+    "file_signature",
+    "configure_profiling",
+    "instrumented",
+    "timed",
+    "RecordError",
+    "validate_players_batch",
+    "validate_tournaments_batch",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Importe le sous-module fournissant ``name`` au premier accès."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,130 @@
+"""Agrégats de carrière des joueurs (parties, résultats, adversaires)."""
+
+from typing import Any, Mapping
+
+
+def empty_aggregate() -> dict[str, Any]:
+    """Agrégat vide : parties, victoires, nulles, défaites, points."""
+    return {
+        "games": 0,
+        "wins": 0,
+        "draws": 0,
+        "losses": 0,
+        "points": 0.0,
+        "opponents": {},
+    }
+
+
+def _add_game(
+    aggregate: dict[str, Any], opponent_id: str, own: float, other: float
+) -> None:
+    aggregate["games"] += 1
+    aggregate["points"] += own
+    if own > other:
+        aggregate["wins"] += 1
+    elif own < other:
+        aggregate["losses"] += 1
+    else:
+        aggregate["draws"] += 1
+    opponents = aggregate["opponents"]
+    opponents[opponent_id] = opponents.get(opponent_id, 0) + 1
+
+
+def _subtract(total: dict[str, Any], part: Mapping[str, Any]) -> None:
+    for key in ("games", "wins", "draws", "losses", "points"):
+        total[key] -= part[key]
+    opponents = total["opponents"]
+    for opponent_id, count in part["opponents"].items():
+        remaining = opponents.get(opponent_id, 0) - count
+        if remaining > 0:
+            opponents[opponent_id] = remaining
+        else:
+            opponents.pop(opponent_id, None)
+
+
+class CareerStats:
+    """Agrégats par joueur, au total et par tournoi.
+
+    Chaque round n'est compté qu'une fois (clé ``tournoi:numéro``), ce qui
+    rend ``apply_round`` idempotent ; le détail par tournoi permet de
+    retirer un tournoi sans tout recalculer.
+    """
+
+    def __init__(
+        self,
+        players: dict[str, dict[str, Any]] | None = None,
+        rounds: list[str] | None = None,
+    ) -> None:
+        self.players = players or {}
+        self.rounds = set(rounds or [])
+
+    def _player(self, player_id: str) -> dict[str, Any]:
+        player = self.players.get(player_id)
+        if player is None:
+            player = {"total": empty_aggregate(), "tournaments": {}}
+            self.players[player_id] = player
+        return player
+
+    def apply_round(
+        self,
+        tournament_id: str,
+        round_number: int,
+        round_data: Mapping[str, Any],
+    ) -> bool:
+        """Ajoute les matchs d'un round clôturé (JSON ``Round.to_dict``).
+
+        Retourne False si ce round avait déjà été comptabilisé.
+        """
+        key = f"{tournament_id}:{round_number}"
+        if key in self.rounds:
+            return False
+        self.rounds.add(key)
+
+        for match in round_data.get("matches", []):
+            sides = (
+                (match["player1_id"], match["player2_id"],
+                 match["score1"], match["score2"]),
+                (match["player2_id"], match["player1_id"],
+                 match["score2"], match["score1"]),
+            )
+            for player_id, opponent_id, own, other in sides:
+                player = self._player(player_id)
+                per_tournament = player["tournaments"].setdefault(
+                    tournament_id, empty_aggregate()
+                )
+                _add_game(player["total"], opponent_id, own, other)
+                _add_game(per_tournament, opponent_id, own, other)
+        return True
+
+    def add_tournament(self, entry: Mapping[str, Any]) -> None:
+        """Comptabilise tous les rounds d'un tournoi (JSON)."""
+        for number, round_data in enumerate(entry.get("rounds", []), 1):
+            self.apply_round(entry["id"], number, round_data)
+
+    def remove_tournament(self, tournament_id: str) -> None:
+        """Retire la contribution d'un tournoi."""
+        for player_id in list(self.players):
+            player = self.players[player_id]
+            part = player["tournaments"].pop(tournament_id, None)
+            if part is None:
+                continue
+            _subtract(player["total"], part)
+            if not player["tournaments"]:
+                del self.players[player_id]
+        prefix = f"{tournament_id}:"
+        self.rounds = {
+            key for key in self.rounds if not key.startswith(prefix)
+        }
+
+    def career(self, player_id: str) -> dict[str, Any] | None:
+        """Agrégats d'un joueur (``total`` et ``tournaments``)."""
+        return self.players.get(player_id)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convertit les agrégats en dictionnaire JSON."""
+        return {"rounds": sorted(self.rounds), "players": self.players}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CareerStats":
+        """Reconstruit les agrégats depuis un dictionnaire."""
+        return cls(players=data.get("players"), rounds=data.get("rounds"))
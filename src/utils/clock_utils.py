@@ -0,0 +1,87 @@
+"""Horodatage des rounds et pendules de round.
+
+Les instants sont stockés en secondes depuis l'epoch (entiers) : ils se
+trient et se soustraient directement, et ne sont mis en forme qu'à
+l'affichage. Les durées écoulées sont mesurées avec ``time.monotonic``,
+insensible aux changements d'heure de la machine.
+"""
+
+import time
+
+# Format des horodatages lisibles (et des anciens fichiers)
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def now() -> int:
+    """Instant courant en secondes depuis l'epoch."""
+    return int(time.time())
+
+
+def to_epoch(value: int | float | str | None) -> int | None:
+    """Convertit un horodatage (epoch ou ancien texte) en epoch.
+
+    Les textes au format ``TIMESTAMP_FORMAT`` sont lus en heure locale ;
+    ``None`` et les textes illisibles donnent ``None``.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(time.mktime(time.strptime(value, TIMESTAMP_FORMAT)))
+    except ValueError:
+        return None
+
+
+def format_timestamp(
+    value: int | None, pattern: str = TIMESTAMP_FORMAT
+) -> str:
+    """Met en forme un epoch en heure locale (``""`` si absent)."""
+    if value is None:
+        return ""
+    return time.strftime(pattern, time.localtime(value))
+
+
+def format_duration(seconds: float) -> str:
+    """Durée au format ``H:MM:SS`` (négative : ``-H:MM:SS``)."""
+    sign = "-" if seconds < 0 else ""
+    minutes, secs = divmod(int(abs(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{sign}{hours}:{minutes:02d}:{secs:02d}"
+
+
+class RoundClock:
+    """Pendule d'un round en cours.
+
+    Le début est conservé en epoch (persistant) ; le temps écoulé est
+    mesuré sur l'horloge monotone depuis ce début. Une pendule reprise
+    après un redémarrage (``started_at`` lu dans le fichier) est
+    recalée une fois sur l'horloge murale, puis suit l'horloge monotone.
+    """
+
+    __slots__ = ("started_at", "deadline", "_origin")
+
+    def __init__(
+        self, started_at: int | None = None, deadline: int | None = None
+    ) -> None:
+        wall = time.time()
+        self.started_at = int(wall) if started_at is None else started_at
+        # Fin prévue (epoch), d'après le planning
+        self.deadline = deadline
+        self._origin = time.monotonic() - max(0.0, wall - self.started_at)
+
+    def elapsed(self) -> float:
+        """Secondes écoulées depuis le début du round."""
+        return time.monotonic() - self._origin
+
+    def remaining(self) -> float | None:
+        """Secondes restantes avant la fin prévue (``None`` sans planning)."""
+        if self.deadline is None:
+            return None
+        return self.deadline - self.started_at - self.elapsed()
+
+    @property
+    def is_overdue(self) -> bool:
+        """Indique si la fin prévue est dépassée."""
+        remaining = self.remaining()
+        return remaining is not None and remaining < 0
@@ -0,0 +1,53 @@
+"""Contrôle de cohérence : classement stocké contre classement recalculé.
+
+Les scores d'un tournoi sont cumulés round après round puis corrigés par
+différences : ``check_standings`` les recalcule entièrement à partir des
+rounds (matchs et exemptions) et signale tout écart, de même que pour des
+départages maintenus de façon incrémentale.
+"""
+
+from typing import NamedTuple
+
+from models import Tournament
+
+from .history_utils import TournamentHistory
+from .tiebreak_utils import TieBreaks
+
+# Écart toléré (les scores sont des multiples de 0,5)
+TOLERANCE = 1e-9
+
+
+class Drift(NamedTuple):
+    """Valeur stockée qui diffère de la valeur recalculée."""
+
+    player_id: str
+    field: str
+    stored: float
+    expected: float
+
+
+def check_standings(
+    tournament: Tournament, tiebreaks: TieBreaks | None = None
+) -> list[Drift]:
+    """Compare scores (et départages fournis) aux valeurs recalculées."""
+    expected = TournamentHistory.from_tournament(tournament).scores()
+    drifts = [
+        Drift(player.id, "score", score, expected[player.id])
+        for player, score in tournament.players
+        if abs(score - expected[player.id]) > TOLERANCE
+    ]
+    if tiebreaks is None:
+        return drifts
+
+    fresh = TieBreaks.from_rounds(expected, tournament.rounds)
+    for field, attribute in (
+        ("tiebreak_score", "scores"),
+        ("buchholz", "buchholz"),
+        ("sonneborn_berger", "sonneborn_berger"),
+    ):
+        stored_values = getattr(tiebreaks, attribute)
+        for player_id, value in getattr(fresh, attribute).items():
+            stored = stored_values.get(player_id, 0.0)
+            if abs(stored - value) > TOLERANCE:
+                drifts.append(Drift(player_id, field, stored, value))
+    return drifts
@@ -0,0 +1,152 @@
+"""Grille américaine d'un tournoi et face-à-face sur l'archive.
+
+``Crosstable`` remplit en un seul passage sur les rounds une matrice
+dense joueurs x rounds : pour chaque case, l'adversaire, la couleur
+(``player1`` a les blancs) et les points marqués. Les départages sont
+ceux de ``TieBreaks`` (``utils/tiebreak_utils.py``), partagés avec le
+classement du menu et du serveur de scores. Le rendu texte d'une
+case suit l'usage des arbitres : rang de l'adversaire, couleur, résultat
+(``12B+``, ``3N=``, ``EXE+`` pour une exemption).
+
+Les face-à-face sur toute l'archive sont tenus par ``ArchiveIndex``
+(``utils/query_utils.py``).
+"""
+
+from typing import NamedTuple
+
+from models import Player, Tournament
+
+from .html_utils import html_page, html_table
+from .pairing_utils import pairing_system
+from .tiebreak_utils import TieBreaks
+
+WHITE = "B"
+BLACK = "N"
+BYE = "EXE"
+
+
+class Cell(NamedTuple):
+    """Case de la grille : ``opponent`` est la ligne de l'adversaire."""
+
+    opponent: int | None
+    colour: str
+    points: float
+
+
+def result_symbol(points: float) -> str:
+    """``+``, ``=`` ou ``-`` selon les points marqués."""
+    if points >= 1.0:
+        return "+"
+    if points > 0:
+        return "="
+    return "-"
+
+
+class Crosstable:
+    """Grille américaine d'un tournoi, lignes triées par classement.
+
+    ``cells[i][r]`` est la case du joueur de la ligne ``i`` au round
+    ``r`` (``None`` s'il n'a ni joué ni été exempt).
+    """
+
+    def __init__(self, tournament: Tournament) -> None:
+        self.tournament = tournament
+        self.bye_points = pairing_system(tournament.pairing_system).bye_points
+        players = [player for player, _score in tournament.players]
+        scores = [float(score) for _player, score in tournament.players]
+        positions = {player.id: index for index, player in enumerate(players)}
+        rounds = len(tournament.rounds)
+        cells: list[list[Cell | None]] = [
+            [None] * rounds for _player in players
+        ]
+
+        for round_index, round_obj in enumerate(tournament.rounds):
+            for match in round_obj.matches:
+                row1 = positions.get(match.player1.id)
+                row2 = positions.get(match.player2.id)
+                if row1 is None or row2 is None:
+                    continue
+                cells[row1][round_index] = Cell(row2, WHITE, match.score1)
+                cells[row2][round_index] = Cell(row1, BLACK, match.score2)
+            bye_row = positions.get(round_obj.bye_player_id or "")
+            if bye_row is not None:
+                cells[bye_row][round_index] = Cell(
+                    None, "", self.bye_points
+                )
+
+        # Mêmes départages que le classement (exemptions non comptées)
+        tiebreaks = TieBreaks.from_rounds(
+            {player.id: score for player, score in zip(players, scores)},
+            tournament.rounds,
+        )
+        order = sorted(
+            range(len(players)),
+            key=lambda row: (
+                *tiebreaks.sort_key(players[row].id),
+                players[row].lastname.lower(),
+                players[row].firstname.lower(),
+            ),
+        )
+        new_rows = {old: new for new, old in enumerate(order)}
+        self.players: list[Player] = [players[row] for row in order]
+        self.scores = [scores[row] for row in order]
+        self.buchholz = [
+            tiebreaks.buchholz[player.id] for player in self.players
+        ]
+        self.sonneborn_berger = [
+            tiebreaks.sonneborn_berger[player.id] for player in self.players
+        ]
+        self.cells: list[list[Cell | None]] = [
+            [
+                cell
+                if cell is None or cell.opponent is None
+                else cell._replace(opponent=new_rows[cell.opponent])
+                for cell in cells[row]
+            ]
+            for row in order
+        ]
+
+    @property
+    def rounds(self) -> int:
+        """Nombre de rounds joués."""
+        return len(self.tournament.rounds)
+
+    def cell_text(self, cell: Cell | None) -> str:
+        """Texte d'une case : rang adverse, couleur et résultat."""
+        if cell is None:
+            return ""
+        if cell.opponent is None:
+            return BYE + result_symbol(cell.points)
+        return (
+            f"{cell.opponent + 1}{cell.colour}{result_symbol(cell.points)}"
+        )
+
+    def headers(self) -> list[str]:
+        """En-têtes des colonnes de la grille."""
+        return (
+            ["Rang", "ID", "Joueur"]
+            + [f"R{number}" for number in range(1, self.rounds + 1)]
+            + ["Points", "Buchholz", "S-B"]
+        )
+
+    def rows(self) -> list[list[str]]:
+        """Lignes de la grille, prêtes à afficher ou exporter."""
+        return [
+            [
+                str(rank),
+                player.id,
+                f"{player.lastname} {player.firstname}",
+                *(self.cell_text(cell) for cell in self.cells[rank - 1]),
+                f"{self.scores[rank - 1]:g}",
+                f"{self.buchholz[rank - 1]:g}",
+                f"{self.sonneborn_berger[rank - 1]:g}",
+            ]
+            for rank, player in enumerate(self.players, 1)
+        ]
+
+    def to_html(self) -> str:
+        """Page HTML autonome de la grille."""
+        return html_page(
+            f"{self.tournament.name} — grille américaine",
+            html_table(self.headers(), self.rows()),
+        )
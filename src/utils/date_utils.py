@@ -0,0 +1,98 @@
+"""Dates typées : analyse mémoïsée, mise en forme à la demande, index trié.
+
+Les modèles conservent leurs dates en ``datetime.date`` ; le texte
+``YYYY-MM-DD`` n'est produit qu'à l'affichage et à la sérialisation
+(``format_date``). Les chargements analysent les mêmes dates des milliers
+de fois (dates de tournois, naissances) : ``parse_date`` est mis en cache.
+Un texte illisible est conservé tel quel par ``to_date`` afin que la
+validation puisse le signaler.
+"""
+
+import re
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterable
+
+DATE_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
+DATE_FORMAT = "%Y-%m-%d"
+
+
+@lru_cache(maxsize=65_536)
+def parse_date(value: str) -> date | None:
+    """Analyse une date YYYY-MM-DD (résultat mis en cache)."""
+    if not DATE_PATTERN.match(value):
+        return None
+    try:
+        return datetime.strptime(value, DATE_FORMAT).date()
+    except ValueError:
+        return None
+
+
+def to_date(value: date | str | None) -> date | str:
+    """Date typée ; ``""`` si absente, texte illisible inchangé."""
+    if isinstance(value, date):
+        return value
+    if not value:
+        return ""
+    parsed = parse_date(value)
+    return value if parsed is None else parsed
+
+
+@lru_cache(maxsize=65_536)
+def _iso(value: date) -> str:
+    return value.isoformat()
+
+
+def format_date(value: date | str | None) -> str:
+    """Texte ``YYYY-MM-DD`` d'une date (mis en cache)."""
+    if isinstance(value, date):
+        return _iso(value)
+    return value or ""
+
+
+def date_sort_key(value: date | str | None) -> tuple[int, int, str]:
+    """Clé de tri : dates dans l'ordre, puis textes illisibles."""
+    if isinstance(value, date):
+        return (0, value.toordinal(), "")
+    return (1, 0, value or "")
+
+
+class DateIndex:
+    """Clés d'enregistrements (identifiants) triées par date.
+
+    Une requête par période (« tous les tournois de 2025 ») est une
+    double dichotomie, sans analyser aucun enregistrement ; ajouts et
+    retraits sont incrémentaux.
+    """
+
+    def __init__(self, entries: Iterable[tuple[date, str]] = ()) -> None:
+        self._entries = sorted(
+            (day.toordinal(), key) for day, key in entries
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, day: date, key: str) -> None:
+        """Indexe ``key`` à la date ``day``."""
+        insort(self._entries, (day.toordinal(), key))
+
+    def remove(self, day: date, key: str) -> None:
+        """Retire ``key`` indexé à la date ``day`` (s'il l'est)."""
+        entry = (day.toordinal(), key)
+        index = bisect_left(self._entries, entry)
+        if index < len(self._entries) and self._entries[index] == entry:
+            del self._entries[index]
+
+    def between(
+        self, start: date | None = None, end: date | None = None
+    ) -> list[str]:
+        """Clés datées de ``start`` à ``end`` inclus, dans l'ordre."""
+        low = 0 if start is None else bisect_left(
+            self._entries, (start.toordinal(),)
+        )
+        high = len(self._entries) if end is None else bisect_left(
+            self._entries, (end.toordinal() + 1,)
+        )
+        return [key for _ordinal, key in self._entries[low:high]]
@@ -0,0 +1,115 @@
+"""Détection des joueurs en double par clés de blocage.
+
+Comparer chaque joueur à tous les autres coûte O(n²). Les joueurs sont
+d'abord répartis en blocs selon des clés de blocage (date de naissance et
+nom normalisé, ou date de naissance et début du nom ou du prénom) ; seules
+les paires d'un même bloc sont notées. Un bloc ne contient en pratique
+qu'une poignée de joueurs, d'où un coût proche de O(n).
+"""
+
+from typing import Any, Iterable, Mapping, NamedTuple
+
+from .date_utils import parse_date
+from .search_utils import normalize, trigrams
+
+DUPLICATE_THRESHOLD = 0.8
+NAME_WEIGHT = 0.7
+PREFIX_LENGTH = 3
+
+
+class DuplicateCandidate(NamedTuple):
+    """Paire de joueurs probablement identiques (score de 0 à 1)."""
+
+    player_id: str
+    other_id: str
+    score: float
+
+
+def _name_tokens(record: Mapping[str, Any]) -> list[str]:
+    return normalize(f"{record['lastname']} {record['firstname']}").split()
+
+
+def _birthday(record: Mapping[str, Any]) -> str:
+    """Date de naissance lisible au format texte, ``""`` sinon."""
+    value = record.get("birthday") or ""
+    return value if parse_date(value) is not None else ""
+
+
+def blocking_keys(record: Mapping[str, Any]) -> set[str]:
+    """Clés de blocage d'un joueur (JSON ``Player.to_dict``).
+
+    - date de naissance + nom complet normalisé, mots triés (casse,
+      accents, espaces et inversion nom/prénom ignorés) ;
+    - date de naissance + début du nom, puis + début du prénom (faute
+      de frappe dans l'autre champ).
+
+    Sans date de naissance lisible, seul le nom complet sert de clé.
+    """
+    birthday = _birthday(record)
+    keys = {f"{birthday}|{' '.join(sorted(_name_tokens(record)))}"}
+    if birthday:
+        lastname = normalize(record["lastname"])
+        firstname = normalize(record["firstname"])
+        keys.add(f"{birthday}|n:{lastname[:PREFIX_LENGTH]}")
+        keys.add(f"{birthday}|p:{firstname[:PREFIX_LENGTH]}")
+    return keys
+
+
+def score_pair(
+    record: Mapping[str, Any], other: Mapping[str, Any]
+) -> float:
+    """Ressemblance de deux joueurs, de 0 à 1.
+
+    Le nom (trigrammes communs, mots triés) compte pour ``NAME_WEIGHT`` ;
+    le reste revient à une date de naissance identique (la moitié si
+    l'une des deux manque).
+    """
+    name = " ".join(sorted(_name_tokens(record)))
+    other_name = " ".join(sorted(_name_tokens(other)))
+    if name == other_name:
+        similarity = 1.0
+    else:
+        grams, other_grams = trigrams(name), trigrams(other_name)
+        similarity = len(grams & other_grams) / len(grams | other_grams)
+
+    birthday, other_birthday = _birthday(record), _birthday(other)
+    if birthday and other_birthday:
+        birthday_score = 1.0 if birthday == other_birthday else 0.0
+    else:
+        birthday_score = 0.5
+    return round(
+        NAME_WEIGHT * similarity + (1 - NAME_WEIGHT) * birthday_score, 3
+    )
+
+
+def find_duplicates(
+    records: Iterable[Mapping[str, Any]],
+    threshold: float = DUPLICATE_THRESHOLD,
+) -> list[DuplicateCandidate]:
+    """Paires de joueurs d'un même bloc dont le score atteint le seuil.
+
+    Triées par score décroissant ; dans chaque paire, l'identifiant le
+    plus petit vient en premier.
+    """
+    records = {record["id"]: record for record in records}
+    blocks: dict[str, list[str]] = {}
+    for player_id, record in records.items():
+        for key in blocking_keys(record):
+            blocks.setdefault(key, []).append(player_id)
+
+    seen: set[tuple[str, str]] = set()
+    candidates = []
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        for index, player_id in enumerate(members):
+            for other_id in members[index + 1:]:
+                pair = tuple(sorted((player_id, other_id)))
+                if pair in seen:
+                    continue
+                seen.add(pair)
+                score = score_pair(records[pair[0]], records[pair[1]])
+                if score >= threshold:
+                    candidates.append(DuplicateCandidate(*pair, score))
+    candidates.sort(key=lambda candidate: (-candidate.score, candidate[:2]))
+    return candidates
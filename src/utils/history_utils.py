@@ -0,0 +1,272 @@
+"""Historique des rounds d'un tournoi : instantanés, annulation, rejeu.
+
+Chaque round clôturé est figé dans un ``RoundSnapshot`` immuable (ses
+résultats et le classement cumulé qui en découle). Une version du tournoi
+est un tuple de ces instantanés : corriger le round ``N`` crée une version
+qui partage tels quels les instantanés des rounds ``1..N-1`` et ne
+recalcule que les rounds ``N`` et suivants ; les résultats des rounds
+suivants, inchangés, sont eux aussi repris sans copie. Annuler ou rétablir
+revient à changer de version.
+"""
+
+from typing import Iterable, NamedTuple
+
+from models import Round, Tournament
+
+from .pairing_utils import pairing_system
+
+
+class FrozenMatch(NamedTuple):
+    """Résultat figé d'un match."""
+
+    player1_id: str
+    player2_id: str
+    score1: float
+    score2: float
+
+
+class FrozenRound(NamedTuple):
+    """Résultats figés d'un round et son exempt."""
+
+    matches: tuple[FrozenMatch, ...]
+    bye_player_id: str | None
+
+
+class RoundSnapshot(NamedTuple):
+    """Round figé et scores cumulés après ce round (par indice)."""
+
+    round: FrozenRound
+    scores: tuple[float, ...]
+
+
+def freeze_round(round_obj: Round) -> FrozenRound:
+    """Fige les résultats d'un ``Round``."""
+    return FrozenRound(
+        tuple(
+            FrozenMatch(
+                match.player1.id, match.player2.id, match.score1, match.score2
+            )
+            for match in round_obj.matches
+        ),
+        round_obj.bye_player_id,
+    )
+
+
+class TournamentHistory:
+    """Versions successives des rounds clôturés d'un tournoi.
+
+    Les indices de rounds sont comptés à partir de 1, comme dans les
+    menus ; ``version`` est le tuple d'instantanés courant.
+    """
+
+    def __init__(
+        self,
+        player_ids: Iterable[str],
+        rounds: Iterable[FrozenRound] = (),
+        bye_points: float = 1.0,
+    ) -> None:
+        self.player_ids = tuple(player_ids)
+        self._positions = {
+            player_id: index for index, player_id in enumerate(self.player_ids)
+        }
+        self.bye_points = bye_points
+        self.version: tuple[RoundSnapshot, ...] = self._replay(
+            (), tuple(rounds), 0
+        )
+        self._undo: list[tuple[RoundSnapshot, ...]] = []
+        self._redo: list[tuple[RoundSnapshot, ...]] = []
+
+    @classmethod
+    def from_tournament(cls, tournament: Tournament) -> "TournamentHistory":
+        """Historique des rounds déjà clôturés d'un tournoi."""
+        return cls(
+            (player.id for player, _score in tournament.players),
+            (freeze_round(round_obj) for round_obj in tournament.rounds),
+            pairing_system(tournament.pairing_system).bye_points,
+        )
+
+    def matches(self, tournament: Tournament) -> bool:
+        """Indique si l'historique décrit encore les rounds du tournoi.
+
+        Les joueurs et les rounds figés doivent être ceux du tournoi ; des
+        rounds joués depuis (ou retirés) ne comptent pas comme un écart.
+        """
+        if self.player_ids != tuple(
+            player.id for player, _score in tournament.players
+        ):
+            return False
+        return all(
+            snapshot.round == freeze_round(round_obj)
+            for snapshot, round_obj in zip(self.version, tournament.rounds)
+        )
+
+    @property
+    def can_undo(self) -> bool:
+        """Indique si une correction peut être annulée."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Indique si une correction annulée peut être rétablie."""
+        return bool(self._redo)
+
+    def scores(self, round_num: int | None = None) -> dict[str, float]:
+        """Scores après le round ``round_num`` (par défaut le dernier)."""
+        if round_num is None:
+            round_num = len(self.version)
+        if round_num == 0:
+            return dict.fromkeys(self.player_ids, 0.0)
+        return dict(zip(self.player_ids, self.version[round_num - 1].scores))
+
+    def _replay(
+        self,
+        kept: tuple[RoundSnapshot, ...],
+        rounds: tuple[FrozenRound, ...],
+        start: int,
+    ) -> tuple[RoundSnapshot, ...]:
+        """Instantanés des ``rounds``, recalculés à partir de ``start``.
+
+        ``start`` est un indice (0 = premier round) ; les instantanés
+        ``kept[:start]`` sont repris tels quels.
+        """
+        snapshots = list(kept[:start])
+        scores = (
+            list(snapshots[-1].scores)
+            if snapshots
+            else [0.0] * len(self.player_ids)
+        )
+        for frozen in rounds[start:]:
+            for match in frozen.matches:
+                for player_id, points in (
+                    (match.player1_id, match.score1),
+                    (match.player2_id, match.score2),
+                ):
+                    position = self._positions.get(player_id)
+                    if position is not None:
+                        scores[position] += points
+            if frozen.bye_player_id in self._positions:
+                scores[self._positions[frozen.bye_player_id]] += (
+                    self.bye_points
+                )
+            snapshots.append(RoundSnapshot(frozen, tuple(scores)))
+        return tuple(snapshots)
+
+    def _commit(self, version: tuple[RoundSnapshot, ...]) -> None:
+        self._undo.append(self.version)
+        self._redo.clear()
+        self.version = version
+
+    def append(self, round_obj: Round) -> None:
+        """Ajoute un round qui vient d'être clôturé.
+
+        Ce round a été apparié sur les résultats courants : les
+        corrections précédentes ne peuvent plus être annulées.
+        """
+        rounds = tuple(snapshot.round for snapshot in self.version)
+        self.version = self._replay(
+            self.version, rounds + (freeze_round(round_obj),), len(rounds)
+        )
+        self._undo.clear()
+        self._redo.clear()
+
+    def refresh(self, tournament: Tournament, from_round: int = 1) -> None:
+        """Refige les rounds du tournoi à partir de ``from_round``.
+
+        Seuls ces rounds sont rejoués ; annulations et rétablissements en
+        attente sont abandonnés.
+        """
+        kept = tuple(
+            snapshot.round for snapshot in self.version[:from_round - 1]
+        )
+        rounds = kept + tuple(
+            freeze_round(round_obj)
+            for round_obj in tournament.rounds[from_round - 1:]
+        )
+        self.version = self._replay(self.version, rounds, from_round - 1)
+        self._undo.clear()
+        self._redo.clear()
+
+    def correct(
+        self, round_num: int, board: int, score1: float, score2: float
+    ) -> int:
+        """Corrige le résultat d'un échiquier et retourne le round rejoué.
+
+        Seuls le round corrigé et les suivants sont recalculés.
+        """
+        if not 1 <= round_num <= len(self.version):
+            raise ValueError(f"Round {round_num} non joué.")
+        frozen = self.version[round_num - 1].round
+        if not 1 <= board <= len(frozen.matches):
+            raise ValueError(f"Échiquier invalide : {board}")
+        matches = list(frozen.matches)
+        matches[board - 1] = matches[board - 1]._replace(
+            score1=score1, score2=score2
+        )
+        rounds = [snapshot.round for snapshot in self.version]
+        rounds[round_num - 1] = frozen._replace(matches=tuple(matches))
+        self._commit(self._replay(self.version, tuple(rounds), round_num - 1))
+        return round_num
+
+    def undo(self) -> int | None:
+        """Revient à la version précédente.
+
+        Retourne le premier round qui diffère (``None`` s'il n'y a rien à
+        annuler).
+        """
+        if not self._undo:
+            return None
+        previous = self._undo.pop()
+        self._redo.append(self.version)
+        return self._switch(previous)
+
+    def redo(self) -> int | None:
+        """Rétablit la version annulée ; voir ``undo``."""
+        if not self._redo:
+            return None
+        following = self._redo.pop()
+        self._undo.append(self.version)
+        return self._switch(following)
+
+    def _switch(self, version: tuple[RoundSnapshot, ...]) -> int:
+        first = first_difference(self.version, version)
+        self.version = version
+        return first
+
+    def restore(self, tournament: Tournament, from_round: int = 1) -> None:
+        """Reporte la version courante sur le tournoi.
+
+        Seuls les rounds à partir de ``from_round`` sont parcourus, et
+        seuls les scores modifiés sont réécrits.
+        """
+        for round_obj, snapshot in zip(
+            tournament.rounds[from_round - 1:],
+            self.version[from_round - 1:],
+        ):
+            frozen_matches = snapshot.round.matches
+            for match, frozen in zip(round_obj.matches, frozen_matches):
+                if (match.score1, match.score2) != (
+                    frozen.score1,
+                    frozen.score2,
+                ):
+                    match.score1 = frozen.score1
+                    match.score2 = frozen.score2
+        scores = self.scores()
+        for entry in tournament.players:
+            score = scores.get(entry[0].id)
+            if score is not None and entry[1] != score:
+                entry[1] = score
+                tournament.mark_dirty()
+
+
+def first_difference(
+    first: tuple[RoundSnapshot, ...], second: tuple[RoundSnapshot, ...]
+) -> int:
+    """Premier round (à partir de 1) dont les instantanés diffèrent.
+
+    Les instantanés partagés sont reconnus par identité, sans comparer
+    leur contenu.
+    """
+    for index, (left, right) in enumerate(zip(first, second)):
+        if left is not right:
+            return index + 1
+    return min(len(first), len(second)) + 1
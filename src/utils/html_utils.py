@@ -0,0 +1,51 @@
+"""Fragments HTML des pages exportées (grilles, site publié)."""
+
+from html import escape
+from typing import Iterable, Sequence
+
+STYLE = (
+    "body{font-family:sans-serif;margin:1.5em}"
+    "table{border-collapse:collapse;margin-bottom:1em}"
+    "th,td{border:1px solid #999;padding:2px 6px;text-align:center}"
+    "nav a{margin-right:1em}"
+)
+
+
+def html_table(
+    headers: Sequence[str], rows: Iterable[Sequence[str]]
+) -> str:
+    """Tableau HTML (valeurs échappées)."""
+    header = "".join(f"<th>{escape(label)}</th>" for label in headers)
+    body = "\n".join(
+        "<tr>"
+        + "".join(f"<td>{escape(str(value))}</td>" for value in row)
+        + "</tr>"
+        for row in rows
+    )
+    return (
+        f"<table>\n<thead><tr>{header}</tr></thead>\n"
+        f"<tbody>\n{body}\n</tbody>\n</table>\n"
+    )
+
+
+def html_links(links: Iterable[tuple[str, str]]) -> str:
+    """Barre de navigation : couples (libellé, lien relatif)."""
+    anchors = "".join(
+        f'<a href="{escape(href)}">{escape(label)}</a>'
+        for label, href in links
+    )
+    return f"<nav>{anchors}</nav>\n" if anchors else ""
+
+
+def html_page(
+    title: str, body: str, links: Iterable[tuple[str, str]] = ()
+) -> str:
+    """Page HTML autonome (``body`` déjà en HTML)."""
+    title = escape(title)
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="fr">\n<head>\n<meta charset="utf-8">\n'
+        f"<title>{title}</title>\n<style>{STYLE}</style>\n"
+        f"</head>\n<body>\n{html_links(links)}<h1>{title}</h1>\n"
+        f"{body}</body>\n</html>\n"
+    )
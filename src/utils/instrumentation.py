@@ -0,0 +1,202 @@
+"""Instrumentation optionnelle : durées et nombres d'appels.
+
+Désactivée par défaut. Elle s'active avec la variable d'environnement
+``OC_CHESS_PROFILE`` (``1`` ou chemin du fichier d'export) ou avec l'option
+``--profile[=chemin]`` des points d'entrée. Un résumé est affiché sur la
+sortie d'erreur à la fin du programme ; un chemin se terminant par
+``.trace.json`` produit un export au format Chrome trace (chrome://tracing),
+tout autre chemin un export JSON des statistiques.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, TypeVar
+
+PROFILE_ENV_VAR = "OC_CHESS_PROFILE"
+PROFILE_FLAG = "--profile"
+MAX_TRACE_EVENTS = 200_000
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Instrumentation:
+    """Registre des mesures : statistiques agrégées et événements."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.output_path: str | None = None
+        self.stats: dict[str, list[float]] = {}
+        self.events: list[tuple[str, float, float]] = []
+        self._origin = time.perf_counter()
+        self._exit_hook_registered = False
+
+    def enable(self, output_path: str | None = None) -> None:
+        """Active la collecte et programme le résumé de fin."""
+        self.enabled = True
+        self.output_path = output_path or self.output_path
+        if not self._exit_hook_registered:
+            atexit.register(self.report)
+            self._exit_hook_registered = True
+
+    def disable(self) -> None:
+        """Coupe la collecte sans effacer les mesures existantes."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Efface toutes les mesures."""
+        self.stats.clear()
+        self.events.clear()
+        self._origin = time.perf_counter()
+
+    def record(self, name: str, start: float, duration: float) -> None:
+        """Enregistre un appel : [nombre, total, max] par nom."""
+        entry = self.stats.get(name)
+        if entry is None:
+            self.stats[name] = [1, duration, duration]
+        else:
+            entry[0] += 1
+            entry[1] += duration
+            if duration > entry[2]:
+                entry[2] = duration
+        if len(self.events) < MAX_TRACE_EVENTS:
+            self.events.append((name, start - self._origin, duration))
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Statistiques triées par temps total décroissant."""
+        rows = [
+            {
+                "name": name,
+                "calls": int(count),
+                "total_ms": total * 1000,
+                "mean_ms": total * 1000 / count,
+                "max_ms": maximum * 1000,
+            }
+            for name, (count, total, maximum) in self.stats.items()
+        ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def export(self, path: str) -> None:
+        """Exporte les mesures en JSON ou au format Chrome trace."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if path.endswith(".trace.json"):
+            payload: Any = {
+                "traceEvents": [
+                    {
+                        "name": name,
+                        "ph": "X",
+                        "ts": start * 1_000_000,
+                        "dur": duration * 1_000_000,
+                        "pid": os.getpid(),
+                        "tid": 0,
+                    }
+                    for name, start, duration in self.events
+                ]
+            }
+        else:
+            payload = self.summary()
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2)
+
+    def report(self) -> None:
+        """Affiche le résumé et écrit l'export éventuel."""
+        if not self.stats:
+            return
+        print("\n=== Instrumentation ===", file=sys.stderr)
+        print(
+            f"{'mesure':<48} {'appels':>8} {'total ms':>10} "
+            f"{'moy. ms':>9} {'max ms':>9}",
+            file=sys.stderr,
+        )
+        for row in self.summary():
+            print(
+                f"{row['name'][:48]:<48} {row['calls']:>8} "
+                f"{row['total_ms']:>10.2f} {row['mean_ms']:>9.3f} "
+                f"{row['max_ms']:>9.3f}",
+                file=sys.stderr,
+            )
+        if self.output_path:
+            self.export(self.output_path)
+            print(f"Export : {self.output_path}", file=sys.stderr)
+
+
+INSTRUMENTATION = Instrumentation()
+_DISABLED = nullcontext()
+
+
+class _Timer:
+    """Context manager mesurant un bloc nommé."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        INSTRUMENTATION.record(
+            self.name, self.start, time.perf_counter() - self.start
+        )
+
+
+def timed(name: str) -> Any:
+    """Mesure un bloc : ``with timed("nom"): ...``."""
+    if not INSTRUMENTATION.enabled:
+        return _DISABLED
+    return _Timer(name)
+
+
+def instrumented(name: str | None = None) -> Callable[[F], F]:
+    """Décorateur mesurant chaque appel de la fonction décorée."""
+
+    def decorator(func: F) -> F:
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not INSTRUMENTATION.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                INSTRUMENTATION.record(
+                    label, start, time.perf_counter() - start
+                )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def configure_profiling(argv: list[str] | None = None) -> None:
+    """Active l'instrumentation selon l'environnement et les arguments.
+
+    L'option ``--profile`` est retirée de ``argv`` une fois traitée.
+    """
+    env_value = os.environ.get(PROFILE_ENV_VAR, "")
+    if env_value and env_value != "0":
+        INSTRUMENTATION.enable(None if env_value == "1" else env_value)
+
+    if argv is None:
+        return
+    for argument in list(argv[1:]):
+        if argument == PROFILE_FLAG:
+            INSTRUMENTATION.enable()
+            argv.remove(argument)
+        elif argument.startswith(PROFILE_FLAG + "="):
+            INSTRUMENTATION.enable(argument.split("=", 1)[1])
+            argv.remove(argument)
+
+
+configure_profiling()
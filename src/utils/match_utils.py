@@ -1,8 +1,14 @@
-"""Utilitaires pour l'appariement des matchs selon le système suisse."""
+"""Utilitaires pour l'appariement des matchs d'un tournoi."""
+
+from array import array
 
 from models import Match, Player, Tournament
 
+from .instrumentation import instrumented
+from .pairing_utils import PairingJob, PairingResult, run_pairing
+
 
+@instrumented("pair_players_first_round")
 def pair_players_first_round(
     players: list[Player],
 ) -> tuple[list[Match], Player | None]:
@@ -25,67 +31,97 @@ def pair_players_first_round(
     return matches, bye_player
 
 
+@instrumented("pair_players_by_score")
 def pair_players_by_score(
     tournament: Tournament,
 ) -> tuple[list[Match], Player | None]:
     """Apparier les joueurs par score (système suisse)."""
-    sorted_players = sorted(
-        tournament.players,
-        key=lambda player_data: player_data[1],
-        reverse=True,
+    job = encode_pairing(tournament, max(2, tournament.current_round))
+    job = job._replace(system="swiss")
+    return decode_pairing(tournament, run_pairing(job))
+
+
+def encode_pairing(tournament: Tournament, round_num: int) -> PairingJob:
+    """Réduit un tournoi aux tableaux compacts de ``pairing_utils``.
+
+    L'indice d'un joueur est sa position dans ``tournament.players``.
+    """
+    positions = {
+        player.id: index
+        for index, (player, _score) in enumerate(tournament.players)
+    }
+    scores = array("d", (score for _player, score in tournament.players))
+    history = array("i")
+    for round_obj in tournament.rounds:
+        for match in round_obj.matches:
+            first = positions.get(match.player1.id)
+            second = positions.get(match.player2.id)
+            if first is not None and second is not None:
+                history.append(first)
+                history.append(second)
+    byes = array(
+        "i",
+        (
+            tournament.byes.get(player.id, 0)
+            for player, _score in tournament.players
+        ),
+    )
+    return PairingJob(
+        tournament.id,
+        round_num,
+        scores,
+        history,
+        tournament.seed,
+        byes,
+        tournament.pairing_system,
+        count_losses(tournament, positions),
     )
 
-    played_pairs = get_played_pairs(tournament)
-
-    matches: list[Match] = []
-    paired: set[str] = set()
-
-    for index, (player1, _score1) in enumerate(sorted_players):
-        if player1.id in paired:
-            continue
-
-        best_opponent = None
-        for inner_index in range(index + 1, len(sorted_players)):
-            player2, _score2 = sorted_players[inner_index]
 
-            if player2.id in paired:
+def count_losses(
+    tournament: Tournament, positions: dict[str, int] | None = None
+) -> array:
+    """Nombre de matchs perdus par joueur, par indice."""
+    if positions is None:
+        positions = {
+            player.id: index
+            for index, (player, _score) in enumerate(tournament.players)
+        }
+    losses = array("i", bytes(4 * len(tournament.players)))
+    for round_obj in tournament.rounds:
+        for match in round_obj.matches:
+            if match.score1 < match.score2:
+                loser = positions.get(match.player1.id)
+            elif match.score2 < match.score1:
+                loser = positions.get(match.player2.id)
+            else:
                 continue
+            if loser is not None:
+                losses[loser] += 1
+    return losses
 
-            pair = tuple(sorted([player1.id, player2.id]))
-
-            if pair not in played_pairs:
-                best_opponent = inner_index
-                break
-
-            if best_opponent is None:
-                best_opponent = inner_index
-
-        if best_opponent is not None:
-            opponent, _ = sorted_players[best_opponent]
-            match = Match(
-                player1=player1,
-                player2=opponent,
-                score1=0.0,
-                score2=0.0,
-            )
-            matches.append(match)
-            paired.add(player1.id)
-            paired.add(opponent.id)
-
-    bye_player: Player | None = None
-    if len(paired) < len(sorted_players):
-        for player, _score in sorted_players:
-            if player.id not in paired:
-                bye_player = player
-                break
 
+def decode_pairing(
+    tournament: Tournament, result: PairingResult
+) -> tuple[list[Match], Player | None]:
+    """Reconstruit les matchs et l'exempt à partir des indices."""
+    players = [player for player, _score in tournament.players]
+    matches = [
+        Match(
+            player1=players[result.pairs[index]],
+            player2=players[result.pairs[index + 1]],
+            score1=0.0,
+            score2=0.0,
+        )
+        for index in range(0, len(result.pairs), 2)
+    ]
+    bye_player = players[result.bye] if result.bye >= 0 else None
     return matches, bye_player
 
 
 def get_played_pairs(tournament: Tournament) -> set[tuple[str, str]]:
     """Récupérer toutes les paires de joueurs déjà affrontées."""
     played_pairs: set[tuple[str, str]] = set()
-    print("debug  : ", tournament.rounds[0])
     for round_obj in tournament.rounds:
         for match in round_obj.matches:
             pair = tuple(sorted([match.player1.id, match.player2.id]))
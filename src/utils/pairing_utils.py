@@ -0,0 +1,311 @@
+"""Systèmes d'appariement sur tableaux compacts.
+
+Un tournoi y est réduit à des indices de joueurs (0..n-1), un tableau de
+scores, le nombre d'exemptions de chacun et l'historique des rencontres
+sous forme de paires d'indices à plat. Ces tableaux se sérialisent en
+quelques octets par joueur : ce sont eux, et non les objets
+``Tournament``, qui sont envoyés aux processus de calcul. Le module
+n'importe pas les modèles.
+
+Chaque système (suisse, toutes rondes, élimination simple ou double) est
+une fonction ``PairingJob -> (paires, exempt)`` enregistrée dans
+``PAIRING_SYSTEMS`` sous le nom persisté dans le tournoi.
+"""
+
+import random
+from array import array
+from functools import lru_cache
+from typing import Callable, Iterable, NamedTuple
+
+
+class PairingJob(NamedTuple):
+    """Entrée d'un appariement : scores et rencontres par indice."""
+
+    key: str
+    round_num: int
+    scores: array
+    history: array
+    seed: int = 0
+    byes: array | None = None
+    system: str = "swiss"
+    # Défaites par joueur (systèmes à élimination)
+    losses: array | None = None
+
+
+class PairingResult(NamedTuple):
+    """Paires d'indices à plat (i0, j0, i1, j1…) et exempt (-1 si aucun)."""
+
+    key: str
+    pairs: array
+    bye: int
+
+
+def select_bye(order: list[int], byes: array | None) -> int:
+    """Exempt d'un nombre impair de joueurs (-1 si nombre pair).
+
+    Le joueur retenu est le dernier de ``order`` (groupe de score le plus
+    bas) parmi ceux qui ont reçu le moins d'exemptions : personne n'est
+    exempté deux fois tant qu'un autre ne l'a pas été.
+    """
+    if len(order) % 2 == 0:
+        return -1
+    if not byes:
+        return order[-1]
+    fewest = min(byes[player] for player in order)
+    for player in reversed(order):
+        if byes[player] == fewest:
+            return player
+    return -1
+
+
+def draw_order(count: int, seed: int) -> list[int]:
+    """Tirage au sort des indices, rejouable à partir de la graine."""
+    order = list(range(count))
+    random.Random(f"{seed}:1").shuffle(order)
+    return order
+
+
+def pair_indices(
+    scores: array,
+    history: array,
+    round_num: int,
+    seed: int = 0,
+    byes: array | None = None,
+) -> tuple[array, int]:
+    """Apparie les joueurs par indice (système suisse).
+
+    Au premier round, les joueurs sont tirés au sort avec un générateur
+    initialisé par ``seed`` (même graine, même tirage) ; ensuite ils sont
+    classés par score décroissant (ordre des indices à égalité).
+    L'exempt éventuel est choisi d'abord (voir ``select_bye``) ; chaque
+    autre joueur affronte le premier adversaire libre qu'il n'a pas encore
+    rencontré, ou à défaut le premier adversaire libre.
+    """
+    count = len(scores)
+    if round_num == 1:
+        order = draw_order(count, seed)
+    else:
+        order = sorted(range(count), key=lambda index: -scores[index])
+
+    bye = select_bye(order, byes)
+    if bye >= 0:
+        order.remove(bye)
+
+    played = set()
+    for position in range(0, len(history) - 1, 2):
+        first, second = history[position], history[position + 1]
+        if first > second:
+            first, second = second, first
+        played.add(first * count + second)
+
+    pairs = array("i")
+    paired = bytearray(count)
+    for position, player in enumerate(order):
+        if paired[player]:
+            continue
+        best = -1
+        for opponent in order[position + 1:]:
+            if paired[opponent]:
+                continue
+            low, high = min(player, opponent), max(player, opponent)
+            if low * count + high not in played:
+                best = opponent
+                break
+            if best < 0:
+                best = opponent
+        if best >= 0:
+            pairs.append(player)
+            pairs.append(best)
+            paired[player] = paired[best] = 1
+    return pairs, bye
+
+
+def pair_swiss(job: PairingJob) -> tuple[array, int]:
+    """Système suisse (voir ``pair_indices``)."""
+    return pair_indices(
+        job.scores, job.history, job.round_num, job.seed, job.byes
+    )
+
+
+@lru_cache(maxsize=64)
+def berger_table(seats: int) -> tuple[array, ...]:
+    """Tables de Berger pour un nombre pair de places.
+
+    Une table par round : paires de places à plat (blancs, noirs). La
+    dernière place est fixe, les autres tournent d'un cran par round, si
+    bien que chaque place rencontre chacune des autres exactement une fois
+    en ``seats - 1`` rounds.
+    """
+    pivot = seats - 1
+    tables = []
+    for round_index in range(pivot):
+        table = array("i")
+        if round_index % 2:
+            table.extend((pivot, round_index))
+        else:
+            table.extend((round_index, pivot))
+        for offset in range(1, seats // 2):
+            table.append((round_index + offset) % pivot)
+            table.append((round_index - offset) % pivot)
+        tables.append(table)
+    return tuple(tables)
+
+
+def pair_round_robin(job: PairingJob) -> tuple[array, int]:
+    """Toutes rondes : lecture de la table de Berger du round.
+
+    Les places sont attribuées par le tirage au sort ; avec un nombre
+    impair de joueurs, une place fictive désigne l'exempt du round. Au-delà
+    d'un cycle, les tables sont reprises couleurs inversées.
+    """
+    count = len(job.scores)
+    seats = count + count % 2
+    if seats < 2:
+        return array("i"), -1
+    order = draw_order(count, job.seed)
+    cycle, round_index = divmod(job.round_num - 1, seats - 1)
+    table = berger_table(seats)[round_index]
+
+    pairs = array("i")
+    bye = -1
+    for position in range(0, len(table), 2):
+        white, black = table[position], table[position + 1]
+        if cycle % 2:
+            white, black = black, white
+        if white >= count:
+            bye = order[black]
+        elif black >= count:
+            bye = order[white]
+        else:
+            pairs.append(order[white])
+            pairs.append(order[black])
+    return pairs, bye
+
+
+def _pair_in_order(
+    order: list[int], byes: array | None
+) -> tuple[array, int]:
+    """Apparie des joueurs voisins dans ``order``, après l'exempt."""
+    bye = select_bye(order, byes)
+    if bye >= 0:
+        order.remove(bye)
+    pairs = array("i", order[: len(order) - len(order) % 2])
+    return pairs, bye
+
+
+def pair_single_elimination(job: PairingJob) -> tuple[array, int]:
+    """Élimination directe : les joueurs invaincus, voisins dans le tableau.
+
+    L'ordre du tableau est le tirage au sort : les vainqueurs de deux
+    matchs voisins se rencontrent au round suivant. Avec un nombre impair
+    de qualifiés, l'exempt passe directement au round suivant.
+    """
+    losses = job.losses or array("i", bytes(4 * len(job.scores)))
+    order = [
+        player
+        for player in draw_order(len(job.scores), job.seed)
+        if losses[player] == 0
+    ]
+    if len(order) < 2:
+        return array("i"), -1
+    return _pair_in_order(order, job.byes)
+
+
+def pair_double_elimination(job: PairingJob) -> tuple[array, int]:
+    """Double élimination : tableau des invaincus puis tableau des repêchés.
+
+    Un joueur est éliminé à sa deuxième défaite. Les invaincus sont
+    appariés entre voisins, puis les joueurs à une défaite ; si le premier
+    tableau est impair, son dernier joueur affronte le premier repêché.
+    La finale oppose les deux derniers joueurs ; si le repêché la gagne,
+    un match décisif suit.
+    """
+    losses = job.losses or array("i", bytes(4 * len(job.scores)))
+    order = draw_order(len(job.scores), job.seed)
+    winners = [player for player in order if losses[player] == 0]
+    losers = [player for player in order if losses[player] == 1]
+    if len(winners) + len(losers) < 2:
+        return array("i"), -1
+    return _pair_in_order(winners + losers, job.byes)
+
+
+class PairingSystem(NamedTuple):
+    """Système d'appariement enregistrable dans ``PAIRING_SYSTEMS``.
+
+    ``rounds(joueurs, demandé)`` donne le nombre de rounds du tournoi
+    (un maximum pour la double élimination, qui s'arrête au dernier
+    joueur qualifié). ``max_losses`` vaut le nombre de défaites
+    éliminatoires (``None`` sans élimination).
+    """
+
+    pair: Callable[[PairingJob], tuple[array, int]]
+    rounds: Callable[[int, int], int]
+    max_losses: int | None = None
+    bye_points: float = 1.0
+
+    @property
+    def allows_draws(self) -> bool:
+        """Un match nul ne départage pas deux joueurs à éliminer."""
+        return self.max_losses is None
+
+
+PAIRING_SYSTEMS: dict[str, PairingSystem] = {
+    "swiss": PairingSystem(
+        pair=pair_swiss,
+        rounds=lambda players, requested: requested,
+    ),
+    "round_robin": PairingSystem(
+        pair=pair_round_robin,
+        rounds=lambda players, requested: players + players % 2 - 1,
+        bye_points=0.0,
+    ),
+    "single_elimination": PairingSystem(
+        pair=pair_single_elimination,
+        rounds=lambda players, requested: (players - 1).bit_length(),
+        max_losses=1,
+    ),
+    "double_elimination": PairingSystem(
+        pair=pair_double_elimination,
+        rounds=lambda players, requested: (
+            2 * (players - 1).bit_length() + 2
+        ),
+        max_losses=2,
+    ),
+}
+
+
+# Systèmes applicables aux tournois par équipes (sans élimination)
+TEAM_PAIRING_SYSTEMS = ("swiss", "round_robin")
+
+
+def pairing_system(name: str) -> PairingSystem:
+    """Système d'appariement enregistré sous ``name``."""
+    try:
+        return PAIRING_SYSTEMS[name]
+    except KeyError:
+        raise ValueError(f"Système d'appariement inconnu : {name}") from None
+
+
+def run_pairing(job: PairingJob) -> PairingResult:
+    """Exécute un ``PairingJob`` (fonction envoyée aux processus)."""
+    pairs, bye = pairing_system(job.system).pair(job)
+    return PairingResult(job.key, pairs, bye)
+
+
+def state_hash(job: PairingJob, player_ids: Iterable[str]) -> str:
+    """Empreinte de l'état apparié : système, joueurs, scores, rencontres.
+
+    Deux états de même empreinte produisent le même appariement.
+    """
+    # Chargé ici : ``hashlib`` ne sert qu'au cache des appariements
+    import hashlib
+
+    digest = hashlib.sha256()
+    digest.update(f"{job.system}:{job.seed}:{job.round_num}:".encode())
+    digest.update("\x1f".join(player_ids).encode())
+    digest.update(job.scores.tobytes())
+    digest.update(job.history.tobytes())
+    for counts in (job.byes, job.losses):
+        if counts is not None:
+            digest.update(counts.tobytes())
+    return digest.hexdigest()
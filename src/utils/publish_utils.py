@@ -0,0 +1,237 @@
+"""Pages du site de résultats et empreintes de contenu.
+
+Chaque page est d'abord décrite par ses données (titre, tableaux, liens) ;
+son empreinte est calculée sur ces données. À la publication, seules les
+pages dont l'empreinte a changé sont rendues en HTML et réécrites : après
+le round 9, les pages des rounds 1 à 8 restent telles quelles.
+"""
+
+import hashlib
+import json
+from html import escape
+from typing import Any, Iterable, NamedTuple
+
+from models import Tournament
+
+from .clock_utils import format_timestamp
+from .crosstable_utils import BYE, Crosstable
+from .date_utils import format_date
+from .html_utils import html_page, html_table
+from .query_utils import TournamentSummary
+
+SITE_INDEX = "index.html"
+
+
+def content_hash(payload: Any) -> str:
+    """Empreinte SHA-256 stable d'une donnée JSON."""
+    text = json.dumps(
+        payload,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class Section(NamedTuple):
+    """Tableau d'une page, précédé d'un intertitre facultatif."""
+
+    heading: str
+    headers: tuple[str, ...]
+    rows: tuple[tuple[str, ...], ...]
+
+
+class Page(NamedTuple):
+    """Page du site : chemin relatif, titre, tableaux et liens."""
+
+    path: str
+    title: str
+    sections: tuple[Section, ...]
+    links: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def digest(self) -> str:
+        """Empreinte du contenu de la page."""
+        return content_hash(self)
+
+    def render(self) -> str:
+        """HTML de la page."""
+        body = "".join(
+            (
+                f"<h2>{escape(section.heading)}</h2>\n"
+                if section.heading
+                else ""
+            )
+            + html_table(section.headers, section.rows)
+            for section in self.sections
+        )
+        return html_page(self.title, body, self.links)
+
+
+class PublishReport(NamedTuple):
+    """Bilan d'une publication."""
+
+    written: list[str]
+    skipped: int
+    removed: list[str]
+
+
+def tournament_folder(tournament_id: str) -> str:
+    """Dossier des pages d'un tournoi."""
+    return tournament_id.lower()
+
+
+def _name(player: Any) -> str:
+    return f"{player.lastname} {player.firstname}"
+
+
+def tournament_pages(tournament: Tournament) -> list[Page]:
+    """Pages d'un tournoi : accueil, classement, grille et une par round.
+
+    Les liens communs ne dépendent pas du nombre de rounds joués, afin
+    qu'un nouveau round ne modifie pas les pages des rounds précédents.
+    """
+    folder = tournament_folder(tournament.id)
+    crosstable = Crosstable(tournament)
+    table_rows = tuple(tuple(row) for row in crosstable.rows())
+    links = (
+        ("Tous les tournois", f"../{SITE_INDEX}"),
+        ("Tournoi", "index.html"),
+        ("Classement", "classement.html"),
+        ("Grille américaine", "grille.html"),
+    )
+    round_links = tuple(
+        (round_obj.name, f"ronde-{number}.html")
+        for number, round_obj in enumerate(tournament.rounds, 1)
+    )
+
+    info = Section(
+        "",
+        ("Lieu", "Dates", "Appariements", "Rounds"),
+        (
+            (
+                tournament.location,
+                f"{format_date(tournament.start_date)} au "
+                f"{format_date(tournament.end_date)}",
+                tournament.pairing_system,
+                f"{len(tournament.rounds)}/{tournament.rounds_count}",
+            ),
+        ),
+    )
+    rounds = Section(
+        "Rounds",
+        ("Round", "Début", "Fin", "Matchs"),
+        tuple(
+            (
+                round_obj.name,
+                format_timestamp(round_obj.started_at),
+                format_timestamp(round_obj.ended_at),
+                str(len(round_obj.matches)),
+            )
+            for round_obj in tournament.rounds
+        ),
+    )
+    standings = Section(
+        "",
+        ("Rang", "Joueur", "Points", "Buchholz", "S-B"),
+        tuple(
+            (row[0], row[2], *row[-3:]) for row in table_rows
+        ),
+    )
+    pages = [
+        Page(
+            f"{folder}/index.html",
+            tournament.name,
+            (info, rounds),
+            links + round_links,
+        ),
+        Page(
+            f"{folder}/classement.html",
+            f"{tournament.name} — classement",
+            (standings,),
+            links,
+        ),
+        Page(
+            f"{folder}/grille.html",
+            f"{tournament.name} — grille américaine",
+            (
+                Section(
+                    "",
+                    tuple(crosstable.headers()),
+                    table_rows,
+                ),
+            ),
+            links,
+        ),
+    ]
+    names = {player.id: _name(player) for player in crosstable.players}
+    for number, round_obj in enumerate(tournament.rounds, 1):
+        boards = [
+            (
+                str(board),
+                names.get(match.player1.id, _name(match.player1)),
+                f"{match.score1:g} - {match.score2:g}",
+                names.get(match.player2.id, _name(match.player2)),
+            )
+            for board, match in enumerate(round_obj.matches, 1)
+        ]
+        if round_obj.bye_player_id:
+            boards.append(
+                (
+                    "",
+                    names.get(
+                        round_obj.bye_player_id, round_obj.bye_player_id
+                    ),
+                    BYE,
+                    "",
+                )
+            )
+        bye_team = tournament.team(round_obj.bye_team_id)
+        if bye_team is not None:
+            boards.append(("", f"Équipe {bye_team.name}", BYE, ""))
+        pages.append(
+            Page(
+                f"{folder}/ronde-{number}.html",
+                f"{tournament.name} — {round_obj.name}",
+                (
+                    Section(
+                        f"Début : {format_timestamp(round_obj.started_at)}",
+                        ("Table", "Blancs", "Résultat", "Noirs"),
+                        tuple(boards),
+                    ),
+                ),
+                links,
+            )
+        )
+    return pages
+
+
+def site_index_page(summaries: Iterable[TournamentSummary]) -> Page:
+    """Page d'accueil du site : la liste des tournois."""
+    summaries = list(summaries)
+    return Page(
+        SITE_INDEX,
+        "Tournois",
+        (
+            Section(
+                "",
+                ("ID", "Nom", "Lieu", "Début", "Fin", "Rounds"),
+                tuple(
+                    (
+                        summary.id,
+                        summary.name,
+                        summary.location,
+                        format_date(summary.start_date),
+                        format_date(summary.end_date),
+                        f"{summary.rounds_played}/{summary.rounds_count}",
+                    )
+                    for summary in summaries
+                ),
+            ),
+        ),
+        tuple(
+            (summary.name, f"{tournament_folder(summary.id)}/index.html")
+            for summary in summaries
+        ),
+    )
@@ -0,0 +1,299 @@
+"""Index secondaires de l'archive des tournois et requêtes filtrées.
+
+``ArchiveIndex`` tient, pour chaque tournoi (JSON ``to_dict``), un résumé
+et des index secondaires : lieu, date de début, joueurs (références) et
+rencontres par paire de joueurs. Il est mis à jour tournoi par tournoi ;
+une requête sur un critère indexé ne parcourt que les tournois ou parties
+retenus par l'index, quelle que soit la taille de l'archive. Les
+face-à-face (``head_to_head``) sont creux : seules les paires de joueurs
+s'étant rencontrées y figurent.
+"""
+
+from datetime import date
+from typing import Any, Iterable, Mapping, NamedTuple
+
+from .date_utils import DateIndex, parse_date
+from .reference_utils import ReferenceIndex, references_from_dict
+from .search_utils import normalize
+
+
+class TournamentSummary(NamedTuple):
+    """Résumé d'un tournoi, suffisant pour lister les résultats."""
+
+    id: str
+    name: str
+    location: str
+    start_date: date | None
+    end_date: date | None
+    players_count: int
+    rounds_played: int
+    rounds_count: int
+
+
+class GameRecord(NamedTuple):
+    """Partie de l'archive (round et échiquier comptés à partir de 1)."""
+
+    tournament_id: str
+    round_num: int
+    board: int
+    player1_id: str
+    player2_id: str
+    score1: float
+    score2: float
+
+
+class HeadToHead(NamedTuple):
+    """Bilan d'un joueur face à un adversaire."""
+
+    games: int
+    wins: int
+    draws: int
+    losses: int
+    points: float
+
+    def add(self, points: float, opponent_points: float) -> "HeadToHead":
+        """Bilan augmenté d'une partie."""
+        return HeadToHead(
+            self.games + 1,
+            self.wins + (points > opponent_points),
+            self.draws + (points == opponent_points),
+            self.losses + (points < opponent_points),
+            self.points + points,
+        )
+
+
+NO_GAMES = HeadToHead(0, 0, 0, 0, 0.0)
+
+
+def _pair(player1_id: str, player2_id: str) -> tuple[str, str]:
+    return (
+        (player1_id, player2_id)
+        if player1_id <= player2_id
+        else (player2_id, player1_id)
+    )
+
+
+class ArchiveIndex:
+    """Résumés et index secondaires des tournois de l'archive."""
+
+    def __init__(self, entries: Iterable[Mapping[str, Any]] = ()) -> None:
+        self.references = ReferenceIndex()
+        self.summaries: dict[str, TournamentSummary] = {}
+        self._dates = DateIndex()
+        self._locations: dict[str, set[str]] = {}
+        self._games: dict[tuple[str, str], list[GameRecord]] = {}
+        # Paires ayant joué dans chaque tournoi (clés de ``_games``)
+        self._pairs: dict[str, set[tuple[str, str]]] = {}
+        for entry in entries:
+            self.set_tournament(entry)
+
+    def __len__(self) -> int:
+        return len(self.summaries)
+
+    def set_tournament(self, entry: Mapping[str, Any]) -> None:
+        """Indexe (ou réindexe) un tournoi au format JSON."""
+        tournament_id = entry["id"]
+        self.remove_tournament(tournament_id)
+        rounds = entry.get("rounds", [])
+        summary = TournamentSummary(
+            tournament_id,
+            entry.get("name", ""),
+            entry.get("location", ""),
+            parse_date(entry.get("start_date") or ""),
+            parse_date(entry.get("end_date") or ""),
+            len(entry.get("players", [])),
+            len(rounds),
+            int(entry.get("rounds_count", 4)),
+        )
+        self.summaries[tournament_id] = summary
+        self.references.set_tournament(
+            tournament_id, references_from_dict(entry)
+        )
+        if summary.start_date is not None:
+            self._dates.add(summary.start_date, tournament_id)
+        self._locations.setdefault(
+            normalize(summary.location), set()
+        ).add(tournament_id)
+        pairs = self._pairs[tournament_id] = set()
+        for round_num, round_data in enumerate(rounds, 1):
+            for board, match in enumerate(round_data.get("matches", []), 1):
+                pair = _pair(match["player1_id"], match["player2_id"])
+                pairs.add(pair)
+                self._games.setdefault(pair, []).append(
+                    GameRecord(
+                        tournament_id,
+                        round_num,
+                        board,
+                        match["player1_id"],
+                        match["player2_id"],
+                        float(match.get("score1", 0.0)),
+                        float(match.get("score2", 0.0)),
+                    )
+                )
+
+    def remove_tournament(self, tournament_id: str) -> None:
+        """Retire un tournoi de tous les index."""
+        summary = self.summaries.pop(tournament_id, None)
+        if summary is None:
+            return
+        if summary.start_date is not None:
+            self._dates.remove(summary.start_date, tournament_id)
+        location = normalize(summary.location)
+        tournaments = self._locations.get(location)
+        if tournaments is not None:
+            tournaments.discard(tournament_id)
+            if not tournaments:
+                del self._locations[location]
+        # Seules les paires ayant joué dans le tournoi sont visitées
+        for pair in self._pairs.pop(tournament_id, ()):
+            games = [
+                game for game in self._games[pair]
+                if game.tournament_id != tournament_id
+            ]
+            if games:
+                self._games[pair] = games
+            else:
+                del self._games[pair]
+        self.references.remove_tournament(tournament_id)
+
+    def tournaments(
+        self,
+        location: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        player_id: str | None = None,
+    ) -> list[TournamentSummary]:
+        """Tournois satisfaisant tous les critères fournis.
+
+        Chaque critère est résolu par son index ; les ensembles obtenus
+        sont intersectés du plus petit au plus grand. Les résultats sont
+        triés par date de début (tournois sans date en dernier).
+        """
+        candidates: list[set[str]] = []
+        if location:
+            candidates.append(self._locations.get(normalize(location), set()))
+        if start is not None or end is not None:
+            candidates.append(set(self._dates.between(start, end)))
+        if player_id:
+            candidates.append(set(self.references.tournaments_of(player_id)))
+        if candidates:
+            candidates.sort(key=len)
+            selected = set(candidates[0])
+            for other in candidates[1:]:
+                selected &= other
+        else:
+            selected = set(self.summaries)
+        return sorted(
+            (self.summaries[tournament_id] for tournament_id in selected),
+            key=lambda summary: (
+                summary.start_date is None,
+                summary.start_date or date.min,
+                summary.id,
+            ),
+        )
+
+    def games_between(
+        self,
+        player1_id: str,
+        player2_id: str,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[GameRecord]:
+        """Parties entre deux joueurs (tournois commencés sur la période).
+
+        Triées par date de début du tournoi, puis round et échiquier.
+        """
+        games = [
+            game
+            for game in self._games.get(_pair(player1_id, player2_id), [])
+            if (start is None and end is None)
+            or self._in_period(game.tournament_id, start, end)
+        ]
+        return sorted(
+            games,
+            key=lambda game: (
+                self.summaries[game.tournament_id].start_date or date.max,
+                game.tournament_id,
+                game.round_num,
+                game.board,
+            ),
+        )
+
+    def head_to_head(
+        self, player_ids: Iterable[str] | None = None
+    ) -> dict[str, dict[str, HeadToHead]]:
+        """Face-à-face creux : joueur -> adversaire rencontré -> bilan.
+
+        Seules les paires s'étant rencontrées figurent dans le résultat.
+        Avec ``player_ids``, seuls les adversaires de ces joueurs sont
+        visités (via leurs tournois), pas toute l'archive.
+        """
+        selected = None if player_ids is None else set(player_ids)
+        if selected is None:
+            pairs: Iterable[tuple[str, str]] = self._games
+        else:
+            wanted = set()
+            for player_id in selected:
+                for tournament_id in self.references.tournaments_of(
+                    player_id
+                ):
+                    for opponent_id in self.references.players_of(
+                        tournament_id
+                    ):
+                        wanted.add(_pair(player_id, opponent_id))
+            pairs = (pair for pair in wanted if pair in self._games)
+        matrix: dict[str, dict[str, HeadToHead]] = {}
+        for pair in pairs:
+            for game in self._games[pair]:
+                sides = (
+                    (game.player1_id, game.player2_id, game.score1,
+                     game.score2),
+                    (game.player2_id, game.player1_id, game.score2,
+                     game.score1),
+                )
+                for player_id, opponent_id, points, against in sides:
+                    if selected is not None and player_id not in selected:
+                        continue
+                    row = matrix.setdefault(player_id, {})
+                    row[opponent_id] = row.get(opponent_id, NO_GAMES).add(
+                        points, against
+                    )
+        return matrix
+
+    def active_players(
+        self,
+        min_games: int,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[tuple[str, int]]:
+        """Joueurs ayant au moins ``min_games`` parties sur la période.
+
+        Seuls les tournois de la période (index des dates) sont visités.
+        Triés par nombre de parties décroissant.
+        """
+        if start is None and end is None:
+            tournament_ids: Iterable[str] = self.summaries
+        else:
+            tournament_ids = self._dates.between(start, end)
+        games: dict[str, int] = {}
+        for tournament_id in tournament_ids:
+            for player_id, count in self.references.players_of(
+                tournament_id
+            ).items():
+                games[player_id] = games.get(player_id, 0) + count
+        return sorted(
+            (
+                (player_id, count)
+                for player_id, count in games.items()
+                if count >= min_games
+            ),
+            key=lambda item: (-item[1], item[0]),
+        )
+
+    def _in_period(
+        self, tournament_id: str, start: date | None, end: date | None
+    ) -> bool:
+        day = self.summaries[tournament_id].start_date
+        if day is None:
+            return False
+        return (start is None or day >= start) and (end is None or day <= end)
@@ -0,0 +1,64 @@
+"""Index inverse des références joueur -> tournois."""
+
+from typing import Any, Iterable, Mapping
+
+
+def references_from_dict(entry: Mapping[str, Any]) -> dict[str, int]:
+    """Joueurs référencés par un tournoi (JSON) et leur nombre de matchs.
+
+    Un joueur inscrit sans match joué apparaît avec 0.
+    """
+    references = {
+        player["player_id"]: 0 for player in entry.get("players", [])
+    }
+    for round_data in entry.get("rounds", []):
+        for match in round_data.get("matches", []):
+            for key in ("player1_id", "player2_id"):
+                player_id = match[key]
+                references[player_id] = references.get(player_id, 0) + 1
+    return references
+
+
+class ReferenceIndex:
+    """Tournois et nombre de matchs de chaque joueur.
+
+    Les deux sens sont conservés pour pouvoir remplacer ou retirer un
+    tournoi sans parcourir tous les joueurs.
+    """
+
+    def __init__(self, entries: Iterable[Mapping[str, Any]] = ()) -> None:
+        self._by_player: dict[str, dict[str, int]] = {}
+        self._by_tournament: dict[str, dict[str, int]] = {}
+        for entry in entries:
+            self.set_tournament(entry["id"], references_from_dict(entry))
+
+    def set_tournament(
+        self, tournament_id: str, references: dict[str, int]
+    ) -> None:
+        """Remplace les références d'un tournoi."""
+        self.remove_tournament(tournament_id)
+        self._by_tournament[tournament_id] = references
+        for player_id, matches in references.items():
+            self._by_player.setdefault(player_id, {})[tournament_id] = matches
+
+    def remove_tournament(self, tournament_id: str) -> None:
+        """Retire toutes les références d'un tournoi."""
+        for player_id in self._by_tournament.pop(tournament_id, {}):
+            tournaments = self._by_player.get(player_id)
+            if tournaments is None:
+                continue
+            tournaments.pop(tournament_id, None)
+            if not tournaments:
+                del self._by_player[player_id]
+
+    def tournaments_of(self, player_id: str) -> dict[str, int]:
+        """Tournois d'un joueur -> nombre de matchs joués."""
+        return dict(self._by_player.get(player_id, {}))
+
+    def players_of(self, tournament_id: str) -> dict[str, int]:
+        """Joueurs d'un tournoi -> nombre de matchs (lecture seule)."""
+        return self._by_tournament.get(tournament_id, {})
+
+    def is_referenced(self, player_id: str) -> bool:
+        """Indique si au moins un tournoi référence le joueur."""
+        return player_id in self._by_player
@@ -0,0 +1,168 @@
+"""Planning des rounds d'un événement sur plusieurs jours et sections.
+
+Un événement regroupe plusieurs tournois joués en parallèle (sections)
+sur des créneaux horaires communs. ``plan_rounds`` répartit les rounds
+restants de chaque section sur ces créneaux, dans l'ordre des rounds ;
+``NowIndex`` répond à « que se passe-t-il à tel instant ? » sur
+l'ensemble des rounds planifiés ou en cours. Tous les instants sont des
+epochs entiers (voir ``clock_utils``).
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Mapping, NamedTuple
+
+# Secondes par jour, pour répéter les créneaux d'un jour à l'autre
+DAY = 86_400
+
+
+class Slot(NamedTuple):
+    """Créneau horaire : début et fin (epochs)."""
+
+    start: int
+    end: int
+
+
+class ScheduledRound(NamedTuple):
+    """Round d'une section placé sur un créneau (ou en cours).
+
+    ``end`` vaut ``None`` pour un round commencé hors planning.
+    """
+
+    start: int
+    end: int | None
+    tournament_id: str
+    round_num: int
+
+
+def build_slots(
+    first_start: int,
+    duration: int,
+    per_day: int,
+    days: int,
+    interval: int | None = None,
+) -> list[Slot]:
+    """Créneaux de ``duration`` secondes, ``per_day`` par jour.
+
+    Les créneaux d'un jour s'enchaînent toutes les ``interval`` secondes
+    (par défaut : dès la fin du précédent), aux mêmes heures chaque jour.
+    """
+    if duration <= 0 or per_day <= 0 or days <= 0:
+        raise ValueError("Durée, créneaux par jour et jours doivent être > 0.")
+    interval = duration if interval is None else interval
+    if interval < duration:
+        raise ValueError("Les créneaux d'un même jour se chevauchent.")
+    if (per_day - 1) * interval + duration > DAY:
+        raise ValueError("Les créneaux d'un jour dépassent 24 heures.")
+    return [
+        Slot(start, start + duration)
+        for day in range(days)
+        for start in (
+            first_start + day * DAY + index * interval
+            for index in range(per_day)
+        )
+    ]
+
+
+def plan_rounds(
+    sections: Mapping[str, tuple[int, int]],
+    slots: Iterable[Slot],
+    capacity: int | None = None,
+) -> list[ScheduledRound]:
+    """Place les rounds restants des sections sur les créneaux.
+
+    ``sections`` associe à chaque tournoi son premier round à planifier et
+    son nombre total de rounds. Une section joue au plus un round par
+    créneau, dans l'ordre ; ``capacity`` limite le nombre de sections par
+    créneau (salle). À chaque créneau, les sections ayant le plus de
+    rounds restants passent en premier, ce qui termine l'événement au
+    plus tôt. Lève ``ValueError`` si les créneaux ne suffisent pas.
+    """
+    if capacity is not None and capacity <= 0:
+        raise ValueError("La capacité d'un créneau doit être > 0.")
+    next_round = {
+        tournament_id: first
+        for tournament_id, (first, _last) in sections.items()
+    }
+    last_round = {
+        tournament_id: last
+        for tournament_id, (_first, last) in sections.items()
+    }
+    planned: list[ScheduledRound] = []
+    for slot in sorted(slots):
+        pending = sorted(
+            (
+                tournament_id
+                for tournament_id, round_num in next_round.items()
+                if round_num <= last_round[tournament_id]
+            ),
+            key=lambda tournament_id: (
+                next_round[tournament_id] - last_round[tournament_id],
+                tournament_id,
+            ),
+        )
+        if not pending:
+            break
+        for tournament_id in pending[:capacity]:
+            planned.append(
+                ScheduledRound(
+                    slot.start,
+                    slot.end,
+                    tournament_id,
+                    next_round[tournament_id],
+                )
+            )
+            next_round[tournament_id] += 1
+    unplanned = sorted(
+        tournament_id
+        for tournament_id, round_num in next_round.items()
+        if round_num <= last_round[tournament_id]
+    )
+    if unplanned:
+        raise ValueError(
+            "Créneaux insuffisants pour : " + ", ".join(unplanned)
+        )
+    return planned
+
+
+class NowIndex:
+    """Index des rounds par instant de début.
+
+    Les rounds bornés sont triés par début : une requête ne parcourt que
+    ceux commencés depuis moins que la plus longue durée indexée. Les
+    rounds sans fin connue (commencés hors planning) sont conservés à
+    part et sont en cours dès leur début.
+    """
+
+    def __init__(self, rounds: Iterable[ScheduledRound] = ()) -> None:
+        bounded: list[ScheduledRound] = []
+        self.open: list[ScheduledRound] = []
+        for scheduled in rounds:
+            (self.open if scheduled.end is None else bounded).append(
+                scheduled
+            )
+        bounded.sort()
+        self.rounds = bounded
+        self._starts = [scheduled.start for scheduled in bounded]
+        self._span = max(
+            (scheduled.end - scheduled.start for scheduled in bounded),
+            default=0,
+        )
+
+    def at(self, instant: int) -> list[ScheduledRound]:
+        """Rounds en cours à ``instant`` (début inclus, fin exclue)."""
+        low = bisect_left(self._starts, instant - self._span)
+        high = bisect_right(self._starts, instant)
+        current = [
+            scheduled
+            for scheduled in self.rounds[low:high]
+            if scheduled.end > instant
+        ]
+        current.extend(
+            scheduled for scheduled in self.open if scheduled.start <= instant
+        )
+        return current
+
+    def upcoming(self, instant: int, limit: int = 10) -> list[ScheduledRound]:
+        """Prochains rounds planifiés après ``instant``."""
+        first = bisect_right(self._starts, instant)
+        return self.rounds[first:first + limit]
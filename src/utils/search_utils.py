@@ -0,0 +1,194 @@
+"""Index de recherche des joueurs : préfixe et approximative (trigrammes)."""
+
+import math
+import unicodedata
+from bisect import bisect_left, insort
+from functools import lru_cache
+from typing import Any, Iterable
+
+FUZZY_THRESHOLD = 0.6
+
+
+@lru_cache(maxsize=65536)
+def normalize(text: str) -> str:
+    """Minuscules sans accents ni espaces superflus."""
+    if not text.isascii():
+        decomposed = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(text.lower().split())
+
+
+@lru_cache(maxsize=65536)
+def trigrams(text: str) -> frozenset[str]:
+    """Trigrammes d'un texte normalisé, bornés par des espaces."""
+    padded = f"  {text} "
+    return frozenset(
+        padded[index:index + 3] for index in range(len(padded) - 2)
+    )
+
+
+class PlayerSearchIndex:
+    """Index en mémoire sur l'identifiant, le nom et le prénom.
+
+    - préfixe : liste triée de clés ``(texte, id)`` parcourue par
+      dichotomie ;
+    - approximatif : index inversé trigramme -> noms complets distincts
+      (« nom prénom »), puis nom -> identifiants ; le score est la part
+      des trigrammes de la requête présents dans le nom.
+
+    La construction initiale trie les clés en une fois ; les ajouts et
+    suppressions suivants sont incrémentaux.
+    """
+
+    def __init__(self, records: Iterable[dict[str, Any]] = ()) -> None:
+        self.records: dict[str, dict[str, Any]] = {}
+        self._keys: list[tuple[str, str]] = []
+        self._trigrams: dict[str, set[str]] = {}
+        self._name_players: dict[str, set[str]] = {}
+        for record in records:
+            self.records[record["id"]] = record
+        for player_id, record in self.records.items():
+            self._keys.extend(
+                (key, player_id) for key in self._search_keys(record)
+            )
+            self._index_trigrams(record)
+        self._keys.sort()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self.records
+
+    def get(self, player_id: str) -> dict[str, Any] | None:
+        """Retourne l'enregistrement brut d'un joueur."""
+        return self.records.get(player_id)
+
+    @staticmethod
+    def _search_keys(record: dict[str, Any]) -> set[str]:
+        lastname = normalize(record["lastname"])
+        firstname = normalize(record["firstname"])
+        return {
+            record["id"].lower(),
+            lastname,
+            firstname,
+            f"{lastname} {firstname}",
+            f"{firstname} {lastname}",
+        }
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Ajoute ou remplace un joueur."""
+        player_id = record["id"]
+        if player_id in self.records:
+            self.remove(player_id)
+        self.records[player_id] = record
+
+        for key in self._search_keys(record):
+            insort(self._keys, (key, player_id))
+        self._index_trigrams(record)
+
+    @staticmethod
+    def _full_name(record: dict[str, Any]) -> str:
+        return normalize(f"{record['lastname']} {record['firstname']}")
+
+    def _index_trigrams(self, record: dict[str, Any]) -> None:
+        name = self._full_name(record)
+        players = self._name_players.get(name)
+        if players is None:
+            players = self._name_players[name] = set()
+            for gram in trigrams(name):
+                self._trigrams.setdefault(gram, set()).add(name)
+        players.add(record["id"])
+
+    def remove(self, player_id: str) -> None:
+        """Retire un joueur de l'index s'il y figure."""
+        record = self.records.pop(player_id, None)
+        if record is None:
+            return
+        for key in self._search_keys(record):
+            position = bisect_left(self._keys, (key, player_id))
+            if (
+                position < len(self._keys)
+                and self._keys[position] == (key, player_id)
+            ):
+                del self._keys[position]
+        name = self._full_name(record)
+        players = self._name_players.get(name, set())
+        players.discard(player_id)
+        if not players:
+            self._name_players.pop(name, None)
+            for gram in trigrams(name):
+                names = self._trigrams.get(gram)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del self._trigrams[gram]
+
+    def prefix(self, query: str, limit: int | None = None) -> list[str]:
+        """Identifiants dont un champ commence par ``query``."""
+        needle = normalize(query)
+        if not needle:
+            return []
+        found: dict[str, None] = {}
+        position = bisect_left(self._keys, (needle, ""))
+        while position < len(self._keys):
+            key, player_id = self._keys[position]
+            if not key.startswith(needle):
+                break
+            found[player_id] = None
+            if limit is not None and len(found) >= limit:
+                break
+            position += 1
+        return list(found)
+
+    def fuzzy(
+        self,
+        query: str,
+        limit: int | None = None,
+        threshold: float = FUZZY_THRESHOLD,
+    ) -> list[str]:
+        """Identifiants proches de ``query`` (trigrammes communs).
+
+        Un nom candidat doit contenir au moins ``needed`` trigrammes de la
+        requête : il figure donc forcément dans l'une des
+        ``len - needed + 1`` listes les plus courtes, seules parcourues.
+        """
+        query_grams = trigrams(normalize(query))
+        if not query_grams:
+            return []
+        needed = max(1, math.ceil(threshold * len(query_grams)))
+        postings = sorted(
+            (self._trigrams.get(gram, set()) for gram in query_grams),
+            key=len,
+        )
+        candidates: set[str] = set()
+        for names in postings[:len(query_grams) - needed + 1]:
+            candidates |= names
+
+        scored = []
+        for name in candidates:
+            common = len(query_grams & trigrams(name))
+            if common >= needed:
+                scored.append((common / len(query_grams), name))
+        scored.sort(reverse=True)
+
+        results: list[str] = []
+        for _score, name in scored:
+            results.extend(sorted(self._name_players[name]))
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+        return results
+
+    def search(
+        self, query: str, limit: int | None = 20, fuzzy: bool = True
+    ) -> list[str]:
+        """Correspondances par préfixe, complétées par la recherche floue."""
+        results = dict.fromkeys(self.prefix(query, limit))
+        if fuzzy and (limit is None or len(results) < limit):
+            for player_id in self.fuzzy(
+                query, None if limit is None else limit + len(results)
+            ):
+                results.setdefault(player_id)
+                if limit is not None and len(results) >= limit:
+                    break
+        return list(results)
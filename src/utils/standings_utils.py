@@ -0,0 +1,83 @@
+"""Classement maintenu trié, mis à jour par différences."""
+
+from bisect import bisect_left, insort
+from typing import Mapping
+
+
+class LiveStandings:
+    """Classement (score décroissant, puis identifiant) d'un tournoi.
+
+    Les clés ``(-score, id)`` sont gardées triées : modifier un score
+    déplace un seul joueur et ne change le rang que des joueurs situés
+    entre son ancienne et sa nouvelle position, seuls renvoyés.
+    """
+
+    def __init__(self, scores: Mapping[str, float]) -> None:
+        self._scores = dict(scores)
+        self._order = sorted(
+            (-score, player_id) for player_id, score in self._scores.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def score(self, player_id: str) -> float:
+        """Score courant d'un joueur."""
+        return self._scores[player_id]
+
+    def rank(self, player_id: str) -> int:
+        """Rang (1 = premier) d'un joueur."""
+        key = (-self._scores[player_id], player_id)
+        return bisect_left(self._order, key) + 1
+
+    def _move(self, player_id: str, score: float) -> tuple[int, int]:
+        old = bisect_left(self._order, (-self._scores[player_id], player_id))
+        del self._order[old]
+        self._scores[player_id] = score
+        insort(self._order, (-score, player_id))
+        new = bisect_left(self._order, (-score, player_id))
+        return min(old, new), max(old, new)
+
+    def apply(self, deltas: Mapping[str, float]) -> list[dict]:
+        """Ajoute des points aux joueurs de ``deltas``.
+
+        Retourne les lignes dont le rang ou le score a changé, dans
+        l'ordre du classement.
+        """
+        touched: set[str] = set()
+        for player_id, delta in deltas.items():
+            if not delta or player_id not in self._scores:
+                continue
+            low, high = self._move(player_id, self._scores[player_id] + delta)
+            touched.update(
+                entry[1] for entry in self._order[low:high + 1]
+            )
+        return sorted(
+            (self._row(player_id) for player_id in touched),
+            key=lambda row: row["rank"],
+        )
+
+    def sync(self, scores: Mapping[str, float]) -> list[dict]:
+        """Aligne le classement sur des scores de référence."""
+        return self.apply(
+            {
+                player_id: score - self._scores[player_id]
+                for player_id, score in scores.items()
+                if player_id in self._scores
+                and score != self._scores[player_id]
+            }
+        )
+
+    def _row(self, player_id: str) -> dict:
+        return {
+            "rank": self.rank(player_id),
+            "player_id": player_id,
+            "score": self._scores[player_id],
+        }
+
+    def rows(self) -> list[dict]:
+        """Classement complet."""
+        return [
+            {"rank": rank, "player_id": player_id, "score": -neg_score}
+            for rank, (neg_score, player_id) in enumerate(self._order, 1)
+        ]
@@ -4,7 +4,10 @@ import json
 import os
 from typing import Any
 
+from .instrumentation import instrumented
 
+
+@instrumented("load_json")
 def load_json(path: str, default: Any) -> Any:
     """Charge un fichier JSON.
 
@@ -18,8 +21,54 @@ def load_json(path: str, default: Any) -> Any:
         return default
 
 
+@instrumented("save_json")
 def save_json(path: str, data: Any) -> None:
     """Écrit des données dans un fichier JSON."""
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w", encoding="utf-8") as handle:
         json.dump(data, handle, ensure_ascii=False, indent=4)
+
+
+@instrumented("append_json_line")
+def append_json_line(path: str, record: Any, sync: bool = True) -> None:
+    """Ajoute un enregistrement JSON en fin de fichier.
+
+    Avec ``sync`` (par défaut), le ``fsync`` garantit que la ligne survit
+    à un arrêt brutal.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        handle.flush()
+        if sync:
+            os.fsync(handle.fileno())
+
+
+def load_json_lines(path: str) -> list[Any]:
+    """Charge un fichier JSON Lines.
+
+    Une dernière ligne tronquée (écriture interrompue) est ignorée.
+    """
+    records: list[Any] = []
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+    except FileNotFoundError:
+        return []
+    return records
+
+
+def file_signature(path: str) -> tuple[int, int]:
+    """Date de modification (ns) et taille d'un fichier, (0, 0) s'il manque.
+
+    Permet aux caches en mémoire de détecter une modification externe.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,180 @@
+"""Tournois par équipes : appariement et classement sur tableaux compacts.
+
+Les rounds d'un tournoi par équipes ne contiennent que les échiquiers
+(``Match``) ; les rencontres en sont déduites par l'équipe de chaque
+joueur. Toutes les rencontres du tournoi sont réduites en une passe à des
+tableaux indexés par équipe (points d'échiquiers, paires d'équipes),
+d'où sont calculés d'un bloc les points de match, le classement et
+l'entrée du système d'appariement.
+"""
+
+from array import array
+from typing import NamedTuple
+
+from models import Match, Team, TeamMatch, Tournament
+from models.team_match import MATCH_POINTS_DRAW, MATCH_POINTS_WIN
+
+from .pairing_utils import PairingJob, PairingResult, pairing_system
+
+# Points de match d'une équipe exempte (système suisse)
+BYE_MATCH_POINTS = MATCH_POINTS_WIN
+
+
+class TeamResults(NamedTuple):
+    """Rencontres jouées, par indice d'équipe (position dans ``teams``).
+
+    ``pairs`` et ``board_points`` sont à plat : la rencontre ``k`` oppose
+    ``pairs[2k]`` à ``pairs[2k + 1]``, qui ont marqué ``board_points[2k]``
+    et ``board_points[2k + 1]``. ``byes`` compte les exemptions.
+    """
+
+    pairs: array
+    board_points: array
+    byes: array
+
+
+class TeamStanding(NamedTuple):
+    """Ligne du classement par équipes."""
+
+    team: Team
+    match_points: float
+    board_points: float
+
+
+def team_of_player(tournament: Tournament) -> dict[str, int]:
+    """Indice d'équipe de chaque joueur."""
+    return {
+        player.id: index
+        for index, team in enumerate(tournament.teams)
+        for player in team.players
+    }
+
+
+def collect_results(tournament: Tournament) -> TeamResults:
+    """Réduit les rounds du tournoi aux tableaux de ``TeamResults``."""
+    teams = team_of_player(tournament)
+    pairs = array("i")
+    board_points = array("d")
+    byes = array("i", bytes(4 * len(tournament.teams)))
+    for round_obj in tournament.rounds:
+        positions: dict[tuple[int, int], int] = {}
+        for match in round_obj.matches:
+            team1 = teams.get(match.player1.id)
+            team2 = teams.get(match.player2.id)
+            if team1 is None or team2 is None or team1 == team2:
+                continue
+            score1, score2 = match.score1, match.score2
+            if team1 > team2:
+                team1, team2, score1, score2 = team2, team1, score2, score1
+            position = positions.get((team1, team2))
+            if position is None:
+                position = positions[(team1, team2)] = len(pairs)
+                pairs.extend((team1, team2))
+                board_points.extend((0.0, 0.0))
+            board_points[position] += score1
+            board_points[position + 1] += score2
+        bye_team = tournament.team(round_obj.bye_team_id)
+        if bye_team is not None:
+            byes[tournament.teams.index(bye_team)] += 1
+        elif len(tournament.teams) % 2 and not round_obj.bye_team_id:
+            # Round enregistré sans son exempt : l'équipe sans rencontre
+            playing = {team for pair in positions for team in pair}
+            for index in range(len(tournament.teams)):
+                if index not in playing:
+                    byes[index] += 1
+    return TeamResults(pairs, board_points, byes)
+
+
+def team_totals(
+    team_count: int,
+    results: TeamResults,
+    bye_match_points: float = BYE_MATCH_POINTS,
+) -> tuple[array, array]:
+    """Points de match et points d'échiquiers cumulés par équipe."""
+    match_points = array("d", bytes(8 * team_count))
+    board_points = array("d", bytes(8 * team_count))
+    pairs, points = results.pairs, results.board_points
+    for position in range(0, len(pairs), 2):
+        team1, team2 = pairs[position], pairs[position + 1]
+        points1, points2 = points[position], points[position + 1]
+        board_points[team1] += points1
+        board_points[team2] += points2
+        if points1 > points2:
+            match_points[team1] += MATCH_POINTS_WIN
+        elif points2 > points1:
+            match_points[team2] += MATCH_POINTS_WIN
+        else:
+            match_points[team1] += MATCH_POINTS_DRAW
+            match_points[team2] += MATCH_POINTS_DRAW
+    for index, count in enumerate(results.byes):
+        match_points[index] += count * bye_match_points
+    return match_points, board_points
+
+
+def _totals(
+    tournament: Tournament, results: TeamResults
+) -> tuple[array, array]:
+    # L'exempt d'un toutes rondes ne marque pas (voir ``PairingSystem``)
+    system = pairing_system(tournament.pairing_system)
+    return team_totals(
+        len(tournament.teams),
+        results,
+        BYE_MATCH_POINTS * system.bye_points,
+    )
+
+
+def team_standings(tournament: Tournament) -> list[TeamStanding]:
+    """Classement : points de match, puis points d'échiquiers."""
+    match_points, board_points = _totals(
+        tournament, collect_results(tournament)
+    )
+    order = sorted(
+        range(len(tournament.teams)),
+        key=lambda index: (
+            -match_points[index],
+            -board_points[index],
+            tournament.teams[index].name,
+        ),
+    )
+    return [
+        TeamStanding(
+            tournament.teams[index], match_points[index], board_points[index]
+        )
+        for index in order
+    ]
+
+
+def encode_team_pairing(
+    tournament: Tournament, round_num: int
+) -> PairingJob:
+    """Entrée du système d'appariement, les équipes tenant lieu de joueurs.
+
+    Le score d'une équipe est son total de points de match.
+    """
+    results = collect_results(tournament)
+    match_points, _board_points = _totals(tournament, results)
+    return PairingJob(
+        tournament.id,
+        round_num,
+        match_points,
+        results.pairs,
+        tournament.seed,
+        results.byes,
+        tournament.pairing_system,
+    )
+
+
+def decode_team_pairing(
+    tournament: Tournament, result: PairingResult
+) -> tuple[list[Match], Team | None]:
+    """Échiquiers des rencontres appariées et équipe exempte."""
+    boards: list[Match] = []
+    for position in range(0, len(result.pairs), 2):
+        boards.extend(
+            TeamMatch.pair(
+                tournament.teams[result.pairs[position]],
+                tournament.teams[result.pairs[position + 1]],
+            ).boards
+        )
+    bye_team = tournament.teams[result.bye] if result.bye >= 0 else None
+    return boards, bye_team
@@ -0,0 +1,107 @@
+"""Départages (Buchholz, Sonneborn-Berger) maintenus de façon incrémentale.
+
+Le Buchholz d'un joueur est la somme des scores de ses adversaires ; le
+Sonneborn-Berger pondère ce score par le résultat obtenu contre chacun.
+Modifier le résultat d'un match ne change donc que les départages des
+deux joueurs et de leurs adversaires : ce sont les seuls recalculés.
+Les exemptions ne comptent pas comme des parties.
+"""
+
+from typing import Iterable, Mapping, NamedTuple
+
+from models import Round
+
+
+class Game(NamedTuple):
+    """Partie vue d'un joueur : adversaire et points obtenus."""
+
+    opponent_id: str
+    points: float
+
+
+class TieBreaks:
+    """Scores, parties et départages des joueurs d'un tournoi."""
+
+    def __init__(self, scores: Mapping[str, float]) -> None:
+        self.scores = dict(scores)
+        self.games: dict[str, list[Game]] = {
+            player_id: [] for player_id in self.scores
+        }
+        # (round, match) -> positions de la partie chez chaque joueur
+        self._boards: dict[tuple[int, int], tuple[str, int, str, int]] = {}
+        self.buchholz: dict[str, float] = dict.fromkeys(self.scores, 0.0)
+        self.sonneborn_berger: dict[str, float] = dict.fromkeys(
+            self.scores, 0.0
+        )
+
+    @classmethod
+    def from_rounds(
+        cls, scores: Mapping[str, float], rounds: Iterable[Round]
+    ) -> "TieBreaks":
+        """Départages calculés à partir des rounds clôturés."""
+        tiebreaks = cls(scores)
+        for round_num, round_obj in enumerate(rounds, 1):
+            tiebreaks.add_round(round_num, round_obj, recompute=False)
+        tiebreaks._recompute(tiebreaks.scores)
+        return tiebreaks
+
+    def add_round(
+        self, round_num: int, round_obj: Round, recompute: bool = True
+    ) -> None:
+        """Ajoute les parties d'un round (scores déjà à jour)."""
+        for board, match in enumerate(round_obj.matches, 1):
+            player1, player2 = match.player1.id, match.player2.id
+            if player1 not in self.games or player2 not in self.games:
+                continue
+            self.games[player1].append(Game(player2, match.score1))
+            self.games[player2].append(Game(player1, match.score2))
+            self._boards[(round_num, board)] = (
+                player1,
+                len(self.games[player1]) - 1,
+                player2,
+                len(self.games[player2]) - 1,
+            )
+        if recompute:
+            self._recompute(self.scores)
+
+    def amend(
+        self, round_num: int, board: int, score1: float, score2: float
+    ) -> set[str]:
+        """Remplace le résultat d'un match et met à jour les départages.
+
+        Retourne les joueurs dont un départage a été recalculé.
+        """
+        location = self._boards.get((round_num, board))
+        if location is None:
+            return set()
+        player1, index1, player2, index2 = location
+        delta1 = score1 - self.games[player1][index1].points
+        delta2 = score2 - self.games[player2][index2].points
+        self.games[player1][index1] = Game(player2, score1)
+        self.games[player2][index2] = Game(player1, score2)
+        self.scores[player1] += delta1
+        self.scores[player2] += delta2
+
+        affected = {player1, player2}
+        for player_id in (player1, player2):
+            affected.update(game.opponent_id for game in self.games[player_id])
+        self._recompute(affected)
+        return affected
+
+    def _recompute(self, player_ids: Iterable[str]) -> None:
+        for player_id in player_ids:
+            buchholz = sonneborn_berger = 0.0
+            for game in self.games.get(player_id, ()):
+                opponent_score = self.scores.get(game.opponent_id, 0.0)
+                buchholz += opponent_score
+                sonneborn_berger += game.points * opponent_score
+            self.buchholz[player_id] = buchholz
+            self.sonneborn_berger[player_id] = sonneborn_berger
+
+    def sort_key(self, player_id: str) -> tuple[float, float, float]:
+        """Clé de classement : score, Buchholz, Sonneborn-Berger."""
+        return (
+            -self.scores[player_id],
+            -self.buchholz[player_id],
+            -self.sonneborn_berger[player_id],
+        )
@@ -0,0 +1,256 @@
+"""Validation des joueurs et tournois, unitaire ou par lots.
+
+Les expressions régulières sont compilées une seule fois à l'import et les
+dates sont analysées via le cache de ``date_utils``. Les fonctions
+``validate_*_batch`` parcourent des enregistrements au format JSON
+(``to_dict``) et retournent la liste structurée des erreurs, contraintes
+inter-enregistrements comprises (identifiants en double, joueurs
+référencés inconnus).
+"""
+
+import re
+from datetime import date
+from typing import Any, Iterable, Mapping, NamedTuple
+
+from .date_utils import DATE_PATTERN, parse_date
+from .pairing_utils import PAIRING_SYSTEMS, TEAM_PAIRING_SYSTEMS
+
+ID_PATTERN = re.compile(r"^[A-Z]{2}\d{5}$")
+NAME_PATTERN = re.compile(r"^[A-ZÀ-ÖØ-Þ][A-Za-zÀ-ÖØ-öø-ÿ\- ]*$")
+
+ID_ERROR = "Format d'identifiant invalide. Exemple : AB12345."
+BIRTHDAY_ERROR = "Format de date de naissance invalide (YYYY-MM-DD)."
+
+
+class RecordError(NamedTuple):
+    """Erreur rattachée à un enregistrement d'un lot."""
+
+    index: int
+    record_id: str | None
+    field: str
+    message: str
+
+
+def validate_id(identifier: str) -> str | None:
+    """Message d'erreur si l'identifiant n'est pas au format AB12345."""
+    if not ID_PATTERN.match(identifier or ""):
+        return ID_ERROR
+    return None
+
+
+def validate_name(name: str, field_label: str) -> str | None:
+    """Message d'erreur si le nom est vide ou mal formé."""
+    if not name or len(name.strip()) == 0:
+        return f"Le {field_label} ne peut pas être vide."
+    if not NAME_PATTERN.match(name):
+        return (
+            f"Format de {field_label} invalide : doit commencer par "
+            "une majuscule et ne contenir que des lettres, espaces ou "
+            "tirets."
+        )
+    return None
+
+
+def _as_date(value: date | str | None) -> date | None:
+    """Date typée, ou analysée depuis un texte YYYY-MM-DD."""
+    if isinstance(value, date):
+        return value
+    return parse_date(value or "")
+
+
+def validate_birthday(birthday: date | str) -> str | None:
+    """Message d'erreur si la date de naissance n'est pas YYYY-MM-DD."""
+    if isinstance(birthday, date):
+        return None
+    if not DATE_PATTERN.match(birthday or ""):
+        return BIRTHDAY_ERROR
+    return None
+
+
+def validate_dates(
+    start_date: date | str, end_date: date | str
+) -> list[str]:
+    """Erreurs de format des dates et d'ordre début/fin.
+
+    Les dates sont typées ou au format YYYY-MM-DD ; une date vide vaut la
+    date du jour.
+    """
+    errors: list[str] = []
+    today = date.today()
+
+    start = _as_date(start_date) if start_date else today
+    end = _as_date(end_date) if end_date else today
+
+    if isinstance(start_date, str) and start_date and not (
+        DATE_PATTERN.match(start_date)
+    ):
+        errors.append(
+            "Format de date de début invalide. Attendu : YYYY-MM-DD."
+        )
+    if isinstance(end_date, str) and end_date and not (
+        DATE_PATTERN.match(end_date)
+    ):
+        errors.append(
+            "Format de date de fin invalide. Attendu : YYYY-MM-DD."
+        )
+
+    if not errors:
+        if start is None or end is None:
+            errors.append("Valeurs de date invalides.")
+        elif end < start:
+            errors.append(
+                "La date de fin doit être postérieure ou égale à la"
+                " date de début."
+            )
+    return errors
+
+
+def player_errors(record: Mapping[str, Any]) -> list[tuple[str, str]]:
+    """Erreurs ``(champ, message)`` d'un joueur au format JSON."""
+    errors: list[tuple[str, str]] = []
+    checks = (
+        ("id", validate_id(record.get("id", ""))),
+        ("lastname", validate_name(record.get("lastname", ""), "nom")),
+        ("firstname", validate_name(record.get("firstname", ""), "prénom")),
+        ("birthday", validate_birthday(record.get("birthday", ""))),
+    )
+    for field, message in checks:
+        if message:
+            errors.append((field, message))
+    return errors
+
+
+def tournament_errors(record: Mapping[str, Any]) -> list[tuple[str, str]]:
+    """Erreurs ``(champ, message)`` d'un tournoi au format JSON."""
+    errors: list[tuple[str, str]] = []
+
+    id_error = validate_id(record.get("id", ""))
+    if id_error:
+        errors.append(("id", id_error))
+
+    if not record.get("name") or not record.get("location"):
+        errors.append(
+            ("name", "Le nom et le lieu du tournoi sont obligatoires.")
+        )
+
+    for message in validate_dates(
+        record.get("start_date", ""), record.get("end_date", "")
+    ):
+        errors.append(("dates", message))
+
+    if len(record.get("players", [])) < 2:
+        errors.append(
+            ("players", "Le tournoi doit compter au moins deux joueurs.")
+        )
+
+    system = record.get("pairing_system", "swiss")
+    if system not in PAIRING_SYSTEMS:
+        errors.append(
+            ("pairing_system", f"Système d'appariement inconnu : {system}")
+        )
+    errors.extend(("teams", message) for message in team_errors(record))
+    return errors
+
+
+def team_errors(record: Mapping[str, Any]) -> list[str]:
+    """Erreurs de composition des équipes d'un tournoi au format JSON.
+
+    Sans équipes, le tournoi est individuel et rien n'est vérifié.
+    """
+    teams = record.get("teams") or []
+    if not teams:
+        return []
+    errors: list[str] = []
+    if len(teams) < 2:
+        errors.append("Le tournoi doit compter au moins deux équipes.")
+    if record.get("pairing_system", "swiss") not in TEAM_PAIRING_SYSTEMS:
+        errors.append(
+            "Système d'appariement non disponible pour les équipes."
+        )
+    if len({len(team.get("player_ids", [])) for team in teams}) > 1:
+        errors.append(
+            "Toutes les équipes doivent compter le même nombre de joueurs."
+        )
+    registered = {entry["player_id"] for entry in record.get("players", [])}
+    seen: set[str] = set()
+    for team in teams:
+        for player_id in team.get("player_ids", []):
+            if player_id in seen:
+                errors.append(f"Joueur {player_id} dans plusieurs équipes.")
+            elif player_id not in registered:
+                errors.append(
+                    f"Joueur {player_id} de l'équipe {team.get('name')} "
+                    "non inscrit au tournoi."
+                )
+            seen.add(player_id)
+    return errors
+
+
+def validate_players_batch(
+    records: Iterable[Mapping[str, Any]],
+) -> list[RecordError]:
+    """Valide un lot de joueurs, doublons d'identifiant compris."""
+    errors: list[RecordError] = []
+    seen: set[str] = set()
+    for index, record in enumerate(records):
+        player_id = record.get("id")
+        for field, message in player_errors(record):
+            errors.append(RecordError(index, player_id, field, message))
+        if player_id in seen:
+            errors.append(
+                RecordError(
+                    index, player_id, "id", "Identifiant de joueur en double."
+                )
+            )
+        elif player_id:
+            seen.add(player_id)
+    return errors
+
+
+def validate_tournaments_batch(
+    records: Iterable[Mapping[str, Any]],
+    known_player_ids: Iterable[str] | None = None,
+) -> list[RecordError]:
+    """Valide un lot de tournois en une passe.
+
+    Si ``known_player_ids`` est fourni, chaque joueur inscrit ou présent
+    dans un match doit y figurer.
+    """
+    known = set(known_player_ids) if known_player_ids is not None else None
+    errors: list[RecordError] = []
+    seen: set[str] = set()
+    for index, record in enumerate(records):
+        tournament_id = record.get("id")
+        for field, message in tournament_errors(record):
+            errors.append(RecordError(index, tournament_id, field, message))
+        if tournament_id in seen:
+            errors.append(
+                RecordError(
+                    index,
+                    tournament_id,
+                    "id",
+                    "Identifiant de tournoi en double.",
+                )
+            )
+        elif tournament_id:
+            seen.add(tournament_id)
+
+        if known is None:
+            continue
+        referenced = {
+            entry["player_id"] for entry in record.get("players", [])
+        }
+        for round_data in record.get("rounds", []):
+            for match in round_data.get("matches", []):
+                referenced.add(match["player1_id"])
+                referenced.add(match["player2_id"])
+        for player_id in sorted(referenced - known):
+            errors.append(
+                RecordError(
+                    index,
+                    tournament_id,
+                    "players",
+                    f"Joueur {player_id} introuvable.",
+                )
+            )
+    return errors
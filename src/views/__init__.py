@@ -1,11 +1,40 @@
-from .logger_view import LoggerView
-from .main_view import MainView
-from .player_view import PlayerView
-from .tournament_view import TournamentView
+"""Vues console Rich, importées à la première utilisation (PEP 562)."""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .logger_view import LoggerView
+    from .main_view import MainView
+    from .pagination_view import PaginationView
+    from .player_view import PlayerView
+    from .query_view import QueryView
+    from .tournament_view import TournamentView
+
+_EXPORTS = {
+    "MainView": ".main_view",
+    "PaginationView": ".pagination_view",
+    "PlayerView": ".player_view",
+    "QueryView": ".query_view",
+    "TournamentView": ".tournament_view",
+    "LoggerView": ".logger_view",
+}
 
 __all__ = [
     "MainView",
+    "PaginationView",
     "PlayerView",
+    "QueryView",
     "TournamentView",
     "LoggerView",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Importe le module de la vue demandée au premier accès."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,16 @@
-from rich.console import Console
+from typing import Any
 
-console = Console()
+_console: Any = None
+
+
+def get_console() -> Any:
+    """Console Rich partagée, créée (et Rich importé) au premier message."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 class LoggerView:
@@ -8,16 +18,16 @@ class LoggerView:
 
     @staticmethod
     def error(message: str) -> None:
-        console.print(f"[red]✗ {message}[/red]")
+        get_console().print(f"[red]✗ {message}[/red]")
 
     @staticmethod
     def success(message: str) -> None:
-        console.print(f"[green]✓ {message}[/green]")
+        get_console().print(f"[green]✓ {message}[/green]")
 
     @staticmethod
     def warning(message: str) -> None:
-        console.print(f"[yellow]⚠ {message}[/yellow]")
+        get_console().print(f"[yellow]⚠ {message}[/yellow]")
 
     @staticmethod
     def info(message: str) -> None:
-        console.print(f"[cyan]{message}[/cyan]")
+        get_console().print(f"[cyan]{message}[/cyan]")
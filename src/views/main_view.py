@@ -23,6 +23,7 @@ class MainView:
         menu_content = """
 [bold white]1[/bold white]  Gérer les joueurs
 [bold white]2[/bold white]  Gérer les tournois
+[bold white]3[/bold white]  Rechercher dans l'archive
 [bold white]0[/bold white]  Quitter
 """
 
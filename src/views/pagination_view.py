@@ -0,0 +1,30 @@
+from rich.console import Console
+from rich.prompt import Prompt
+
+console = Console()
+
+
+class PaginationView:
+    """Éléments d'affichage communs aux tableaux paginés."""
+
+    @staticmethod
+    def page_caption(page: int, pages: int, total: int, query: str) -> str:
+        """Légende d'un tableau paginé"""
+        caption = f"Page {page}/{pages} · {total} résultat(s)"
+        if query:
+            caption += f" · filtre « {query} »"
+        return caption
+
+    @staticmethod
+    def navigation_help(extra: str = "Entrée : retour") -> None:
+        """Rappelle les commandes de navigation"""
+        console.print(
+            "[dim]s : page suivante · p : précédente · :N : page N · "
+            f"/texte : filtrer · / : effacer le filtre · {extra}[/dim]"
+        )
+
+    @staticmethod
+    def prompt_command() -> str:
+        """Demande une commande de navigation"""
+        PaginationView.navigation_help()
+        return Prompt.ask("[cyan]>[/cyan]", default="").strip()
@@ -4,6 +4,10 @@ from rich.prompt import Prompt
 from rich.table import Table
 
 from models import Player
+from utils.date_utils import format_date
+from utils.dedup_utils import DuplicateCandidate
+
+from .pagination_view import PaginationView
 
 
 console = Console()
@@ -19,6 +23,8 @@ class PlayerView:
 [bold white]1[/bold white]  Créer un joueur
 [bold white]2[/bold white]  Lister les joueurs
 [bold white]3[/bold white]  Supprimer un joueur
+[bold white]4[/bold white]  Historique d'un joueur
+[bold white]5[/bold white]  Doublons (détection et fusion)
 [bold white]0[/bold white]  Retour au menu principal
 """
         panel = Panel(
@@ -58,15 +64,35 @@ class PlayerView:
         return Prompt.ask("[cyan]ID du joueur à supprimer[/cyan]").strip()
 
     @staticmethod
-    def display_players(players: list[Player]) -> None:
-        """Affiche la liste des joueurs dans un tableau Rich"""
+    def prompt_player_id() -> str:
+        """Demande l'ID d'un joueur à consulter"""
+        console.print(
+            "\n[bold yellow]📈 Historique d'un joueur[/bold yellow]",
+            style="bold",
+        )
+        return Prompt.ask("[cyan]ID du joueur[/cyan]").strip()
+
+    @staticmethod
+    def display_players(
+        players: list[Player],
+        page: int = 1,
+        pages: int = 1,
+        total: int | None = None,
+        query: str = "",
+    ) -> None:
+        """Affiche une page de joueurs dans un tableau Rich"""
         console.print()
-        if not players:
+        if not players and not query:
             console.print("[yellow]ℹ Aucun joueur enregistré.[/yellow]")
             return
 
         table = Table(
             title="[bold yellow]📋 Liste des joueurs[/bold yellow]",
+            caption=(
+                PaginationView.page_caption(page, pages, total, query)
+                if total is not None
+                else None
+            ),
             show_header=True,
             header_style="bold cyan",
             border_style="yellow",
@@ -80,7 +106,160 @@ class PlayerView:
 
         for player in players:
             table.add_row(
-                player.id, player.lastname, player.firstname, player.birthday
+                player.id,
+                player.lastname,
+                player.firstname,
+                format_date(player.birthday),
+            )
+
+        console.print(table)
+
+    @staticmethod
+    def display_player_references(
+        player: Player, references: dict[str, int]
+    ) -> None:
+        """Affiche les tournois qui référencent un joueur"""
+        console.print()
+        table = Table(
+            title=(
+                f"[bold red]⚠ {player.lastname} {player.firstname} "
+                "figure dans des tournois[/bold red]"
+            ),
+            show_header=True,
+            header_style="bold cyan",
+            border_style="red",
+        )
+        table.add_column("Tournoi", style="cyan")
+        table.add_column("Matchs joués", justify="center")
+
+        for tournament_id, matches in sorted(references.items()):
+            table.add_row(tournament_id, str(matches))
+
+        console.print(table)
+
+    @staticmethod
+    def display_player_career(player: Player, career: dict | None) -> None:
+        """Affiche le bilan d'un joueur, au total et par tournoi"""
+        console.print()
+        if not career:
+            console.print(
+                f"[yellow]ℹ {player.lastname} {player.firstname} n'a "
+                "encore joué aucun match.[/yellow]"
+            )
+            return
+
+        total = career["total"]
+        table = Table(
+            title=(
+                f"[bold yellow]📈 {player.lastname} {player.firstname}"
+                "[/bold yellow]"
+            ),
+            caption=(
+                f"{total['games']} partie(s) · {total['wins']} V / "
+                f"{total['draws']} N / {total['losses']} D · "
+                f"{total['points']} pt(s) · "
+                f"{len(total['opponents'])} adversaire(s)"
+            ),
+            show_header=True,
+            header_style="bold cyan",
+            border_style="yellow",
+        )
+        table.add_column("Tournoi", style="cyan")
+        table.add_column("Parties", justify="center")
+        table.add_column("V", justify="center", style="green")
+        table.add_column("N", justify="center")
+        table.add_column("D", justify="center", style="red")
+        table.add_column("Points", justify="center", style="bold")
+
+        for tournament_id, stats in sorted(career["tournaments"].items()):
+            table.add_row(
+                tournament_id,
+                str(stats["games"]),
+                str(stats["wins"]),
+                str(stats["draws"]),
+                str(stats["losses"]),
+                str(stats["points"]),
             )
 
         console.print(table)
+
+    @staticmethod
+    def display_duplicates(
+        candidates: list[DuplicateCandidate],
+        players: dict[str, Player],
+        references: dict[str, int],
+    ) -> None:
+        """Affiche les paires de joueurs probablement en double
+
+        Args:
+            candidates: paires triées par score décroissant
+            players: joueurs des paires, par identifiant
+            references: nombre de tournois de chaque joueur
+        """
+        console.print()
+        if not candidates:
+            console.print("[green]✓ Aucun doublon détecté.[/green]")
+            return
+        table = Table(
+            title=(
+                f"[bold yellow]🔍 {len(candidates)} doublon(s) "
+                "probable(s)[/bold yellow]"
+            ),
+            show_header=True,
+            header_style="bold cyan",
+            border_style="yellow",
+        )
+        table.add_column("N°", justify="center", style="bold")
+        table.add_column("Joueur", style="white")
+        table.add_column("Doublon", style="white")
+        table.add_column("Score", justify="center", style="yellow")
+
+        def describe(player_id: str) -> str:
+            player = players[player_id]
+            return (
+                f"{player.lastname} {player.firstname} "
+                f"({format_date(player.birthday)})\n"
+                f"[cyan]{player_id}[/cyan] [dim]· "
+                f"{references.get(player_id, 0)} tournoi(s)[/dim]"
+            )
+
+        for number, candidate in enumerate(candidates, 1):
+            table.add_row(
+                str(number),
+                describe(candidate.player_id),
+                describe(candidate.other_id),
+                f"{candidate.score:.0%}",
+            )
+        console.print(table)
+
+    @staticmethod
+    def prompt_duplicate_choice(count: int) -> int:
+        """Demande la paire à fusionner (0 pour aucune)"""
+        choice = Prompt.ask(
+            "[cyan]N° de la paire à fusionner (0 : aucune)[/cyan]",
+            default="0",
+        ).strip()
+        if choice.isdigit() and 0 <= int(choice) <= count:
+            return int(choice)
+        return 0
+
+    @staticmethod
+    def prompt_keep_id(candidate: DuplicateCandidate, default: str) -> str:
+        """Demande l'identifiant à conserver parmi les deux joueurs"""
+        return Prompt.ask(
+            "[cyan]ID à conserver[/cyan]",
+            choices=[candidate.player_id, candidate.other_id],
+            default=default,
+        )
+
+    @staticmethod
+    def confirm_action(message: str) -> bool:
+        """Demander confirmation pour une action avec Rich"""
+        response = (
+            Prompt.ask(
+                f"[yellow]{message}[/yellow]", choices=["o", "n"], default="n"
+            )
+            .strip()
+            .lower()
+        )
+        return response == "o"
@@ -0,0 +1,229 @@
+from rich.console import Console
+from rich.panel import Panel
+from rich.prompt import Prompt
+from rich.table import Table
+
+from utils.date_utils import format_date
+from utils.query_utils import GameRecord, HeadToHead, TournamentSummary
+
+from .logger_view import LoggerView
+
+console = Console()
+
+
+class QueryView:
+    """Vues de recherche dans l'archive des tournois."""
+
+    @staticmethod
+    def query_menu() -> str:
+        """Menu des requêtes sur l'archive avec Rich"""
+        console.print()
+        menu_content = """
+[bold white]1[/bold white]  Tournois (lieu, période, joueur)
+[bold white]2[/bold white]  Parties entre deux joueurs
+[bold white]3[/bold white]  Joueurs actifs sur une période
+[bold white]4[/bold white]  Face-à-face d'un joueur
+[bold white]0[/bold white]  Retour au menu principal
+"""
+        panel = Panel(
+            menu_content.strip(),
+            title="[bold blue]🔎 Recherche dans l'archive[/bold blue]",
+            border_style="blue",
+            padding=(1, 2),
+        )
+        console.print(panel)
+        return Prompt.ask("[bold blue]>[/bold blue]", default="").strip()
+
+    @staticmethod
+    def prompt_period() -> tuple[str, str]:
+        """Demande une période (dates de début de tournoi, vides = ouvert)"""
+        start = Prompt.ask(
+            "[cyan]Du (YYYY-MM-DD, vide : sans limite)[/cyan]", default=""
+        ).strip()
+        end = Prompt.ask(
+            "[cyan]Au (YYYY-MM-DD, vide : sans limite)[/cyan]", default=""
+        ).strip()
+        return start, end
+
+    @staticmethod
+    def prompt_tournament_filters() -> dict:
+        """Demande les critères de recherche des tournois"""
+        console.print("\n[bold blue]🏆 Recherche de tournois[/bold blue]")
+        location = Prompt.ask(
+            "[cyan]Lieu (vide : tous)[/cyan]", default=""
+        ).strip()
+        player_id = Prompt.ask(
+            "[cyan]ID d'un joueur (vide : tous)[/cyan]", default=""
+        ).strip()
+        start, end = QueryView.prompt_period()
+        return {
+            "location": location,
+            "player_id": player_id.upper(),
+            "start": start,
+            "end": end,
+        }
+
+    @staticmethod
+    def prompt_player_pair() -> tuple[str, str]:
+        """Demande les identifiants de deux joueurs"""
+        console.print("\n[bold blue]⚔ Parties entre deux joueurs[/bold blue]")
+        first = Prompt.ask("[cyan]ID du premier joueur[/cyan]").strip()
+        second = Prompt.ask("[cyan]ID du second joueur[/cyan]").strip()
+        return first.upper(), second.upper()
+
+    @staticmethod
+    def prompt_player_id() -> str:
+        """Demande l'identifiant d'un joueur"""
+        console.print("\n[bold blue]🤝 Face-à-face[/bold blue]")
+        return Prompt.ask("[cyan]ID du joueur[/cyan]").strip().upper()
+
+    @staticmethod
+    def prompt_min_games() -> str:
+        """Demande le nombre minimal de parties"""
+        console.print("\n[bold blue]📊 Joueurs actifs[/bold blue]")
+        return Prompt.ask(
+            "[cyan]Nombre minimal de parties[/cyan]", default="1"
+        ).strip()
+
+    @staticmethod
+    def display_tournaments(summaries: list[TournamentSummary]) -> None:
+        """Afficher les tournois trouvés"""
+        console.print()
+        if not summaries:
+            LoggerView.info("Aucun tournoi ne correspond à ces critères.")
+            return
+        table = Table(
+            title=f"[bold blue]{len(summaries)} tournoi(s)[/bold blue]",
+            show_header=True,
+            header_style="bold cyan",
+            border_style="blue",
+        )
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Nom", style="white")
+        table.add_column("Lieu", style="white")
+        table.add_column("Début", style="dim")
+        table.add_column("Fin", style="dim")
+        table.add_column("Joueurs", justify="center")
+        table.add_column("Rounds", justify="center")
+        for summary in summaries:
+            table.add_row(
+                summary.id,
+                summary.name,
+                summary.location,
+                format_date(summary.start_date),
+                format_date(summary.end_date),
+                str(summary.players_count),
+                f"{summary.rounds_played}/{summary.rounds_count}",
+            )
+        console.print(table)
+
+    @staticmethod
+    def display_games(
+        games: list[GameRecord], names: dict[str, str]
+    ) -> None:
+        """Afficher les parties entre deux joueurs et leur bilan"""
+        console.print()
+        if not games:
+            LoggerView.info("Aucune partie entre ces deux joueurs.")
+            return
+        table = Table(
+            title=f"[bold blue]{len(games)} partie(s)[/bold blue]",
+            show_header=True,
+            header_style="bold cyan",
+            border_style="blue",
+        )
+        table.add_column("Tournoi", style="cyan")
+        table.add_column("Round", justify="center")
+        table.add_column("Match", justify="center")
+        table.add_column("Joueur 1", style="white")
+        table.add_column("Score", justify="center", style="yellow")
+        table.add_column("Joueur 2", style="white")
+        points: dict[str, float] = {}
+        for game in games:
+            table.add_row(
+                game.tournament_id,
+                str(game.round_num),
+                str(game.board),
+                names.get(game.player1_id, game.player1_id),
+                f"{game.score1:g} - {game.score2:g}",
+                names.get(game.player2_id, game.player2_id),
+            )
+            points[game.player1_id] = (
+                points.get(game.player1_id, 0.0) + game.score1
+            )
+            points[game.player2_id] = (
+                points.get(game.player2_id, 0.0) + game.score2
+            )
+        console.print(table)
+        console.print(
+            "[bold]Bilan :[/bold] "
+            + " · ".join(
+                f"{names.get(player_id, player_id)} {total:g} pts"
+                for player_id, total in points.items()
+            )
+        )
+
+    @staticmethod
+    def display_active_players(
+        players: list[tuple[str, int]], names: dict[str, str]
+    ) -> None:
+        """Afficher les joueurs et leur nombre de parties"""
+        console.print()
+        if not players:
+            LoggerView.info("Aucun joueur ne correspond à ces critères.")
+            return
+        table = Table(
+            title=f"[bold blue]{len(players)} joueur(s)[/bold blue]",
+            show_header=True,
+            header_style="bold cyan",
+            border_style="blue",
+        )
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Joueur", style="white")
+        table.add_column("Parties", justify="center", style="yellow")
+        for player_id, games in players:
+            table.add_row(
+                player_id, names.get(player_id, "?"), str(games)
+            )
+        console.print(table)
+
+    @staticmethod
+    def display_head_to_head(
+        player_id: str,
+        opponents: dict[str, HeadToHead],
+        names: dict[str, str],
+    ) -> None:
+        """Afficher le bilan d'un joueur contre chacun de ses adversaires"""
+        console.print()
+        if not opponents:
+            LoggerView.info("Aucune partie enregistrée pour ce joueur.")
+            return
+        table = Table(
+            title=(
+                f"[bold blue]{names.get(player_id, player_id)} : "
+                f"{len(opponents)} adversaire(s)[/bold blue]"
+            ),
+            show_header=True,
+            header_style="bold cyan",
+            border_style="blue",
+        )
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Adversaire", style="white")
+        table.add_column("Parties", justify="center")
+        table.add_column("V", justify="center", style="green")
+        table.add_column("N", justify="center")
+        table.add_column("D", justify="center", style="red")
+        table.add_column("Points", justify="center", style="yellow")
+        for opponent_id, record in sorted(
+            opponents.items(), key=lambda item: (-item[1].games, item[0])
+        ):
+            table.add_row(
+                opponent_id,
+                names.get(opponent_id, "?"),
+                str(record.games),
+                str(record.wins),
+                str(record.draws),
+                str(record.losses),
+                f"{record.points:g}",
+            )
+        console.print(table)
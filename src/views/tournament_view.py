@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from rich.console import Console
 from rich.panel import Panel
@@ -6,13 +7,31 @@ from rich.prompt import Prompt
 from rich.table import Table
 from rich.tree import Tree
 
-from models import Player, Tournament
+from models import Match, Player, Team, Tournament
 from utils import clear_screen
+from utils.clock_utils import RoundClock, format_duration, format_timestamp
+from utils.date_utils import format_date
+from utils.pairing_utils import TEAM_PAIRING_SYSTEMS
+from utils.team_utils import TeamStanding
+from utils.tiebreak_utils import TieBreaks
 
 from .logger_view import LoggerView
+from .pagination_view import PaginationView
+
+if TYPE_CHECKING:
+    from utils.crosstable_utils import Crosstable
+    from utils.publish_utils import PublishReport
 
 console = Console()
 
+# Libellés des systèmes d'appariement, dans l'ordre du menu de création
+PAIRING_SYSTEM_LABELS = {
+    "swiss": "Système suisse",
+    "round_robin": "Toutes rondes (tables de Berger)",
+    "single_elimination": "Élimination directe",
+    "double_elimination": "Double élimination",
+}
+
 
 class TournamentView:
 
@@ -26,6 +45,9 @@ class TournamentView:
 [bold white]3[/bold white]  Afficher un tournoi
 [bold white]4[/bold white]  Jouer un tournoi
 [bold white]5[/bold white]  Supprimer un tournoi
+[bold white]6[/bold white]  Corriger des résultats
+[bold white]7[/bold white]  Planning de l'événement
+[bold white]8[/bold white]  Publier les résultats (HTML)
 [bold white]0[/bold white]  Retour au menu principal
 """
         panel = Panel(
@@ -63,9 +85,30 @@ class TournamentView:
         description = Prompt.ask(
             "[cyan]Description (optionnel)[/cyan]", default=""
         ).strip()
-        rounds_count = Prompt.ask(
-            "[cyan]Nombre de tours[/cyan]", default="4"
-        ).strip()
+        systems = list(PAIRING_SYSTEM_LABELS)
+        for number, system in enumerate(systems, 1):
+            console.print(
+                f"  [bold white]{number}[/bold white]  "
+                f"{PAIRING_SYSTEM_LABELS[system]}"
+            )
+        choice = Prompt.ask(
+            "[cyan]Système d'appariement[/cyan]",
+            choices=[str(number) for number in range(1, len(systems) + 1)],
+            default="1",
+        )
+        pairing_system = systems[int(choice) - 1]
+        # Hors système suisse, le nombre de tours découle des joueurs
+        rounds_count = ""
+        if pairing_system == "swiss":
+            rounds_count = Prompt.ask(
+                "[cyan]Nombre de tours[/cyan]", default="4"
+            ).strip()
+        team_size = "0"
+        if pairing_system in TEAM_PAIRING_SYSTEMS:
+            team_size = Prompt.ask(
+                "[cyan]Joueurs par équipe (0 = tournoi individuel)[/cyan]",
+                default="0",
+            ).strip()
 
         return {
             "id": tournament_id,
@@ -75,18 +118,43 @@ class TournamentView:
             "end_date": end_date,
             "description": description,
             "rounds_count": rounds_count,
+            "pairing_system": pairing_system,
+            "team_size": team_size,
         }
 
     @staticmethod
-    def display_tournaments(tournaments: list[Tournament]) -> None:
-        """Affiche la liste des tournois dans un tableau Rich"""
+    def prompt_team_name(number: int, players: list[Player]) -> str:
+        """Demande le nom d'une équipe formée des joueurs donnés."""
+        boards = ", ".join(
+            f"{board}. {player.lastname} {player.firstname}"
+            for board, player in enumerate(players, 1)
+        )
+        console.print(f"\n[bold cyan]Équipe {number}[/bold cyan] : {boards}")
+        return Prompt.ask(
+            "[cyan]Nom de l'équipe[/cyan]", default=f"Équipe {number}"
+        ).strip()
+
+    @staticmethod
+    def display_tournaments(
+        tournaments: list[Tournament],
+        page: int = 1,
+        pages: int = 1,
+        total: int | None = None,
+        query: str = "",
+    ) -> None:
+        """Affiche une page de tournois dans un tableau Rich"""
         console.print()
-        if not tournaments:
+        if not tournaments and not query:
             console.print("[yellow]ℹ Aucun tournoi enregistré.[/yellow]")
             return
 
         table = Table(
             title="[bold green]🏆 Liste des tournois[/bold green]",
+            caption=(
+                PaginationView.page_caption(page, pages, total, query)
+                if total is not None
+                else None
+            ),
             show_header=True,
             header_style="bold cyan",
             border_style="green",
@@ -113,8 +181,8 @@ class TournamentView:
                 tournament.id,
                 tournament.name,
                 tournament.location,
-                tournament.start_date,
-                tournament.end_date,
+                format_date(tournament.start_date),
+                format_date(tournament.end_date),
                 status,
             )
 
@@ -157,6 +225,44 @@ class TournamentView:
         console.print(f"[bold yellow]🎯 ROUND {round_num}[/bold yellow]")
         console.print(f"[bold cyan]{'=' * 50}[/bold cyan]")
 
+    @staticmethod
+    def display_pairings_preview(
+        round_num: int,
+        matches: list[Match],
+        bye_player: Player | None,
+        bye_team: Team | None = None,
+    ) -> None:
+        """Afficher les appariements du prochain round sans le jouer"""
+        console.print()
+        if bye_player:
+            caption = f"Exempt : {bye_player.lastname} {bye_player.firstname}"
+        elif bye_team:
+            caption = f"Équipe exempte : {bye_team.name}"
+        else:
+            caption = None
+        table = Table(
+            title=(
+                f"[bold cyan]👀 Aperçu des appariements - Round {round_num}"
+                "[/bold cyan]"
+            ),
+            caption=caption,
+            show_header=True,
+            header_style="bold cyan",
+            border_style="cyan",
+        )
+        table.add_column("Échiquier", justify="center", style="bold")
+        table.add_column("Blancs", style="white")
+        table.add_column("Noirs", style="white")
+
+        for index, match in enumerate(matches, 1):
+            table.add_row(
+                str(index),
+                f"{match.player1.lastname} {match.player1.firstname}",
+                f"{match.player2.lastname} {match.player2.firstname}",
+            )
+
+        console.print(table)
+
     @staticmethod
     def display_bye_message(bye_player: Player) -> None:
         LoggerView.warning(
@@ -166,6 +272,13 @@ class TournamentView:
             )
         )
 
+    @staticmethod
+    def display_bye_team_message(bye_team: Team) -> None:
+        LoggerView.warning(
+            f"⚡ L'équipe {bye_team.name} est exempte ce round "
+            "(rencontre gagnée par forfait)"
+        )
+
     @staticmethod
     def display_bye_points_awarded(bye_player: Player) -> None:
         LoggerView.success(
@@ -176,8 +289,32 @@ class TournamentView:
         )
 
     @staticmethod
-    def display_round_completed(round_num: int) -> None:
-        LoggerView.success(f"Round {round_num} terminé !")
+    def display_round_clock(clock: RoundClock) -> None:
+        """Afficher l'heure de début et la fin prévue d'un round"""
+        line = f"[dim]Début : {format_timestamp(clock.started_at)}"
+        if clock.deadline is not None:
+            line += f" · fin prévue : {format_timestamp(clock.deadline)}"
+        console.print(line + "[/dim]")
+
+    @staticmethod
+    def display_round_completed(
+        round_num: int, clock: RoundClock | None = None
+    ) -> None:
+        message = f"Round {round_num} terminé !"
+        if clock is not None:
+            message += f" (durée {format_duration(clock.elapsed())})"
+        LoggerView.success(message)
+        if clock is not None and clock.is_overdue:
+            LoggerView.warning(
+                "Fin prévue dépassée de "
+                f"{format_duration(-clock.remaining())}."
+            )
+
+    @staticmethod
+    def display_results_recovered(count: int) -> None:
+        LoggerView.info(
+            f"♻ {count} résultat(s) récupéré(s) depuis le journal de saisie."
+        )
 
     @staticmethod
     def display_tournament_details(tournament: Tournament) -> None:
@@ -194,8 +331,8 @@ class TournamentView:
         info_branch.add("[white]Lieu:[/white] {}".format(tournament.location))
         info_branch.add(
             "[white]Date:[/white] {} au {}".format(
-                tournament.start_date,
-                tournament.end_date,
+                format_date(tournament.start_date),
+                format_date(tournament.end_date),
             )
         )
         info_branch.add(
@@ -203,6 +340,13 @@ class TournamentView:
                 tournament.description or "N/A"
             )
         )
+        info_branch.add(
+            "[white]Appariements:[/white] {}".format(
+                PAIRING_SYSTEM_LABELS.get(
+                    tournament.pairing_system, tournament.pairing_system
+                )
+            )
+        )
 
         progress_text = f"{tournament.current_round}/{tournament.rounds_count}"
         if tournament.current_round > tournament.rounds_count:
@@ -233,6 +377,18 @@ class TournamentView:
             extra_count = len(tournament.players) - 5
             players_branch.add(f"[dim]... et {extra_count} autres[/dim]")
 
+        if tournament.teams:
+            teams_branch = tree.add(
+                "[bold cyan]🛡 Équipes ({})[/bold cyan]".format(
+                    len(tournament.teams)
+                )
+            )
+            for team in tournament.teams:
+                teams_branch.add(
+                    f"[white]{team.name}[/white] [dim]({team.id}, "
+                    f"{len(team.players)} échiquiers)[/dim]"
+                )
+
         rounds_branch = tree.add(
             "[bold cyan]🎯 Rounds ({}/{})[/bold cyan]".format(
                 len(tournament.rounds),
@@ -242,26 +398,48 @@ class TournamentView:
         for round_obj in tournament.rounds:
             round_info = f"[white]{round_obj.name}[/white] [green]✓[/green]"
             round_branch = rounds_branch.add(round_info)
-            round_branch.add(f"[dim]Début: {round_obj.started_at}[/dim]")
+            round_branch.add(
+                f"[dim]Début: {format_timestamp(round_obj.started_at)}[/dim]"
+            )
             if round_obj.ended_at:
-                round_branch.add(f"[dim]Fin: {round_obj.ended_at}[/dim]")
+                round_branch.add(
+                    f"[dim]Fin: {format_timestamp(round_obj.ended_at)}[/dim]"
+                )
             round_branch.add(f"[dim]{len(round_obj.matches)} matchs[/dim]")
 
         console.print(tree)
 
     @staticmethod
-    def prompt_select_tournament(tournaments: list[Tournament]) -> str | None:
-        """Sélection d'un tournoi avec tableau Rich"""
+    def prompt_select_tournament(
+        tournaments: list[Tournament],
+        start: int = 1,
+        page: int = 1,
+        pages: int = 1,
+        total: int | None = None,
+        query: str = "",
+    ) -> str:
+        """Sélection d'un tournoi sur une page de tableau Rich
+
+        Retourne la saisie brute : un numéro de tournoi ou une commande de
+        navigation (interprétée par le controller).
+        """
         console.print()
 
-        if not tournaments:
+        if not tournaments and not query:
             console.print("[yellow]ℹ Aucun tournoi disponible.[/yellow]")
-            return None
+            return ""
 
         console.print("[bold cyan]🏆 Sélection d'un tournoi[/bold cyan]\n")
 
         table = Table(
-            show_header=True, header_style="bold cyan", border_style="cyan"
+            caption=(
+                PaginationView.page_caption(page, pages, total, query)
+                if total is not None
+                else None
+            ),
+            show_header=True,
+            header_style="bold cyan",
+            border_style="cyan",
         )
 
         table.add_column("N°", style="yellow", justify="center")
@@ -270,13 +448,13 @@ class TournamentView:
         table.add_column("Lieu", style="white")
         table.add_column("Statut", style="yellow")
 
-        for i, tournament in enumerate(tournaments, 1):
+        for i, tournament in enumerate(tournaments, start):
             if tournament.current_round > tournament.rounds_count:
                 status = "Terminé"
             else:
                 current = tournament.current_round
-                total = tournament.rounds_count
-                status = f"Round {current}/{total}"
+                total_rounds = tournament.rounds_count
+                status = f"Round {current}/{total_rounds}"
             table.add_row(
                 str(i),
                 tournament.id,
@@ -287,57 +465,69 @@ class TournamentView:
 
         console.print(table)
         console.print()
+        PaginationView.navigation_help("Entrée : annuler")
 
-        selection = Prompt.ask(
-            "[cyan]Entrez le numéro du tournoi[/cyan]"
+        return Prompt.ask(
+            "[cyan]Entrez le numéro du tournoi[/cyan]", default=""
         ).strip()
 
-        try:
-            idx = int(selection) - 1
-            if 0 <= idx < len(tournaments):
-                return tournaments[idx].id
-        except ValueError:
-            pass
-
-        return None
-
     @staticmethod
-    def prompt_select_players(available_players: list[Player]) -> list[str]:
-        """Sélection des joueurs avec tableau Rich"""
+    def prompt_select_players(
+        available_players: list[Player],
+        start: int = 1,
+        page: int = 1,
+        pages: int = 1,
+        total: int | None = None,
+        query: str = "",
+        selected_ids: set[str] | None = None,
+    ) -> str:
+        """Sélection des joueurs sur une page de tableau Rich
+
+        Retourne la saisie brute : numéros à (dé)sélectionner séparés par
+        des virgules, commande de navigation, ou vide pour valider.
+        """
+        selected_ids = selected_ids or set()
         console.print()
-        console.print("[bold cyan]👥 Sélection des joueurs[/bold cyan]\n")
+        console.print(
+            "[bold cyan]👥 Sélection des joueurs[/bold cyan] "
+            f"[dim]({len(selected_ids)} sélectionné(s))[/dim]\n"
+        )
 
         table = Table(
-            show_header=True, header_style="bold cyan", border_style="cyan"
+            caption=(
+                PaginationView.page_caption(page, pages, total, query)
+                if total is not None
+                else None
+            ),
+            show_header=True,
+            header_style="bold cyan",
+            border_style="cyan",
         )
 
         table.add_column("N°", style="yellow", justify="center")
+        table.add_column("✓", style="green", justify="center")
         table.add_column("ID", style="cyan")
         table.add_column("Nom", style="white")
         table.add_column("Prénom", style="white")
 
-        for i, player in enumerate(available_players, 1):
-            table.add_row(str(i), player.id, player.lastname, player.firstname)
+        for i, player in enumerate(available_players, start):
+            table.add_row(
+                str(i),
+                "✓" if player.id in selected_ids else "",
+                player.id,
+                player.lastname,
+                player.firstname,
+            )
 
         console.print(table)
         console.print()
+        PaginationView.navigation_help("Entrée : valider la sélection")
 
         selection_prompt = (
-            "[cyan]Entrez les numéros des joueurs séparés par des virgules "
-            "(ex: 1,3,5,7)[/cyan]"
-        )
-        selection = Prompt.ask(selection_prompt).strip()
-
-        selected_ids = []
-        for num in selection.split(","):
-            try:
-                idx = int(num.strip()) - 1
-                if 0 <= idx < len(available_players):
-                    selected_ids.append(available_players[idx].id)
-            except ValueError:
-                continue
-
-        return selected_ids
+            "[cyan]Numéros des joueurs à ajouter/retirer, séparés par des "
+            "virgules (ex: 1,3,5,7)[/cyan]"
+        )
+        return Prompt.ask(selection_prompt, default="").strip()
 
     @staticmethod
     def display_round_matches(round_obj: dict, round_num: int) -> None:
@@ -349,8 +539,10 @@ class TournamentView:
             LoggerView.info("Aucun match enregistré pour ce round.")
             return
 
+        bye_team = round_obj.get("bye_team")
         table = Table(
             title=f"[bold cyan]🎯 Round {round_num}[/bold cyan]",
+            caption=f"Équipe exempte : {bye_team}" if bye_team else None,
             show_header=True,
             header_style="bold cyan",
             border_style="cyan",
@@ -378,9 +570,15 @@ class TournamentView:
 
     @staticmethod
     def prompt_match_result(
-        match_num: int, player1_name: str, player2_name: str
+        match_num: int,
+        player1_name: str,
+        player2_name: str,
+        allow_draw: bool = True,
     ) -> tuple[float, float]:
-        """Demander le résultat d'un match avec Rich"""
+        """Demander le résultat d'un match avec Rich
+
+        Sans ``allow_draw`` (élimination), seul un vainqueur est accepté.
+        """
         console.print()
 
         match_lines = [
@@ -398,8 +596,12 @@ class TournamentView:
                 f"[green]{player2_name}[/green]  "
                 "[dim](0.0 - 1.0)[/dim]"
             ),
-            "[bold white]3[/bold white]  Match nul  [dim](0.5 - 0.5)[/dim]",
         ]
+        if allow_draw:
+            match_lines.append(
+                "[bold white]3[/bold white]  Match nul  "
+                "[dim](0.5 - 0.5)[/dim]"
+            )
         match_content = "\n\n".join(match_lines)
 
         panel = Panel(
@@ -410,9 +612,12 @@ class TournamentView:
         )
         console.print(panel)
 
-        choice = Prompt.ask(
-            "[cyan]Résultat[/cyan]", choices=["1", "2", "3"], default="3"
-        )
+        if allow_draw:
+            choice = Prompt.ask(
+                "[cyan]Résultat[/cyan]", choices=["1", "2", "3"], default="3"
+            )
+        else:
+            choice = Prompt.ask("[cyan]Résultat[/cyan]", choices=["1", "2"])
 
         if choice == "1":
             return (1.0, 0.0)
@@ -422,19 +627,31 @@ class TournamentView:
             return (0.5, 0.5)
 
     @staticmethod
-    def display_rankings(players_data: list[list]) -> None:
+    def display_rankings(
+        players_data: list[list], tiebreaks: TieBreaks | None = None
+    ) -> None:
         """Afficher le classement des joueurs avec tableau Rich et médailles
 
         Args:
             players_data: Liste de [Player, score]
+            tiebreaks: départages (Buchholz, Sonneborn-Berger) à afficher
+                et à appliquer en cas d'égalité
         """
         console.print()
 
-        sorted_players = sorted(
-            players_data,
-            key=lambda player_data: player_data[1],
-            reverse=True,
-        )
+        if tiebreaks is None:
+            sorted_players = sorted(
+                players_data,
+                key=lambda player_data: player_data[1],
+                reverse=True,
+            )
+        else:
+            sorted_players = sorted(
+                players_data,
+                key=lambda player_data: tiebreaks.sort_key(
+                    player_data[0].id
+                ),
+            )
 
         table = Table(
             title="[bold yellow]🏆 CLASSEMENT[/bold yellow]",
@@ -447,6 +664,9 @@ class TournamentView:
         table.add_column("Rang", justify="center", style="white bold", width=6)
         table.add_column("Joueur", style="white")
         table.add_column("Score", justify="center", style="yellow bold")
+        if tiebreaks is not None:
+            table.add_column("Buchholz", justify="center", style="yellow")
+            table.add_column("S-B", justify="center", style="yellow")
         table.add_column("🏅", justify="center", width=4)
 
         medals = ["🥇", "🥈", "🥉"]
@@ -455,17 +675,97 @@ class TournamentView:
             medal = medals[i - 1] if i <= 3 else ""
             rank_style = "bold gold1" if i == 1 else "bold" if i <= 3 else ""
 
-            table.add_row(
+            cells = [
                 f"[{rank_style}]{i}[/{rank_style}]" if rank_style else str(i),
                 f"{player.lastname} {player.firstname}",
                 f"{score} pts",
-                medal,
+            ]
+            if tiebreaks is not None:
+                cells.append(f"{tiebreaks.buchholz.get(player.id, 0.0):g}")
+                cells.append(
+                    f"{tiebreaks.sonneborn_berger.get(player.id, 0.0):g}"
+                )
+            cells.append(medal)
+            table.add_row(*cells)
+
+        console.print(table)
+
+    @staticmethod
+    def display_crosstable(crosstable: "Crosstable") -> None:
+        """Afficher la grille américaine (adversaire, couleur, résultat)"""
+        console.print()
+        table = Table(
+            title="[bold yellow]📋 GRILLE AMÉRICAINE[/bold yellow]",
+            caption="[dim]Rang adverse, B/N : blancs/noirs, "
+            "+ = - : gain, nulle, perte, EXE : exempt[/dim]",
+            show_header=True,
+            header_style="bold cyan",
+            border_style="yellow",
+        )
+        for label in crosstable.headers():
+            if label == "Joueur":
+                table.add_column(label, style="white")
+            elif label == "ID":
+                table.add_column(label, style="cyan", no_wrap=True)
+            else:
+                table.add_column(label, justify="center")
+        for row in crosstable.rows():
+            table.add_row(*row)
+        console.print(table)
+
+    @staticmethod
+    def display_publication(
+        report: "PublishReport", site_dir: str
+    ) -> None:
+        """Afficher le bilan d'une publication du site"""
+        console.print()
+        if report.written:
+            LoggerView.success(
+                f"{len(report.written)} page(s) mise(s) à jour "
+                f"dans {site_dir}"
             )
+        else:
+            LoggerView.info("Site déjà à jour : aucune page réécrite.")
+        if report.skipped:
+            LoggerView.info(f"{report.skipped} tournoi(s) inchangé(s).")
+        if report.removed:
+            LoggerView.info(
+                "Pages retirées : " + ", ".join(report.removed)
+            )
+
+    @staticmethod
+    def display_exported_files(paths: list) -> None:
+        """Afficher les fichiers exportés"""
+        for path in paths:
+            LoggerView.success(f"Exporté : {path}")
+
+    @staticmethod
+    def display_team_standings(standings: list[TeamStanding]) -> None:
+        """Afficher le classement par équipes (points de match d'abord)"""
+        console.print()
+        table = Table(
+            title="[bold yellow]🏆 CLASSEMENT DES ÉQUIPES[/bold yellow]",
+            show_header=True,
+            header_style="bold cyan",
+            border_style="yellow",
+            title_style="bold yellow",
+        )
+        table.add_column("Rang", justify="center", style="white bold", width=6)
+        table.add_column("Équipe", style="white")
+        table.add_column("Pts match", justify="center", style="yellow bold")
+        table.add_column("Pts échiquiers", justify="center", style="yellow")
 
+        for rank, standing in enumerate(standings, 1):
+            table.add_row(
+                str(rank),
+                standing.team.name,
+                f"{standing.match_points:g}",
+                f"{standing.board_points:g}",
+            )
         console.print(table)
 
     @staticmethod
-    def play_tournament_menu() -> str:
+    def play_tournament_menu(teams: bool = False) -> str:
         """Menu pour jouer un tournoi avec Rich"""
         console.print()
         menu_content = "[bold white]1[/bold white]  Jouer le prochain round\n"
@@ -473,6 +773,13 @@ class TournamentView:
         menu_content += (
             "[bold white]3[/bold white]  Voir les details du tournoi\n"
         )
+        menu_content += (
+            "[bold white]4[/bold white]  Aperçu des appariements\n"
+        )
+        if teams:
+            menu_content += (
+                "[bold white]5[/bold white]  Classement des équipes\n"
+            )
         menu_content += "[bold white]0[/bold white]  Retour"
 
         panel = Panel(
@@ -492,6 +799,174 @@ class TournamentView:
 
         return choice
 
+    @staticmethod
+    def corrections_menu(can_undo: bool, can_redo: bool) -> str:
+        """Menu de correction des résultats avec Rich"""
+        console.print()
+        undo_style = "bold white" if can_undo else "dim"
+        redo_style = "bold white" if can_redo else "dim"
+        menu_content = "[bold white]1[/bold white]  Corriger un résultat\n"
+        menu_content += (
+            f"[{undo_style}]2[/{undo_style}]  "
+            "Annuler la dernière correction\n"
+        )
+        menu_content += (
+            f"[{redo_style}]3[/{redo_style}]  Rétablir la correction\n"
+        )
+        menu_content += "[bold white]4[/bold white]  Voir le classement\n"
+        menu_content += (
+            "[bold white]5[/bold white]  Vérifier la cohérence du classement\n"
+        )
+        menu_content += "[bold white]0[/bold white]  Retour"
+
+        panel = Panel(
+            menu_content,
+            title="[bold magenta]Corrections[/bold magenta]",
+            border_style="magenta",
+            padding=(1, 2),
+        )
+        console.print(panel)
+        return Prompt.ask(
+            "[bold magenta]>[/bold magenta]",
+            default="",
+        ).strip()
+
+    @staticmethod
+    def prompt_round_number(rounds_played: int) -> int:
+        """Demande le numéro d'un round joué."""
+        return int(
+            Prompt.ask(
+                "[cyan]Round à corriger[/cyan]",
+                choices=[
+                    str(number) for number in range(1, rounds_played + 1)
+                ],
+                default=str(rounds_played),
+            )
+        )
+
+    @staticmethod
+    def prompt_board_number(boards: int) -> int:
+        """Demande le numéro d'un match du round."""
+        return int(
+            Prompt.ask(
+                "[cyan]Match à corriger[/cyan]",
+                choices=[str(number) for number in range(1, boards + 1)],
+            )
+        )
+
+    @staticmethod
+    def display_result_corrected(
+        round_num: int, board: int, first: int
+    ) -> None:
+        LoggerView.success(
+            f"Résultat du match {board} (round {round_num}) corrigé : "
+            f"classement recalculé à partir du round {first}."
+        )
+
+    @staticmethod
+    def display_history_step(action: str, first: int | None) -> None:
+        if first is None:
+            LoggerView.warning("Aucune correction à traiter.")
+        else:
+            LoggerView.success(
+                f"Correction {action} : classement recalculé à partir du "
+                f"round {first}."
+            )
+
+    @staticmethod
+    def display_drifts(drifts: list) -> None:
+        """Affiche les écarts du contrôle de cohérence."""
+        console.print()
+        if not drifts:
+            LoggerView.success(
+                "Classement cohérent avec les résultats des rounds."
+            )
+            return
+        table = Table(
+            title="[bold red]⚠ Écarts de classement[/bold red]",
+            show_header=True,
+            header_style="bold cyan",
+            border_style="red",
+        )
+        table.add_column("Joueur", style="cyan")
+        table.add_column("Valeur", style="white")
+        table.add_column("Stockée", justify="center", style="red")
+        table.add_column("Recalculée", justify="center", style="green")
+        for drift in drifts:
+            table.add_row(
+                drift.player_id,
+                drift.field,
+                f"{drift.stored:g}",
+                f"{drift.expected:g}",
+            )
+        console.print(table)
+
+    @staticmethod
+    def display_schedule(current: list[dict], upcoming: list[dict]) -> None:
+        """Afficher les rounds en cours et les prochains rounds planifiés"""
+        console.print()
+        for title, entries in (
+            ("⏱ En ce moment", current),
+            ("📅 Prochains rounds", upcoming),
+        ):
+            if not entries:
+                LoggerView.info(f"{title} : aucun round.")
+                continue
+            table = Table(
+                title=f"[bold cyan]{title}[/bold cyan]",
+                show_header=True,
+                header_style="bold cyan",
+                border_style="cyan",
+            )
+            table.add_column("Tournoi", style="cyan")
+            table.add_column("Round", justify="center")
+            table.add_column("Début", style="white")
+            table.add_column("Fin", style="white")
+            table.add_column("Pendule", justify="right", style="yellow")
+            for entry in entries:
+                clock = ""
+                if entry["live"]:
+                    clock = format_duration(entry["elapsed"])
+                    if entry["remaining"] is not None:
+                        clock += (
+                            f" (reste {format_duration(entry['remaining'])})"
+                        )
+                table.add_row(
+                    entry["tournament_id"],
+                    str(entry["round"]),
+                    format_timestamp(entry["start"]),
+                    format_timestamp(entry["end"]),
+                    clock,
+                )
+            console.print(table)
+
+    @staticmethod
+    def prompt_schedule_settings() -> dict:
+        """Demande les créneaux du planning (heures locales)"""
+        console.print("\n[bold green]📅 Planification des rounds[/bold green]")
+        return {
+            "first_start": Prompt.ask(
+                "[cyan]Premier créneau (YYYY-MM-DD HH:MM)[/cyan]"
+            ).strip(),
+            "duration": Prompt.ask(
+                "[cyan]Durée d'un round (minutes)[/cyan]", default="120"
+            ).strip(),
+            "interval": Prompt.ask(
+                "[cyan]Écart entre deux débuts de round (minutes)[/cyan]",
+                default="150",
+            ).strip(),
+            "per_day": Prompt.ask(
+                "[cyan]Rounds par jour[/cyan]", default="2"
+            ).strip(),
+            "days": Prompt.ask(
+                "[cyan]Nombre de jours[/cyan]", default="2"
+            ).strip(),
+            "capacity": Prompt.ask(
+                "[cyan]Sections par créneau (vide : sans limite)[/cyan]",
+                default="",
+            ).strip(),
+        }
+
     @staticmethod
     def confirm_action(message: str) -> bool:
         """Demander confirmation pour une action avec Rich"""